@@ -108,6 +108,9 @@ def run_commercial_reminders():
 
         print(f"\n{list_name}:")
         tasks = client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+        if tasks is None:
+            print(f"  Falha ao buscar tasks de {list_name}; lista pulada nesta execucao")
+            continue
 
         for task in tasks:
             task_id = task["id"]
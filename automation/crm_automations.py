@@ -64,6 +64,9 @@ def run_crm_automations():
         print(f"{'='*60}")
 
         tasks = client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+        if tasks is None:
+            print(f"  Falha ao buscar tasks de {list_name}; lista pulada nesta execucao")
+            continue
         print(f"  {len(tasks)} task(s) encontrada(s)")
 
         for task in tasks:
@@ -17,6 +17,9 @@ import os
 LIST_ID_CONTAS_PAGAR = os.environ.get("LIST_ID_CONTAS_PAGAR")
 SPACE_ID_GESTAO_ADM = os.environ.get("SPACE_ID_GESTAO_ADM")
 
+# Maior antecedência de alerta (dias antes do vencimento)
+JANELA_ALERTA_DIAS = 7
+
 
 def check_overdue_bills():
     """
@@ -36,19 +39,28 @@ def check_overdue_bills():
     print("=" * 70)
     print()
 
-    # Buscar todas as tasks de contas a pagar (não arquivadas)
+    # Só contas vencidas ou que vencem nos próximos 7 dias (filtro no servidor).
+    # days_until <= 7  <=>  vencimento antes de agora + 8 dias
+    vence_antes = datetime.now() + timedelta(days=JANELA_ALERTA_DIAS + 1)
+
     tasks = client.get_tasks(
         LIST_ID_CONTAS_PAGAR,
         paginate=True,
+        max_workers=8,  # Busca até 8 páginas em paralelo
         arquivada=False,
-        incluir_fechadas=False
+        incluir_fechadas=False,
+        vence_antes=vence_antes
     )
 
+    if tasks is None:
+        print("Falha ao buscar as contas a pagar; alertas não enviados nesta execução.")
+        return
+
     if not tasks:
-        print("Nenhuma conta a pagar encontrada.")
+        print("Nenhuma conta vencida ou vencendo nos próximos 7 dias.")
         return
 
-    print(f"Total de contas a pagar: {len(tasks)}")
+    print(f"Contas vencidas ou vencendo em até {JANELA_ALERTA_DIAS} dias: {len(tasks)}")
     print()
 
     alertas_enviados = {
@@ -58,6 +70,9 @@ def check_overdue_bills():
         "vencido": 0
     }
 
+    # As escritas são coletadas durante a avaliação e aplicadas em paralelo
+    batch = client.batch(max_workers=8)
+
     for task in tasks:
         task_id = task['id']
         task_name = task['name']
@@ -81,10 +96,10 @@ def check_overdue_bills():
             print(f"   Vence em 7 dias ({due.strftime('%d/%m/%Y')})")
 
             # Adicionar tag
-            client.add_tag(task_id, 'vencendo-em-breve')
+            batch.add_tag(task_id, 'vencendo-em-breve')
 
             # Comentário
-            client.post_task_comment(
+            batch.post_task_comment(
                 task_id,
                 "⚠️ **ATENÇÃO:** Esta conta vence em 7 dias!"
             )
@@ -98,17 +113,17 @@ def check_overdue_bills():
             print(f"   Vence em 3 dias ({due.strftime('%d/%m/%Y')})")
 
             # Adicionar tag
-            client.add_tag(task_id, 'urgente')
+            batch.add_tag(task_id, 'urgente')
 
             # Comentário mais enfático
-            client.post_task_comment(
+            batch.post_task_comment(
                 task_id,
                 "🔥 **URGENTE:** Esta conta vence em 3 dias!\n\n"
                 "Por favor, providencie o pagamento o quanto antes."
             )
 
             # Atualizar prioridade
-            client.update_task(task_id, priority=2)  # Alta
+            batch.update_task(task_id, priority=2)  # Alta
 
             alertas_enviados["3_dias"] += 1
             print()
@@ -119,10 +134,10 @@ def check_overdue_bills():
             print(f"   Vence AMANHÃ ({due.strftime('%d/%m/%Y')})")
 
             # Adicionar tag
-            client.add_tag(task_id, 'muito-urgente')
+            batch.add_tag(task_id, 'muito-urgente')
 
             # Comentário crítico
-            client.post_task_comment(
+            batch.post_task_comment(
                 task_id,
                 "🚨 **MUITO URGENTE:** Esta conta vence AMANHÃ!\n\n"
                 f"Data de vencimento: {due.strftime('%d/%m/%Y')}\n"
@@ -130,7 +145,7 @@ def check_overdue_bills():
             )
 
             # Prioridade urgente
-            client.update_task(task_id, priority=1)  # Urgente
+            batch.update_task(task_id, priority=1)  # Urgente
 
             alertas_enviados["1_dia"] += 1
             print()
@@ -142,13 +157,13 @@ def check_overdue_bills():
             print(f"   VENCIDO há {dias_atrasado} dia(s)")
 
             # Adicionar tag
-            client.add_tag(task_id, 'atrasado')
+            batch.add_tag(task_id, 'atrasado')
 
             # Prioridade urgente
-            client.update_task(task_id, priority=1)
+            batch.update_task(task_id, priority=1)
 
             # Comentário de atraso
-            client.post_task_comment(
+            batch.post_task_comment(
                 task_id,
                 f"🔴 **VENCIDO:** Esta conta está atrasada há {dias_atrasado} dia(s)!\n\n"
                 f"Data de vencimento: {due.strftime('%d/%m/%Y')}\n"
@@ -158,6 +173,14 @@ def check_overdue_bills():
             alertas_enviados["vencido"] += 1
             print()
 
+    print(f"Aplicando {len(batch)} alterações no ClickUp...")
+    batch.commit()
+
+    for falha in batch.failures:
+        print(f"❌ {falha.mutation.method} na task {falha.mutation.task_id}: {falha.error}")
+
+    print()
+
     # Resumo
     print("=" * 70)
     print("RESUMO DOS ALERTAS ENVIADOS")
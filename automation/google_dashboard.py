@@ -36,6 +36,14 @@ CF_VALOR_VENDA = "e65d7c12-1790-451e-866f-f7841c3aceb9"
 
 RISCO_LABELS = {0: "Baixo", 1: "Medio", 2: "Alto", 3: "Critico"}
 
+# Projeções: só as chaves usadas em cada aba ficam em memória
+PROJ_FIELDS = ["name", "status", "due_date", f"custom_fields.{CF_VALOR}",
+               f"custom_fields.{CF_ORCAMENTO}", f"custom_fields.{CF_VALOR_GASTO}",
+               f"custom_fields.{CF_RISCO}"]
+COM_FIELDS = ["name", "status", f"custom_fields.{CF_AGENDAMENTO}",
+              f"custom_fields.{CF_VALOR_VENDA}"]
+FIN_FIELDS = ["name", "status", "due_date", f"custom_fields.{CF_VALOR}"]
+
 
 def get_cf(task, field_id):
     for f in task.get("custom_fields", []):
@@ -81,6 +89,14 @@ def clear_and_write(service, sheet_name, headers, rows):
     print(f"  Aba '{sheet_name}': {len(rows)} linha(s) escritas")
 
 
+def write_tab(service, sheet_name, headers, rows, complete):
+    """Escreve a aba so se todas as listas vieram completas (senao mantem a anterior)."""
+    if not complete:
+        print(f"  Aba '{sheet_name}': falha ao buscar tasks; dados anteriores mantidos")
+        return
+    clear_and_write(service, sheet_name, headers, rows)
+
+
 def ensure_sheets_exist(service, sheet_names):
     """Cria abas que ainda nao existem."""
     meta = service.spreadsheets().get(spreadsheetId=SHEETS_ID).execute()
@@ -119,11 +135,16 @@ def run_google_dashboard():
     proj_headers = ["Nome", "Status", "Valor (R$)", "Orcamento (R$)", "Valor Gasto (R$)",
                     "Risco", "Prazo", "Dias ate Prazo", "Atualizado em"]
     proj_rows = []
+    proj_ok = True
 
     for list_id in [LIST_ID_PROJETOS_INTERNOS, LIST_ID_PROJETOS_EXTERNOS]:
         if not list_id:
             continue
-        tasks = client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+        tasks = client.get_tasks(list_id, paginate=True, fields=PROJ_FIELDS,
+                                 arquivada=False, incluir_fechadas=False)
+        if tasks is None:
+            proj_ok = False
+            break
         for t in tasks:
             valor = get_cf(t, CF_VALOR) or ""
             orcamento = get_cf(t, CF_ORCAMENTO) or ""
@@ -136,41 +157,49 @@ def run_google_dashboard():
             proj_rows.append([t["name"], status, valor, orcamento, valor_gasto,
                                risco, prazo, dias, today_str])
 
-    clear_and_write(service, "Projetos", proj_headers, proj_rows)
+    write_tab(service, "Projetos", proj_headers, proj_rows, proj_ok)
 
     # ===== ABA COMERCIAL =====
     print("\nBuscando Comercial...")
     com_headers = ["Nome / Lead", "Lista", "Status", "Agendamento", "Valor da Venda (R$)", "Atualizado em"]
     com_rows = []
+    com_ok = True
 
     for list_id, list_label in [(LIST_ID_AGENDA_COMERCIAL, "Agenda Comercial"),
                                  (LIST_ID_SESSAO_ESTRATEGICA, "Sessao Estrategica")]:
         if not list_id:
             continue
-        tasks = client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+        tasks = client.get_tasks(list_id, paginate=True, fields=COM_FIELDS,
+                                 arquivada=False, incluir_fechadas=False)
+        if tasks is None:
+            com_ok = False
+            break
         for t in tasks:
             agendamento = ts_to_date(get_cf(t, CF_AGENDAMENTO))
             valor_venda = get_cf(t, CF_VALOR_VENDA) or ""
             status = t.get("status", {}).get("status", "")
             com_rows.append([t["name"], list_label, status, agendamento, valor_venda, today_str])
 
-    clear_and_write(service, "Comercial", com_headers, com_rows)
+    write_tab(service, "Comercial", com_headers, com_rows, com_ok)
 
     # ===== ABA FINANCEIRO =====
     print("\nBuscando Financeiro...")
     fin_headers = ["Conta", "Valor (R$)", "Vencimento", "Dias ate Vencer", "Status", "Atualizado em"]
     fin_rows = []
+    fin_ok = True
 
     if LIST_ID_CONTAS_PAGAR:
-        tasks = client.get_tasks(LIST_ID_CONTAS_PAGAR, paginate=True, arquivada=False, incluir_fechadas=False)
-        for t in tasks:
+        tasks = client.get_tasks(LIST_ID_CONTAS_PAGAR, paginate=True, fields=FIN_FIELDS,
+                                 arquivada=False, incluir_fechadas=False)
+        fin_ok = tasks is not None
+        for t in tasks or []:
             valor = get_cf(t, CF_VALOR) or ""
             vencimento = ts_to_date(t.get("due_date"))
             dias = days_until(t.get("due_date"))
             status = t.get("status", {}).get("status", "")
             fin_rows.append([t["name"], valor, vencimento, dias, status, today_str])
 
-    clear_and_write(service, "Financeiro", fin_headers, fin_rows)
+    write_tab(service, "Financeiro", fin_headers, fin_rows, fin_ok)
 
     # ===== ABA RESUMO =====
     print("\nAtualizando Resumo...")
@@ -29,6 +29,37 @@ CUSTOM_FIELD_ORCAMENTO = "5123a4f6-b79c-49aa-b3a9-db260f56c31f"
 CUSTOM_FIELD_VALOR_GASTO = "61eb9626-42ca-4117-a87e-a2948800cfe1"
 CUSTOM_FIELD_RISCO = "fc82fac4-449b-4e2e-8c6d-0242f1084667"
 
+# PRJ-06/07/08 dependem de custom fields de TODOS os projetos abertos, entao a
+# busca nao pode ser limitada a uma janela de vencimento; em vez disso, so as
+# chaves usadas pelas regras ficam em memoria.
+PROJETO_FIELDS = [
+    "name", "status", "due_date", "tags",
+    f"custom_fields.{CUSTOM_FIELD_VALOR}",
+    f"custom_fields.{CUSTOM_FIELD_ORCAMENTO}",
+    f"custom_fields.{CUSTOM_FIELD_VALOR_GASTO}",
+    f"custom_fields.{CUSTOM_FIELD_RISCO}",
+]
+
+
+def fetch_open_projects(client, list_ids):
+    """
+    Tasks abertas das listas de projetos numa unica paginacao (team/{id}/task).
+
+    Retorna None se alguma pagina falhar (nunca uma lista parcial).
+    """
+    if client.team_id:
+        return client.query_tasks(list_ids=list_ids, fields=PROJETO_FIELDS, incluir_fechadas=False)
+
+    # Sem CLICKUP_TEAM_ID: uma paginacao por lista
+    tasks = []
+    for list_id in list_ids:
+        list_tasks = client.get_tasks(list_id, paginate=True, fields=PROJETO_FIELDS,
+                                      arquivada=False, incluir_fechadas=False)
+        if list_tasks is None:
+            return None
+        tasks.extend(list_tasks)
+    return tasks
+
 
 def run_project_alerts():
     client = KaloiClickUpClient()
@@ -42,21 +73,24 @@ def run_project_alerts():
     totais = {"7_dias": 0, "3_dias": 0, "1_dia": 0, "vencido": 0,
               "alto_valor": 0, "risco_alto": 0, "orcamento_excedido": 0}
 
+    list_ids = []
     for list_name, list_id in lists_to_check.items():
         if not list_id:
             print(f"Pulando {list_name}: LIST_ID nao configurado")
             continue
+        list_ids.append(list_id)
 
-        print(f"\n{'='*60}")
-        print(f"Verificando: {list_name}")
-        print(f"{'='*60}")
-
-        tasks = client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+    print(f"\n{'='*60}")
+    print(f"Verificando: {', '.join(n for n, i in lists_to_check.items() if i)}")
+    print(f"{'='*60}")
 
-        if not tasks:
-            print("  Nenhuma task encontrada.")
-            continue
+    tasks = fetch_open_projects(client, list_ids) if list_ids else []
 
+    if tasks is None:
+        print("  Falha ao buscar os projetos; alertas nao enviados nesta execucao")
+    elif not tasks:
+        print("  Nenhuma task encontrada.")
+    else:
         print(f"  {len(tasks)} task(s) encontrada(s)")
 
         for task in tasks:
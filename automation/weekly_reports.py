@@ -87,6 +87,9 @@ def generate_weekly_report():
 
     tasks = client.get_tasks(LIST_ID_CONTAS_PAGAR, paginate=True,
                              arquivada=False, incluir_fechadas=False)
+    if tasks is None:
+        print("\nFalha ao buscar as contas; relatorio nao gerado (planilha mantida)")
+        return
     print(f"\n{len(tasks)} conta(s) encontrada(s)")
 
     headers = ["Conta", "Valor (R$)", "Vencimento", "Dias ate Vencer",
@@ -25,6 +25,7 @@ Status reais confirmados via API (2025):
                     reunião/visita agendada | venda concluida | perdido/não qualificado
 """
 from src.clickup_api.client import KaloiClickUpClient
+from src.clickup_api.task_store import TaskStore
 from datetime import datetime
 import os
 import requests
@@ -42,6 +43,9 @@ CUSTOM_FIELD_VALOR = "2aca62aa-12c2-4911-8081-453926e59577"
 
 CLICKUP_TOKEN = os.environ.get("CLICKUP_API_TOKEN") or os.environ.get("CLICKUP_TOKEN")
 
+# Store local SQLite (opcional): com ele, cada execução baixa só o que mudou
+TASK_STORE_PATH = os.environ.get("KALOI_TASK_STORE")
+
 
 def get_checklist_progress(task):
     """Retorna progresso geral de todos os checklists (0-100)."""
@@ -84,8 +88,23 @@ def set_task_priority_direct(task_id, priority):
     )
 
 
+def load_open_tasks(client, list_id):
+    """
+    Tasks abertas e não arquivadas da lista (via store local se configurado).
+
+    Retorna None se a busca falhar (página com erro, circuito aberto): a
+    lista é pulada nesta execução em vez de agir sobre dados incompletos.
+    """
+    if client.task_store is not None:
+        if client.sync_list(list_id) is None:
+            return None
+        return client.task_store.get_tasks(list_id, include_closed=False)
+    return client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+
+
 def run_workflow_automations():
-    client = KaloiClickUpClient()
+    task_store = TaskStore(TASK_STORE_PATH) if TASK_STORE_PATH else None
+    client = KaloiClickUpClient(task_store=task_store)
 
     totais = {
         "prj01": 0, "prj02": 0, "prj03": 0,
@@ -108,7 +127,10 @@ def run_workflow_automations():
         print(f"Verificando projetos: {list_name}")
         print(f"{'='*60}")
 
-        tasks = client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+        tasks = load_open_tasks(client, list_id)
+        if tasks is None:
+            print(f"  Falha ao buscar tasks de {list_name}; lista pulada nesta execução")
+            continue
 
         for task in tasks:
             task_id = task["id"]
@@ -258,7 +280,10 @@ def run_workflow_automations():
         print(f"Verificando comercial: {list_name}")
         print(f"{'='*60}")
 
-        tasks = client.get_tasks(list_id, paginate=True, arquivada=False, incluir_fechadas=False)
+        tasks = load_open_tasks(client, list_id)
+        if tasks is None:
+            print(f"  Falha ao buscar tasks de {list_name}; lista pulada nesta execução")
+            continue
 
         for task in tasks:
             task_id = task["id"]
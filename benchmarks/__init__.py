@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks dos hot paths do KaloiClickUpClient e dos helpers.
+
+Rodam contra um transport em memória (StubTransportAdapter) com o
+workspace sintético do emulador, sem rede e sem tocar no ClickUp:
+
+- Paginação: tasks/s de _get_all_paginated (sequencial, paralela, compact, stream)
+- Mutações: mutations/s de add_tag/post_task_comment/update_task (direto e MutationBatch)
+- Helpers: µs/op de translate_params, fuzzy_time_to_unix, get_field_value
+  e das agregações de time_tracking
+
+Uso:
+    python -m benchmarks run                                  # mostra resultados
+    python -m benchmarks run --output benchmarks/baselines/baseline.json
+    python -m benchmarks compare benchmarks/baselines/baseline.json --threshold 0.2
+"""
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+CLI dos benchmarks.
+
+    python -m benchmarks run [--output arquivo.json] [--only nome] [--quick]
+    python -m benchmarks compare baseline.json [atual.json] [--threshold 0.2]
+    python -m benchmarks imports
+
+`imports` verifica o orçamento de import a frio do cliente e se as
+dependências pesadas (dateparser, rich, ijson) continuam preguiçosas.
+
+`compare` sem o segundo arquivo roda os benchmarks agora. Sai com código 1
+se algum benchmark piorou além do threshold.
+"""
+
+import argparse
+import sys
+
+from . import bench_client, bench_helpers, bench_import  # noqa: F401 (registram os benchmarks)
+from .harness import compare_results, load_results, run_benchmarks, save_results
+
+
+def _run(args):
+    min_time = 0.05 if args.quick else args.min_time
+    repeat = 1 if args.quick else args.repeat
+    print(f"Rodando benchmarks (melhor de {repeat}, >= {min_time}s cada)...")
+    return run_benchmarks(only=args.only, repeat=repeat, min_time=min_time)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Roda os benchmarks")
+    compare = commands.add_parser("compare", help="Compara com um baseline JSON")
+    compare.add_argument("baseline", help="Baseline JSON de referência")
+    compare.add_argument("current", nargs="?", help="Resultados JSON atuais (padrão: rodar agora)")
+    compare.add_argument("--threshold", type=float, default=0.2,
+                         help="Piora relativa tolerada (padrão: 0.2 = 20%%)")
+    commands.add_parser("imports", help="Verifica o orçamento de import a frio")
+
+    for command in (run, compare):
+        command.add_argument("--output", help="Grava os resultados neste JSON")
+        command.add_argument("--only", help="Roda só benchmarks cujo nome contém este texto")
+        command.add_argument("--repeat", type=int, default=3, help="Rodadas por benchmark")
+        command.add_argument("--min-time", type=float, default=0.2, help="Segundos por rodada")
+        command.add_argument("--quick", action="store_true", help="Uma rodada curta (smoke test)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "imports":
+        print(f"Import a frio (melhor de {bench_import.IMPORT_RUNS}):")
+        violations = bench_import.check_import_budgets()
+        if violations:
+            print(f"\n✗ Orçamento de import violado: {'; '.join(violations)}")
+            return 1
+        print("\n✓ Import dentro do orçamento")
+        return 0
+
+    if args.command == "compare" and args.current:
+        results = list(load_results(args.current).values())
+    else:
+        results = _run(args)
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"Resultados gravados em {args.output}")
+
+    if args.command == "compare":
+        print(f"\nComparação com {args.baseline} (threshold {args.threshold:.0%}):")
+        baseline = load_results(args.baseline)
+        if args.only:
+            baseline = {name: result for name, result in baseline.items() if args.only in name}
+        regressions = compare_results(baseline, {r.name: r for r in results}, args.threshold)
+
+        if regressions:
+            print(f"\n✗ {len(regressions)} regressão(ões): {', '.join(regressions)}")
+            return 1
+        print("\n✓ Nenhuma regressão")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks do cliente: paginação (tasks/s) e mutações (mutations/s).
+"""
+
+from functools import lru_cache
+from itertools import cycle
+
+from src.clickup_api.batch import MutationBatch
+from src.clickup_api.client import KaloiClickUpClient
+from src.clickup_api.emulator import WorkspaceState
+
+from .harness import benchmark, measure
+from .stub_transport import make_stub_client
+
+
+PAGINATION_TASKS = 5000
+MUTATION_TASKS = 500
+BATCH_SIZE = 200
+
+# Latência simulada nos cenários em que importa sobrepor requisições
+LATENCY = 0.002
+
+
+@lru_cache(maxsize=None)
+def _pagination_state() -> WorkspaceState:
+    return WorkspaceState(spaces=1, folders_per_space=1, lists_per_folder=1,
+                          tasks_per_list=PAGINATION_TASKS)
+
+
+def _paginate(min_time: float, latency: float = 0.0, max_workers: int = 1, **kwargs):
+    state = _pagination_state()
+    client = make_stub_client(state, latency=latency)
+    endpoint = f"list/{next(iter(state.lists))}/task"
+
+    def fetch():
+        items = client._get_all_paginated(endpoint, "tasks", max_workers=max_workers,
+                                          include_closed="true", **kwargs)
+        assert len(items) == PAGINATION_TASKS, len(items)
+
+    return measure(fetch, PAGINATION_TASKS, min_time)
+
+
+@benchmark("pagination.sequential", "tasks/s")
+def bench_pagination_sequential(min_time):
+    return _paginate(min_time)
+
+
+@benchmark("pagination.compact", "tasks/s")
+def bench_pagination_compact(min_time):
+    return _paginate(min_time, transform=KaloiClickUpClient._build_transform(compact=True))
+
+
+@benchmark("pagination.stream", "tasks/s")
+def bench_pagination_stream(min_time):
+    return _paginate(min_time, stream=True)
+
+
+@benchmark("pagination.sequential_latency_2ms", "tasks/s")
+def bench_pagination_sequential_latency(min_time):
+    return _paginate(min_time, latency=LATENCY)
+
+
+@benchmark("pagination.parallel_8_latency_2ms", "tasks/s")
+def bench_pagination_parallel_latency(min_time):
+    return _paginate(min_time, latency=LATENCY, max_workers=8)
+
+
+def _mutation_client(latency: float = 0.0):
+    state = WorkspaceState(spaces=1, folders_per_space=1, lists_per_folder=1,
+                           tasks_per_list=MUTATION_TASKS)
+    return make_stub_client(state, latency=latency), list(state.tasks)
+
+
+def _direct_mutations(min_time: float, latency: float = 0.0):
+    client, task_ids = _mutation_client(latency)
+    operations = cycle([
+        lambda task_id: client.add_tag(task_id, "benchmark"),
+        lambda task_id: client.post_task_comment(task_id, "benchmark"),
+        lambda task_id: client.update_task(task_id, priority=2),
+    ])
+    targets = cycle(task_ids)
+
+    def mutate():
+        assert next(operations)(next(targets))
+
+    return measure(mutate, 1, min_time)
+
+
+@benchmark("mutations.direct", "mutations/s")
+def bench_mutations_direct(min_time):
+    return _direct_mutations(min_time)
+
+
+@benchmark("mutations.direct_latency_2ms", "mutations/s")
+def bench_mutations_direct_latency(min_time):
+    return _direct_mutations(min_time, latency=LATENCY)
+
+
+@benchmark("mutations.batch_8_latency_2ms", "mutations/s")
+def bench_mutations_batch_latency(min_time):
+    client, task_ids = _mutation_client(LATENCY)
+
+    def commit():
+        batch = MutationBatch(client, max_workers=8)
+        for task_id in task_ids[:BATCH_SIZE // 2]:
+            batch.add_tag(task_id, "benchmark")
+            batch.post_task_comment(task_id, "benchmark")
+        results = batch.commit()
+        assert all(result.ok for result in results)
+
+    return measure(commit, BATCH_SIZE, min_time)
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks dos helpers (µs/op): tradução de parâmetros, datas fuzzy,
+custom fields e agregações de time tracking.
+"""
+
+import importlib.util
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+from src.clickup_api.helpers.date_utils import (
+    clear_date_cache, fuzzy_time_to_seconds, fuzzy_time_to_unix, parse_date, parse_dates,
+)
+from src.clickup_api.helpers.translation import translate_params
+
+from .harness import benchmark, measure
+
+
+DKBOT_HELPERS = os.path.join(os.path.dirname(__file__), "..", "dkbot-client", "src", "dkbot", "helpers")
+
+
+def load_dkbot_helper(name: str):
+    """
+    Importa um módulo de dkbot-client/src/dkbot/helpers pelo caminho do arquivo.
+
+    O pacote dkbot importa um .client que não existe neste repositório,
+    então `import dkbot.helpers` falha; os helpers em si são independentes.
+    """
+    module_name = f"dkbot_helpers_{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(DKBOT_HELPERS, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+custom_fields = load_dkbot_helper("custom_fields")
+time_tracking = load_dkbot_helper("time_tracking")
+
+
+# ================== DADOS ==================
+
+PARAMS_PT = {
+    "nome": "Relatório mensal",
+    "descricao": "Fechamento do mês",
+    "status": "em progresso",
+    "prioridade": "alta",
+    "responsaveis": [1, 2],
+    "tags": ["financeiro"],
+    "incluir_fechadas": True,
+    "pagina": 0,
+}
+
+FUZZY_DATES = [
+    "amanhã", "hoje", "ontem", "próxima segunda", "próxima sexta",
+    "2025-12-31", "31/12/2025", "in 3 days", "tomorrow", "next monday",
+    "1735689600000",
+]
+
+FUZZY_DURATIONS = ["2 horas", "30 minutos", "2 horas e 30 minutos", "1 hora", "1 day", "3600"]
+
+CUSTOM_FIELDS = [
+    {"type": "short_text", "value": "texto"},
+    {"type": "number", "value": "42"},
+    {"type": "number", "value": "3.14"},
+    {"type": "currency", "value": "150000"},
+    {"type": "checkbox", "value": True},
+    {"type": "date", "value": "1735689600000"},
+    {"type": "drop_down", "value": 2, "type_config": {"options": [
+        {"id": f"opt-{i}", "orderindex": i, "name": f"Opção {i}"} for i in range(6)]}},
+    {"type": "labels", "value": ["lbl-1", "lbl-3"], "type_config": {"options": [
+        {"id": f"lbl-{i}", "label": f"Label {i}"} for i in range(6)]}},
+    {"type": "users", "value": [{"id": 1}, {"id": 2}]},
+    {"type": "manual_progress", "value": {"percent_complete": 40}},
+]
+
+TIME_ENTRIES_COUNT = 5000
+
+# Coluna de vencimentos de uma planilha de contas a pagar
+BILL_DATES_COUNT = 10000
+
+
+def _bill_dates():
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    rows = []
+    for _ in range(BILL_DATES_COUNT):
+        due = start + timedelta(days=rng.randrange(365))
+        rows.append(rng.choice([
+            due.strftime("%d/%m/%Y"),
+            due.strftime("%Y-%m-%d"),
+            str(int(due.timestamp())),
+            rng.choice(["amanhã", "próxima sexta", "hoje"]),
+        ]))
+    return rows
+WEEK_START = datetime(2025, 1, 6)
+
+
+def _time_entries():
+    rng = random.Random(42)
+    start = WEEK_START.timestamp() * 1000
+    return [
+        {
+            "id": str(i),
+            "task": {"id": f"t{rng.randrange(200)}", "name": "Task"},
+            "user": {"id": rng.randrange(1, 10), "username": "Usuário"},
+            "billable": rng.random() < 0.6,
+            "start": str(int(start + rng.randrange(7 * 24 * 3600) * 1000)),
+            "duration": str(rng.randrange(60, 4 * 3600) * 1000),
+            "tags": [{"name": t} for t in rng.sample(["dev", "reunião", "suporte"], rng.randrange(2))],
+        }
+        for i in range(TIME_ENTRIES_COUNT)
+    ]
+
+
+TIME_ENTRIES = _time_entries()
+BILL_DATES = _bill_dates()
+
+
+# ================== BENCHMARKS ==================
+
+@benchmark("helpers.translate_params", "µs/op")
+def bench_translate_params(min_time):
+    return measure(lambda: translate_params(PARAMS_PT), 1, min_time)
+
+
+@benchmark("helpers.fuzzy_time_to_unix", "µs/op")
+def bench_fuzzy_time_to_unix(min_time):
+    return measure(lambda: [fuzzy_time_to_unix(text) for text in FUZZY_DATES],
+                   len(FUZZY_DATES), min_time)
+
+
+@benchmark("helpers.fuzzy_time_to_unix.cold", "µs/op")
+def bench_fuzzy_time_to_unix_cold(min_time):
+    def parse_cold():
+        clear_date_cache()  # mede o parsing em si, sem o memo
+        for text in FUZZY_DATES:
+            fuzzy_time_to_unix(text)
+
+    return measure(parse_cold, len(FUZZY_DATES), min_time)
+
+
+@benchmark("helpers.fuzzy_time_to_seconds", "µs/op")
+def bench_fuzzy_time_to_seconds(min_time):
+    return measure(lambda: [fuzzy_time_to_seconds(text) for text in FUZZY_DURATIONS],
+                   len(FUZZY_DURATIONS), min_time)
+
+
+@benchmark("helpers.parse_date", "µs/op")
+def bench_parse_date(min_time):
+    return measure(lambda: [parse_date(text) for text in FUZZY_DATES],
+                   len(FUZZY_DATES), min_time)
+
+
+@benchmark(f"helpers.parse_date.loop[{BILL_DATES_COUNT}]", "µs/op")
+def bench_parse_date_loop(min_time):
+    def parse_rows():
+        clear_date_cache()
+        for text in BILL_DATES:
+            parse_date(text)
+
+    return measure(parse_rows, len(BILL_DATES), min_time)
+
+
+@benchmark(f"helpers.parse_dates[{BILL_DATES_COUNT}]", "µs/op")
+def bench_parse_dates(min_time):
+    def parse_batch():
+        clear_date_cache()
+        parse_dates(BILL_DATES)
+
+    return measure(parse_batch, len(BILL_DATES), min_time)
+
+
+@benchmark("helpers.get_field_value", "µs/op")
+def bench_get_field_value(min_time):
+    return measure(lambda: [custom_fields.get_field_value(field) for field in CUSTOM_FIELDS],
+                   len(CUSTOM_FIELDS), min_time)
+
+
+@benchmark(f"time_tracking.calculate_time_per_task[{TIME_ENTRIES_COUNT}]", "µs/op")
+def bench_time_per_task(min_time):
+    return measure(lambda: time_tracking.calculate_time_per_task(TIME_ENTRIES), 1, min_time)
+
+
+@benchmark(f"time_tracking.calculate_time_per_user[{TIME_ENTRIES_COUNT}]", "µs/op")
+def bench_time_per_user(min_time):
+    return measure(lambda: time_tracking.calculate_time_per_user(TIME_ENTRIES), 1, min_time)
+
+
+@benchmark(f"time_tracking.group_by_date[{TIME_ENTRIES_COUNT}]", "µs/op")
+def bench_group_by_date(min_time):
+    return measure(lambda: time_tracking.group_by_date(TIME_ENTRIES), 1, min_time)
+
+
+@benchmark(f"time_tracking.generate_weekly_report[{TIME_ENTRIES_COUNT}]", "µs/op")
+def bench_weekly_report(min_time):
+    return measure(lambda: time_tracking.generate_weekly_report(TIME_ENTRIES, WEEK_START), 1, min_time)
+
+
+@benchmark(f"time_tracking.filter_by_date_range[{TIME_ENTRIES_COUNT}]", "µs/op")
+def bench_filter_by_date_range(min_time):
+    end = WEEK_START + timedelta(days=3)
+    return measure(lambda: time_tracking.filter_by_date_range(TIME_ENTRIES, WEEK_START, end), 1, min_time)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Tempo de import a frio (interpretador novo, como cada job do GitHub Actions)
+e orçamento de cold-start do cliente.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+from .harness import benchmark
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Orçamento do import a frio de cada módulo, em ms
+IMPORT_BUDGETS_MS = {
+    "src.clickup_api.client": 250,
+}
+
+# Dependências pesadas que só podem carregar no primeiro uso
+LAZY_MODULES = ("dateparser", "rich", "ijson")
+
+IMPORT_RUNS = 5
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def cold_import(module: str) -> Tuple[float, List[str]]:
+    """
+    Importa `module` num interpretador novo.
+
+    Returns:
+        (segundos do import, módulos carregados no processo)
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["seconds"], result["modules"]
+
+
+def check_import_budgets(runs: int = IMPORT_RUNS) -> List[str]:
+    """
+    Verifica o orçamento de import e os módulos que devem ser preguiçosos.
+
+    Vale o melhor de `runs` imports (o primeiro aquece o cache de disco).
+
+    Returns:
+        Lista de violações (vazia se tudo dentro do orçamento)
+    """
+    violations = []
+
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        samples = [cold_import(module) for _ in range(runs)]
+        best_ms = min(seconds for seconds, _ in samples) * 1000
+        loaded = samples[-1][1]
+
+        eager = [name for name in LAZY_MODULES if name in loaded]
+        status = "✓" if best_ms <= budget_ms and not eager else "✗"
+        print(f"  {status} import {module}: {best_ms:.0f} ms (orçamento {budget_ms} ms)")
+
+        if best_ms > budget_ms:
+            violations.append(f"{module}: {best_ms:.0f} ms > {budget_ms} ms")
+        for name in eager:
+            print(f"    ✗ {name} carregado no import (deveria ser preguiçoso)")
+            violations.append(f"{module}: importa {name}")
+
+    return violations
+
+
+@benchmark("import.src.clickup_api.client", "ms/import")
+def bench_import_client(min_time):
+    cold_import("src.clickup_api.client")  # aquece o cache de disco
+    total, runs = 0.0, 0
+    while total < min_time or runs < 3:
+        seconds, _ = cold_import("src.clickup_api.client")
+        total += seconds
+        runs += 1
+    return runs, total
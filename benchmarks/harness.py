@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Registro, medição, baselines JSON e comparação dos benchmarks.
+"""
+
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Unidades em que maior é melhor (o resto, ex: µs/op, menor é melhor)
+THROUGHPUT_UNITS = ("tasks/s", "mutations/s", "ops/s")
+
+# Escala das unidades de tempo por operação (segundos -> unidade)
+TIME_SCALES = {"µs": 1e6, "ms": 1e3}
+
+BENCHMARKS: Dict[str, Tuple[Callable[[float], Tuple[int, float]], str]] = {}
+
+
+@dataclass
+class BenchResult:
+    """Resultado de um benchmark (melhor de `repeat` rodadas)."""
+    name: str
+    unit: str
+    value: float
+    ops: int
+    seconds: float
+
+    @property
+    def higher_is_better(self) -> bool:
+        return self.unit in THROUGHPUT_UNITS
+
+
+def benchmark(name: str, unit: str):
+    """
+    Registra um benchmark.
+
+    A função recebe `min_time` (segundos mínimos de medição) e retorna
+    (operações, segundos) da rodada.
+
+    Exemplo:
+        @benchmark("helpers.translate_params", "µs/op")
+        def bench_translate(min_time):
+            return measure(lambda: translate_params(PARAMS), 1, min_time)
+    """
+    def register(func):
+        BENCHMARKS[name] = (func, unit)
+        return func
+    return register
+
+
+def measure(func: Callable[[], object], ops_per_call: int, min_time: float) -> Tuple[int, float]:
+    """
+    Chama func() em lotes crescentes até acumular `min_time` segundos.
+
+    Uma chamada de aquecimento (imports preguiçosos, caches) fica fora da medição.
+
+    Returns:
+        (operações executadas, segundos)
+    """
+    func()
+    calls, elapsed, batch = 0, 0.0, 1
+
+    while elapsed < min_time:
+        started = time.perf_counter()
+        for _ in range(batch):
+            func()
+        elapsed += time.perf_counter() - started
+        calls += batch
+        batch *= 2
+
+    return calls * ops_per_call, elapsed
+
+
+def run_benchmarks(
+    only: Optional[str] = None,
+    repeat: int = 3,
+    min_time: float = 0.2
+) -> List[BenchResult]:
+    """
+    Executa os benchmarks registrados e guarda a melhor rodada de cada um.
+
+    Args:
+        only: Roda só os benchmarks cujo nome contém este texto
+        repeat: Rodadas por benchmark (vale a melhor)
+        min_time: Segundos mínimos de medição por rodada
+
+    Returns:
+        Lista de BenchResult na ordem de registro
+    """
+    results = []
+
+    for name, (func, unit) in BENCHMARKS.items():
+        if only and only not in name:
+            continue
+
+        best = None
+        for _ in range(repeat):
+            ops, seconds = func(min_time)
+            if unit in THROUGHPUT_UNITS:
+                value = ops / seconds
+            else:
+                value = seconds / ops * TIME_SCALES[unit.split("/")[0]]
+            result = BenchResult(name, unit, value, ops, seconds)
+            if best is None or (value > best.value if result.higher_is_better else value < best.value):
+                best = result
+
+        results.append(best)
+        print(f"  {name:<48} {best.value:>14,.2f} {unit}")
+
+    return results
+
+
+def save_results(results: List[BenchResult], path: str):
+    """Grava os resultados num baseline JSON (com metadados da máquina)."""
+    data = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {r.name: asdict(r) for r in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def load_results(path: str) -> Dict[str, BenchResult]:
+    """Lê um baseline JSON gravado por save_results."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: BenchResult(**result) for name, result in data["results"].items()}
+
+
+def compare_results(
+    baseline: Dict[str, BenchResult],
+    current: Dict[str, BenchResult],
+    threshold: float = 0.2
+) -> List[str]:
+    """
+    Compara resultados com o baseline e imprime a variação de cada benchmark.
+
+    Args:
+        baseline: Resultados de referência
+        current: Resultados atuais
+        threshold: Piora relativa tolerada (0.2 = 20%)
+
+    Returns:
+        Nomes dos benchmarks que pioraram além do threshold
+    """
+    regressions = []
+
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None or not base.value:
+            print(f"  {name:<48} {result.value:>14,.2f} {result.unit}   (novo)")
+            continue
+
+        change = (result.value - base.value) / base.value
+        worse = -change if result.higher_is_better else change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSÃO"
+            regressions.append(name)
+        elif worse < -threshold:
+            flag = "  melhorou"
+
+        print(f"  {name:<48} {base.value:>14,.2f} -> {result.value:>14,.2f} {result.unit} "
+              f"({change:+.1%}){flag}")
+
+    for name in baseline.keys() - current.keys():
+        print(f"  {name:<48} (ausente nos resultados atuais)")
+
+    return regressions
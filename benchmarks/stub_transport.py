@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Transport em memória para benchmarks: responde às requisições da session
+com o workspace sintético do emulador, sem sockets nem threads de servidor.
+"""
+
+import io
+import json
+import time
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.clickup_api.client import KaloiClickUpClient
+from src.clickup_api.emulator import API_PREFIX, WorkspaceState, dispatch
+from src.clickup_api.rate_limit import RateLimiter
+
+
+STUB_BASE_URL = "http://clickup.stub" + API_PREFIX
+
+
+class StubTransportAdapter(BaseAdapter):
+    """
+    Adapter do requests que despacha direto para o WorkspaceState.
+
+    Exemplo de uso:
+        session.mount("http://clickup.stub/", StubTransportAdapter(WorkspaceState()))
+    """
+
+    def __init__(self, state: WorkspaceState, latency: float = 0.0):
+        """
+        Args:
+            state: Workspace emulado que responde às requisições
+            latency: Atraso simulado por requisição, em segundos
+        """
+        super().__init__()
+        self.state = state
+        self.latency = latency
+        self.requests = 0
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlsplit(request.url)
+        raw_body = request.body or b""
+        if hasattr(raw_body, "read"):
+            raw_body = raw_body.read()
+        if isinstance(raw_body, str):
+            raw_body = raw_body.encode("utf-8")
+
+        body = None
+        if raw_body and "json" in (request.headers.get("Content-Type") or ""):
+            body = json.loads(raw_body)
+
+        status, payload = dispatch(
+            self.state,
+            request.method,
+            url.path[len(API_PREFIX) + 1:].strip("/"),
+            parse_qs(url.query),
+            body,
+            raw_body,
+            request.headers,
+        )
+
+        if isinstance(payload, bytes):
+            content, content_type = payload, "application/octet-stream"
+        else:
+            content, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+
+        response = Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({"Content-Type": content_type,
+                                                "Content-Length": str(len(content))})
+        response.raw = io.BytesIO(content)
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        response.reason = "OK" if status < 400 else "Error"
+        return response
+
+    def close(self):
+        pass
+
+
+def make_stub_client(
+    state: Optional[WorkspaceState] = None,
+    latency: float = 0.0,
+    **client_kwargs
+) -> KaloiClickUpClient:
+    """
+    Cria um cliente ligado ao transport em memória.
+
+    Sem rate limit efetivo, cache, circuit breaker ou output, para medir só
+    o caminho da requisição e da decodificação.
+
+    Args:
+        state: Workspace emulado (padrão: WorkspaceState())
+        latency: Atraso simulado por requisição, em segundos
+        **client_kwargs: Repassados ao KaloiClickUpClient
+
+    Returns:
+        KaloiClickUpClient com client.stub_adapter = StubTransportAdapter
+    """
+    options = {
+        "rate_limiter": RateLimiter(requests_per_minute=10**9),
+        "cache": False,
+        "output": "null",
+        "circuit_breaker": False,
+        "retry_budget": False,
+    }
+    options.update(client_kwargs)
+
+    client = KaloiClickUpClient(**options)
+    client.stub_adapter = StubTransportAdapter(state or WorkspaceState(), latency=latency)
+    client.session.mount(STUB_BASE_URL.rsplit(API_PREFIX, 1)[0] + "/", client.stub_adapter)
+    client.base_url = STUB_BASE_URL
+    client.team_id = client.stub_adapter.state.team_id
+    return client
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Cliente assíncrono (asyncio) do Sistema Kaloi para a API v2 do ClickUp.
+
+Espelha todos os métodos públicos do KaloiClickUpClient como corrotinas,
+executando as chamadas HTTP em um pool de threads com limite de
+requisições simultâneas (in-flight). Assim os scripts de automação podem
+disparar mutações independentes (tags, comentários, updates) em paralelo
+sem dependências extras além do `requests`.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+from src.clickup_api.client import KaloiClickUpClient
+
+
+class AsyncKaloiClickUpClient:
+    """
+    Versão asyncio do KaloiClickUpClient com concorrência limitada.
+
+    Todos os métodos públicos do cliente síncrono (get_tasks, add_tag,
+    post_task_comment, update_task, set_custom_field, ...) estão
+    disponíveis com a mesma assinatura, mas retornam corrotinas.
+
+    Args:
+        client: Cliente síncrono a reutilizar (cria um novo se omitido)
+        max_concurrency: Máximo de requisições em andamento ao mesmo tempo
+
+    Exemplo de uso:
+        async def main():
+            async with AsyncKaloiClickUpClient(max_concurrency=10) as client:
+                tasks = await client.get_tasks("list_id", paginate=True)
+                await client.gather(
+                    client.add_tag(t["id"], "revisar") for t in tasks
+                )
+
+        asyncio.run(main())
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        client: Optional[KaloiClickUpClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser >= 1")
+
+        # Pool com pelo menos uma conexão keep-alive por requisição em andamento
+        self.client = client or KaloiClickUpClient(
+            pool_maxsize=max(max_concurrency, KaloiClickUpClient.DEFAULT_POOL_MAXSIZE)
+        )
+        self.max_concurrency = max_concurrency
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="kaloi-clickup"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Cria o semáforo no event loop em execução (lazy)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Executa um método síncrono no pool respeitando o limite in-flight.
+
+        Args:
+            func: Método do cliente síncrono
+            *args, **kwargs: Argumentos repassados ao método
+
+        Returns:
+            O mesmo retorno do método síncrono
+        """
+        loop = asyncio.get_running_loop()
+
+        async with self._get_semaphore():
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs)
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Expõe os métodos públicos do cliente síncrono como corrotinas.
+
+        Atributos que não são métodos (token, team_id, base_url...) são
+        retornados como estão.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        attr = getattr(self.client, name)
+
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._call(attr, *args, **kwargs)
+
+        return method
+
+    async def gather(
+        self,
+        calls: Iterable[Awaitable[Any]],
+        return_exceptions: bool = True
+    ) -> List[Any]:
+        """
+        Executa várias chamadas em paralelo e retorna os resultados em ordem.
+
+        A concorrência real continua limitada por max_concurrency.
+
+        Args:
+            calls: Corrotinas (ex: client.add_tag(...) para cada task)
+            return_exceptions: Se True, exceções entram na lista de resultados
+
+        Returns:
+            Lista de resultados na mesma ordem das chamadas
+
+        Example:
+            >>> results = await client.gather(
+            ...     client.post_task_comment(tid, "Revisar") for tid in task_ids
+            ... )
+        """
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    def close(self):
+        """Finaliza o pool de threads, o transport e a session HTTP."""
+        self._executor.shutdown(wait=True)
+        self.client.transport.close()
+        self.client.session.close()
+
+    async def aclose(self):
+        """Versão assíncrona de close()."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def __aenter__(self) -> "AsyncKaloiClickUpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+# Alias para compatibilidade
+AsyncClickUpClient = AsyncKaloiClickUpClient
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Upload de anexos em streaming.
+
+Com `files=` o requests monta o corpo multipart inteiro em memória antes
+de enviar. O MultipartFileBody expõe o mesmo corpo como um objeto tipo
+arquivo (read/tell/seek/__len__): o arquivo é lido do disco em blocos
+durante o envio, o Content-Length é conhecido de antemão (sem chunked
+encoding) e o corpo pode ser rebobinado pelo retry do urllib3.
+"""
+
+import mimetypes
+import os
+import uuid
+from typing import Optional
+
+
+class MultipartFileBody:
+    """
+    Corpo multipart/form-data com um único arquivo, lido sob demanda.
+
+    Exemplo de uso:
+        with MultipartFileBody("attachment", "/tmp/nota.pdf") as body:
+            session.post(url, data=body, headers={"Content-Type": body.content_type})
+    """
+
+    def __init__(self, field_name: str, file_path: str, filename: Optional[str] = None):
+        """
+        Args:
+            field_name: Nome do campo do formulário (ex: "attachment")
+            file_path: Caminho do arquivo local
+            filename: Nome enviado ao servidor (padrão: nome do arquivo)
+        """
+        self.file_path = file_path
+        self.filename = filename or os.path.basename(file_path)
+        self.boundary = uuid.uuid4().hex
+
+        mime_type = mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        quoted = self.filename.replace("\\", "\\\\").replace('"', '\\"')
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{quoted}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+        self.file_size = os.path.getsize(file_path)
+        self._length = len(self._head) + self.file_size + len(self._tail)
+        self._file = open(file_path, "rb")
+        self._pos = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += self._length
+
+        self._pos = min(max(offset, 0), self._length)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._pos
+
+        parts = []
+        head_end = len(self._head)
+        file_end = head_end + self.file_size
+
+        while size > 0 and self._pos < self._length:
+            if self._pos < head_end:
+                data = self._head[self._pos:self._pos + size]
+            elif self._pos < file_end:
+                self._file.seek(self._pos - head_end)
+                data = self._file.read(min(size, file_end - self._pos))
+                if not data:  # arquivo encolheu durante o envio
+                    raise IOError(f"Arquivo alterado durante o upload: {self.file_path}")
+            else:
+                offset = self._pos - file_end
+                data = self._tail[offset:offset + size]
+
+            parts.append(data)
+            self._pos += len(data)
+            size -= len(data)
+
+        return b"".join(parts)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "MultipartFileBody":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Fila de mutações (unit of work) para o KaloiClickUpClient.
+
+Os scripts de automação avaliam milhares de tasks e, para cada uma,
+chamam add_tag / post_task_comment / update_task em sequência. Com o
+MutationBatch essas escritas são apenas registradas durante a avaliação e
+aplicadas no commit, em paralelo e respeitando o rate limiter do cliente.
+
+As operações de uma MESMA task são executadas na ordem em que foram
+registradas; tasks diferentes são processadas concorrentemente.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Mutation:
+    """Uma escrita pendente: método do cliente + argumentos."""
+
+    method: str
+    task_id: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MutationResult:
+    """Resultado da aplicação de uma Mutation."""
+
+    mutation: Mutation
+    ok: bool
+    result: Any = None
+    error: Optional[str] = None
+
+
+class MutationBatch:
+    """
+    Coleta mutações e as aplica concorrentemente no commit.
+
+    Exemplo de uso:
+        with client.batch(max_workers=8) as batch:
+            for task in tasks:
+                if precisa_alerta(task):
+                    batch.add_tag(task["id"], "urgente")
+                    batch.post_task_comment(task["id"], "Vence em 3 dias!")
+                    batch.update_task(task["id"], priority=2)
+
+        print(f"Falhas: {len(batch.failures)}")
+    """
+
+    def __init__(self, client, max_workers: int = 8):
+        """
+        Args:
+            client: KaloiClickUpClient usado para aplicar as mutações
+            max_workers: Tasks processadas em paralelo no commit
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.mutations: List[Mutation] = []
+        self.results: List[MutationResult] = []
+
+    def __len__(self) -> int:
+        return len(self.mutations)
+
+    def _add(self, method: str, task_id: str, *args, **kwargs) -> "MutationBatch":
+        self.mutations.append(Mutation(method, task_id, args, kwargs))
+        return self
+
+    # ================== OPERAÇÕES ==================
+
+    def add_tag(self, task_id: str, tag_name: str) -> "MutationBatch":
+        """Registra client.add_tag(task_id, tag_name)."""
+        return self._add("add_tag", task_id, tag_name)
+
+    def remove_tag(self, task_id: str, tag_name: str) -> "MutationBatch":
+        """Registra client.remove_tag(task_id, tag_name)."""
+        return self._add("remove_tag", task_id, tag_name)
+
+    def post_task_comment(self, task_id: str, comment_text: str) -> "MutationBatch":
+        """Registra client.post_task_comment(task_id, comment_text)."""
+        return self._add("post_task_comment", task_id, comment_text)
+
+    def update_task(self, task_id: str, **updates) -> "MutationBatch":
+        """Registra client.update_task(task_id, **updates) (aceita PT ou EN)."""
+        return self._add("update_task", task_id, **updates)
+
+    def set_custom_field(
+        self,
+        task_id: str,
+        field_id: str,
+        value: Any,
+        **kwargs
+    ) -> "MutationBatch":
+        """Registra client.set_custom_field(task_id, field_id, value, **kwargs)."""
+        return self._add("set_custom_field", task_id, field_id, value, **kwargs)
+
+    # ================== COMMIT ==================
+
+    def _apply(self, mutation: Mutation) -> MutationResult:
+        """Aplica uma mutação e captura o resultado."""
+        try:
+            method = getattr(self.client, mutation.method)
+            result = method(mutation.task_id, *mutation.args, **mutation.kwargs)
+        except Exception as e:
+            return MutationResult(mutation, ok=False, error=str(e))
+
+        # Métodos do cliente retornam None/False em caso de erro
+        ok = result is not None and result is not False
+        return MutationResult(
+            mutation,
+            ok=ok,
+            result=result,
+            error=None if ok else "Requisição falhou"
+        )
+
+    def _apply_group(self, mutations: List[Mutation]) -> List[MutationResult]:
+        """Aplica, em ordem, as mutações de uma mesma task."""
+        return [self._apply(mutation) for mutation in mutations]
+
+    def commit(self) -> List[MutationResult]:
+        """
+        Aplica todas as mutações pendentes.
+
+        Returns:
+            Lista de MutationResult na ordem em que as mutações foram registradas
+        """
+        pending, self.mutations = self.mutations, []
+
+        if not pending:
+            return []
+
+        # Agrupa por task preservando a ordem de registro
+        groups: "OrderedDict[str, List[Mutation]]" = OrderedDict()
+        for mutation in pending:
+            groups.setdefault(mutation.task_id, []).append(mutation)
+
+        by_mutation = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            for group_results in executor.map(self._apply_group, groups.values()):
+                for result in group_results:
+                    by_mutation[id(result.mutation)] = result
+
+        results = [by_mutation[id(mutation)] for mutation in pending]
+        self.results.extend(results)
+
+        successful = sum(1 for r in results if r.ok)
+        if successful == len(results):
+            self.client.output.write(f"[green]✓ {successful}/{len(results)} operações aplicadas[/green]")
+        else:
+            self.client.output.write(f"[yellow]⚠ {successful}/{len(results)} operações aplicadas "
+                                     f"({len(results) - successful} falharam)[/yellow]")
+
+        return results
+
+    @property
+    def failures(self) -> List[MutationResult]:
+        """Resultados com falha de todos os commits deste batch."""
+        return [r for r in self.results if not r.ok]
+
+    def __enter__(self) -> "MutationBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Só aplica se a avaliação terminou sem exceção
+        if exc_type is None:
+            self.commit()
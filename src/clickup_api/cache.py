@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Cache em memória com TTL e LRU para respostas da API do ClickUp.
+
+Usado pelo KaloiClickUpClient para metadados que mudam pouco (spaces,
+folders, lists, custom fields, membros). Qualquer objeto com a mesma
+interface (get/set/invalidate/clear) pode ser plugado no cliente.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Cache thread-safe com expiração por entrada e evicção LRU.
+
+    A evicção acontece quando o número de entradas passa de `max_entries`
+    ou o tamanho total passa de `max_bytes` (as entradas menos usadas
+    recentemente saem primeiro).
+
+    Exemplo de uso:
+        cache = TTLCache(max_entries=500, max_bytes=8 * 1024 * 1024)
+        client = KaloiClickUpClient(cache=cache)
+        ...
+        cache.invalidate("list/123")  # Invalida tudo da lista 123
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        default_ttl: float = 300.0
+    ):
+        """
+        Args:
+            max_entries: Número máximo de entradas
+            max_bytes: Tamanho máximo total (bytes) dos valores armazenados
+            default_ttl: TTL padrão em segundos
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        # key -> (expires_at, size, value)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        """Tamanho aproximado do valor em bytes."""
+        if isinstance(value, (bytes, bytearray, str)):
+            return len(value)
+        return sys.getsizeof(value)
+
+    def _remove(self, key: str):
+        """Remove uma entrada (chamar com o lock adquirido)."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Retorna o valor da chave, ou `default` se ausente/expirado.
+
+        Args:
+            key: Chave da entrada
+            default: Valor retornado em caso de miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, _, value = entry
+
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Armazena um valor.
+
+        Args:
+            key: Chave da entrada
+            value: Valor a armazenar
+            ttl: Segundos até expirar (padrão: default_ttl)
+        """
+        size = self._sizeof(value)
+
+        # Valor maior que o cache inteiro: não armazena
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+
+            # Evicção LRU por número de entradas e por bytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """
+        Remove entradas do endpoint `prefix` e dos seus sub-caminhos (todas se None).
+
+        O prefixo casa por segmento: "list/123" remove "list/123",
+        "list/123/field" e "list/123?archived=true", mas não "list/1234".
+
+        Args:
+            prefix: Prefixo da chave (ex: "list/123", "space/")
+
+        Returns:
+            Número de entradas removidas
+        """
+        with self._lock:
+            if prefix is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return removed
+
+            prefix = prefix.rstrip("/")
+            keys = [
+                key for key in self._entries
+                if key == prefix
+                or key.startswith(prefix + "/")
+                or key.startswith(prefix + "?")
+            ]
+            for key in keys:
+                self._remove(key)
+
+            return len(keys)
+
+    def clear(self):
+        """Remove todas as entradas e zera as estatísticas."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Tamanho total armazenado em bytes."""
+        return self._bytes
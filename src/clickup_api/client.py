@@ -1,17 +1,42 @@
+import json
 import os
+import queue
+import threading
+import time
 import requests
+from datetime import datetime
 from dotenv import load_dotenv
-from rich import print
-from typing import Optional, List, Dict, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Tuple, Union
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from src.clickup_api.helpers.date_utils import fuzzy_time_to_unix, fuzzy_time_to_seconds
-from src.clickup_api.helpers.translation import translate_params
+from src.clickup_api.helpers.translation import translate_params, translate_status
+from src.clickup_api.attachments import MultipartFileBody
+from src.clickup_api.batch import MutationBatch
+from src.clickup_api.cache import TTLCache
+from src.clickup_api.instrumentation import RequestEvent, endpoint_template
+from src.clickup_api.models import Task, make_projection
+from src.clickup_api.streaming import DEFAULT_CHUNK_SIZE, iter_json_array
+from src.clickup_api.output import get_output
+from src.clickup_api.resilience import BudgetedRetry, CircuitBreaker, RetryBudget
+from src.clickup_api.rate_limit import RateLimiter, get_shared_limiter
+from src.clickup_api.task_store import TaskStore
+from src.clickup_api.transport import transport_from_env
 
 load_dotenv()
 
 
+class PaginationError(RuntimeError):
+    """
+    Página de um endpoint paginado não obtida por completo (erro HTTP,
+    circuito aberto ou stream interrompido no meio do array).
+
+    Diferente do fim dos dados: a paginação não pode tratar a falha como
+    última página, senão o resultado sai truncado como se estivesse completo.
+    """
+
+
 class KaloiClickUpClient:
     """
     Cliente customizado do Sistema Kaloi para integração com a API v2 do ClickUp.
@@ -31,8 +56,91 @@ class KaloiClickUpClient:
 
     API_URL = "https://api.clickup.com/api/v2"
 
-    def __init__(self):
-        """Inicializa o cliente com token do .env"""
+    # Quantas vezes um 429 é reenviado (aguardando o reset) antes de desistir
+    MAX_RATE_LIMIT_RETRIES = 5
+
+    # TTL (segundos) do cache de metadados, por grupo de endpoint
+    CACHE_TTLS = {
+        "spaces": 3600,
+        "folders": 1800,
+        "lists": 900,
+        "list": 900,
+        "custom_fields": 3600,
+        "list_members": 900,
+    }
+
+    # Sobreposição (ms) aplicada ao watermark do sync incremental, para não
+    # perder tasks atualizadas perto do último sync
+    SYNC_OVERLAP_MS = 60_000
+
+    # Intervalo (segundos) entre syncs completos no sync_list, que removem
+    # do store as tasks deletadas ou movidas (invisíveis no incremental)
+    FULL_SYNC_INTERVAL = 24 * 3600
+
+    # Filtros de GET team/{id}/task enviados como arrays (list_ids[]=...)
+    QUERY_ARRAY_FILTERS = ("list_ids", "space_ids", "project_ids", "statuses", "tags", "assignees")
+
+    # Filtros de data das buscas de tasks (aceitam datas fuzzy)
+    DATE_FILTERS = (
+        "due_date_lt", "due_date_gt",
+        "date_created_lt", "date_created_gt",
+        "date_updated_lt", "date_updated_gt",
+        "date_done_lt", "date_done_gt",
+    )
+
+    # Pool de conexões HTTP (keep-alive) por host
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 32
+
+    # Timeout (conexão, leitura) dos uploads/downloads de anexos, em segundos
+    UPLOAD_TIMEOUT = (10, 300)
+    DOWNLOAD_TIMEOUT = (10, 300)
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    # Tamanho dos chunks lidos da rede na decodificação em streaming
+    STREAM_CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Union[bool, TTLCache, None] = True,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        task_store: Optional[TaskStore] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        output: Union[str, object, None] = None,
+        max_retries: int = 5,
+        backoff_factor: float = 1.0,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = True,
+        retry_budget: Union[bool, RetryBudget, None] = True,
+        transport: Optional[object] = None
+    ):
+        """
+        Inicializa o cliente com token do .env
+
+        Args:
+            rate_limiter: Limiter a usar (padrão: compartilhado por token no processo)
+            cache: True (TTLCache padrão), uma instância de cache, ou False/None para desativar
+            cache_ttls: TTLs por grupo de endpoint, sobrescrevendo CACHE_TTLS
+            task_store: Store SQLite local usado por sync_list()
+            pool_connections: Quantos hosts distintos mantêm pool de conexões
+            pool_maxsize: Conexões keep-alive reutilizáveis por host
+                (use >= número de threads concorrentes)
+            pool_block: Se True, threads aguardam uma conexão livre em vez de
+                abrir conexões extras descartáveis acima de pool_maxsize
+            output: Destino das mensagens: "rich" (padrão), "logging", "null"
+                ou um objeto com write(message). Padrão via KALOI_OUTPUT.
+            max_retries: Tentativas extras em erros 5xx/conexão (urllib3 Retry)
+            backoff_factor: Fator do backoff exponencial entre tentativas
+            circuit_breaker: True (CircuitBreaker padrão), uma instância, ou
+                False/None para desativar. Falha na hora durante incidentes
+            retry_budget: True (RetryBudget padrão, 10% das requisições), uma
+                instância, ou False/None para desativar
+            transport: Objeto com send(method, url, headers, **kwargs) que
+                entrega as requisições (ver transport.py). Padrão: a session,
+                ou gravação/replay de cassette via CLICKUP_CASSETTE
+        """
         self.token = os.getenv("CLICKUP_TOKEN")
         self.team_id = os.getenv("CLICKUP_TEAM_ID")
         self.base_url = os.getenv("CLICKUP_BASE_URL", self.API_URL)
@@ -40,120 +148,676 @@ class KaloiClickUpClient:
         if self.token:
             self.token = self.token.strip()
 
+        # Destino das mensagens (terminal, logging ou nenhum)
+        self.output = get_output(output or os.getenv("KALOI_OUTPUT"))
+
         self.headers = {
             "Authorization": self.token,
             "Content-Type": "application/json"
         }
 
+        # Rate limiting client-side guiado pelos headers X-RateLimit-*
+        self.rate_limiter = rate_limiter or get_shared_limiter(self.token)
+
+        # Cache de metadados (spaces, folders, lists, custom fields, membros)
+        if cache is True:
+            cache = TTLCache()
+        elif cache is False:
+            cache = None
+        self.cache = cache
+        self.cache_ttls = {**self.CACHE_TTLS, **(cache_ttls or {})}
+
+        # Store local de tasks (sync incremental)
+        self.task_store = task_store
+
+        # Listeners de instrumentação (ver add_listener)
+        self._listeners: List[Callable[[RequestEvent], None]] = []
+
+        # Proteções para incidentes do ClickUp (ver resilience.py)
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        elif circuit_breaker is False:
+            circuit_breaker = None
+        self.circuit_breaker = circuit_breaker
+
+        if retry_budget is True:
+            retry_budget = RetryBudget()
+        elif retry_budget is False:
+            retry_budget = None
+        self.retry_budget = retry_budget
+
         # Configurar session com retry automático
         self.session = requests.Session()
 
         # Estratégia de retry com backoff exponencial
-        retries = Retry(
-            total=5,  # Máximo de 5 tentativas
-            backoff_factor=1,  # Backoff exponencial: 0.5s, 1s, 2s, 4s, 8s
-            status_forcelist=[429, 500, 502, 503, 504],  # Status codes para retry
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]  # Métodos HTTP
+        # (limitado pelo retry budget, se houver)
+        retries = BudgetedRetry(
+            total=max_retries,  # Máximo de tentativas extras
+            backoff_factor=backoff_factor,  # Backoff exponencial: 0.5s, 1s, 2s, 4s, 8s
+            status_forcelist=[500, 502, 503, 504],  # 429 é tratado pelo rate_limiter
+            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],  # Métodos HTTP
+            budget=self.retry_budget
         )
 
-        adapter = HTTPAdapter(max_retries=retries)
+        # Pool de conexões compartilhado por todas as threads (TLS reaproveitado)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=retries
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        # Transporte das requisições: session, ou gravação/replay de cassette
+        self.transport = transport or transport_from_env(self.session)
+
+    def _print(self, message: str):
+        """Envia uma mensagem (com markup do Rich) ao sink de output."""
+        self.output.write(message)
+
+    def add_listener(self, listener: Callable[[RequestEvent], None]):
         """
-        Método interno para fazer requisições HTTP com tratamento de erros.
+        Registra um listener chamado ao fim de cada requisição.
+
+        O listener recebe um RequestEvent (método, template do endpoint,
+        status, latência, retries e bytes). Exceções do listener são
+        ignoradas para não afetar a requisição.
+
+        Args:
+            listener: Callable que recebe um RequestEvent
+
+        Example:
+            >>> from src.clickup_api.instrumentation import LatencyAggregator
+            >>> stats = LatencyAggregator()
+            >>> client.add_listener(stats)
+            >>> ...
+            >>> stats.report()
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[RequestEvent], None]):
+        """Remove um listener registrado com add_listener."""
+        self._listeners.remove(listener)
+
+    def _emit(
+        self,
+        method: str,
+        endpoint: str,
+        started: float,
+        response: Optional[requests.Response],
+        retries: int,
+        error: Optional[str] = None,
+        streamed: bool = False
+    ):
+        """Monta o RequestEvent e notifica os listeners."""
+        status = None
+        size = 0
+
+        if response is not None:
+            status = response.status_code
+            raw_retries = getattr(response.raw, "retries", None)
+            if raw_retries is not None:
+                retries += len(raw_retries.history)
+            if streamed:
+                size = int(response.headers.get("Content-Length") or 0)
+            else:
+                size = len(response.content or b"")
+
+        event = RequestEvent(
+            method=method,
+            endpoint=endpoint_template(endpoint),
+            status=status,
+            latency=time.perf_counter() - started,
+            retries=retries,
+            bytes=size,
+            error=error
+        )
+
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                pass
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        on_error: Optional[Callable[[Union[int, Exception]], None]] = None,
+        **kwargs
+    ) -> Optional[requests.Response]:
+        """
+        Envia uma requisição pelo transport (padrão: session com pool de conexões)
+        e retorna a response.
 
         Features:
         - Retry automático com backoff exponencial
-        - Tratamento de rate limiting (429)
+        - Rate limiting client-side (token bucket + headers X-RateLimit-*)
+        - 429 aguarda o reset da janela e reenvia (não retorna None); corpos
+          tipo arquivo (upload) são rebobinados antes de cada reenvio
+        - Circuit breaker: durante incidentes falha na hora (retorna None)
         - Handling de erros HTTP
+        - Eventos de instrumentação para os listeners (add_listener)
+        - Transport plugável (session, gravação ou replay de cassette)
 
         Args:
             method: Método HTTP (GET, POST, PUT, DELETE)
             endpoint: Endpoint da API (ex: "task/123")
+            headers: Headers da requisição (padrão: self.headers)
+            on_error: Chamado com o status HTTP (>= 400) ou a exceção quando
+                a requisição falha, para o chamador decidir se tenta de novo
             **kwargs: Parâmetros adicionais para requests
 
         Returns:
-            JSON response ou None em caso de erro
+            requests.Response com status < 400, ou None em caso de erro
         """
         url = f"{self.base_url}/{endpoint}"
+        headers = self.headers if headers is None else headers
+        breaker = self.circuit_breaker
+
+        if breaker is not None and not breaker.allow():
+            self._print(f"[red]✗ Circuito aberto (ClickUp instável): {method} {endpoint} "
+                        f"não enviado. Nova tentativa em {breaker.retry_in():.0f}s[/red]")
+            return None
+
+        # Sem listeners, nenhuma medição é feita
+        instrumented = bool(self._listeners)
+        started = time.perf_counter() if instrumented else 0.0
+        response = None
+        attempt = 0
+
+        # Corpo tipo arquivo (ex: MultipartFileBody do upload): o envio lê até
+        # o EOF, então cada reenvio do 429 precisa rebobinar ao início
+        body = kwargs.get("data")
+        body_start = body.tell() if hasattr(body, "seek") and hasattr(body, "tell") else None
 
         try:
-            # Usar session com retry automático
-            response = self.session.request(method, url, headers=self.headers, **kwargs)
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                if attempt and body_start is not None:
+                    body.seek(body_start)
+
+                self.rate_limiter.acquire()
+                if self.retry_budget is not None:
+                    self.retry_budget.record_request()
+
+                # Transport padrão: session com retry automático
+                response = self.transport.send(method, url, headers=headers, **kwargs)
+                self.rate_limiter.update_from_headers(response.headers)
+
+                if response.status_code != 429:
+                    break
+
+                wait = self.rate_limiter.penalize(response.headers)
+                # Devolve a conexão ao pool (em stream=True o corpo não foi lido)
+                response.close()
+                self._print(f"[yellow]⚠ Rate limit atingido. Aguardando {wait:.0f}s para reenviar...[/yellow]")
+
+            if instrumented:
+                self._emit(method, endpoint, started, response, attempt,
+                           streamed=kwargs.get("stream", False))
+
+            if breaker is not None:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
 
             if response.status_code == 429:
-                print(f"[yellow]⚠ Rate limit atingido. Aguarde alguns segundos.[/yellow]")
+                self._print(f"[red]✗ Rate limit persistente após {self.MAX_RATE_LIMIT_RETRIES} tentativas[/red]")
+                if on_error is not None:
+                    on_error(429)
                 return None
 
             if response.status_code >= 400:
-                print(f"[red]✗ Erro {response.status_code}: {response.text}[/red]")
+                self._print(f"[red]✗ Erro {response.status_code}: {response.text}[/red]")
+                if on_error is not None:
+                    on_error(response.status_code)
                 return None
 
-            return response.json() if response.text else {}
+            return response
 
         except Exception as e:
-            print(f"[red]✗ Erro na requisição: {str(e)}[/red]")
+            if breaker is not None:
+                breaker.record_failure()
+            if instrumented:
+                self._emit(method, endpoint, started, None, attempt, error=str(e))
+            self._print(f"[red]✗ Erro na requisição: {str(e)}[/red]")
+            if on_error is not None:
+                on_error(e)
+            return None
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """
+        Método interno para fazer requisições HTTP com tratamento de erros.
+
+        Usa _send (retry, rate limiting, pool de conexões) e decodifica o JSON.
+
+        Args:
+            method: Método HTTP (GET, POST, PUT, DELETE)
+            endpoint: Endpoint da API (ex: "task/123")
+            **kwargs: Parâmetros adicionais para requests
+
+        Returns:
+            JSON response ou None em caso de erro
+        """
+        response = self._send(method, endpoint, **kwargs)
+
+        if response is None:
             return None
 
+        try:
+            return response.json() if response.text else {}
+        except Exception as e:
+            self._print(f"[red]✗ Erro na requisição: {str(e)}[/red]")
+            return None
+
+    def _cached_request(
+        self,
+        group: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        GET com cache TTL para metadados que mudam pouco.
+
+        As respostas são armazenadas serializadas (JSON), então cada chamada
+        recebe uma cópia independente e o tamanho em bytes é exato.
+
+        Args:
+            group: Grupo do endpoint em cache_ttls (ex: "custom_fields")
+            endpoint: Endpoint da API
+            params: Parâmetros da requisição
+
+        Returns:
+            JSON response ou None em caso de erro
+        """
+        if self.cache is None:
+            return self._request("GET", endpoint, params=params)
+
+        key = endpoint
+        if params:
+            key += "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+        data = self._request("GET", endpoint, params=params)
+
+        if data:
+            self.cache.set(key, json.dumps(data), ttl=self.cache_ttls.get(group))
+
+        return data
+
+    def invalidate_cache(self, endpoint_prefix: Optional[str] = None) -> int:
+        """
+        Invalida entradas do cache de metadados.
+
+        Args:
+            endpoint_prefix: Prefixo do endpoint (ex: "list/123", "space/").
+                Se None, limpa todo o cache.
+
+        Returns:
+            Número de entradas removidas
+
+        Example:
+            >>> client.invalidate_cache("list/123/field")  # custom fields da lista
+            >>> client.invalidate_cache()  # tudo
+        """
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(endpoint_prefix)
+
+    @staticmethod
+    def _build_transform(
+        fields: Optional[List[str]] = None,
+        compact: bool = False,
+        transform: Optional[Callable[[Dict], Any]] = None
+    ) -> Optional[Callable[[Dict], Any]]:
+        """
+        Combina projeção de campos, Task compacto e transform customizado.
+
+        A ordem é: projeção → Task.from_dict → transform.
+
+        Args:
+            fields: Projeção (ver models.make_projection)
+            compact: Converter para Task
+            transform: Função extra aplicada por último
+
+        Returns:
+            Função aplicada a cada item, ou None se nada foi pedido
+        """
+        steps = []
+
+        if fields:
+            steps.append(make_projection(fields))
+        if compact:
+            steps.append(Task.from_dict)
+        if transform is not None:
+            steps.append(transform)
+
+        if not steps:
+            return None
+        if len(steps) == 1:
+            return steps[0]
+
+        def combined(item):
+            for step in steps:
+                item = step(item)
+            return item
+
+        return combined
+
+    def _stream_page(
+        self,
+        endpoint: str,
+        data_key: str,
+        page: int,
+        params: Dict[str, Any],
+        transform: Optional[Callable[[Dict], Any]] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Busca uma página decodificando os itens direto do stream da response.
+
+        O corpo é lido em chunks de STREAM_CHUNK_SIZE e cada item de
+        `data_key` é entregue assim que termina de chegar, então os bytes
+        brutos, o texto e a árvore da página inteira nunca ficam em memória
+        juntos. Usa ijson se instalado (ver streaming.py).
+
+        Args:
+            endpoint: Endpoint da API
+            data_key: Chave do array de itens
+            page: Número da página (0-based)
+            params: Parâmetros da requisição (não são modificados)
+            transform: Função aplicada a cada item
+            meta: Dict preenchido com as demais chaves (ex: last_page)
+
+        Yields:
+            Cada item da página (ou o retorno de transform)
+
+        Raises:
+            PaginationError: Se a requisição falhar ou o stream for
+                interrompido antes do fim do array (itens já entregues
+                não formam a página completa)
+        """
+        response = self._send("GET", endpoint, params={**params, "page": page}, stream=True)
+
+        if response is None:
+            raise PaginationError(f"Página {page} de {endpoint} não obtida")
+
+        try:
+            chunks = response.iter_content(self.STREAM_CHUNK_SIZE)
+            for item in iter_json_array(chunks, data_key, meta):
+                yield item if transform is None else transform(item)
+        except (ValueError, requests.RequestException) as e:
+            self._print(f"[red]✗ Erro na requisição: {str(e)}[/red]")
+            raise PaginationError(f"Página {page} de {endpoint} interrompida: {e}") from e
+        finally:
+            response.close()
+
+    def _fetch_page(
+        self,
+        endpoint: str,
+        data_key: str,
+        page: int,
+        params: Dict[str, Any],
+        transform: Optional[Callable[[Dict], Any]] = None,
+        stream: bool = False
+    ) -> Optional[Tuple[List[Any], bool]]:
+        """
+        Busca uma única página de um endpoint paginado.
+
+        Args:
+            endpoint: Endpoint da API (ex: "list/123/task")
+            data_key: Chave dos dados na response
+            page: Número da página (0-based)
+            params: Parâmetros da requisição (não são modificados)
+            transform: Função aplicada a cada item assim que a página chega
+                (ex: Task.from_dict), liberando o dict original cedo
+            stream: Decodifica os itens incrementalmente (ver _stream_page)
+
+        Returns:
+            Tupla (items, is_last_page) ou None se não houver dados
+
+        Raises:
+            PaginationError: Se a página não puder ser obtida (erro HTTP,
+                circuito aberto, stream interrompido)
+        """
+        if stream:
+            meta = {}
+            items = list(self._stream_page(endpoint, data_key, page, params, transform, meta))
+
+            if not items and not meta:
+                return None
+
+            return items, meta.get("last_page", False) or len(items) < 100
+
+        response = self._request("GET", endpoint, params={**params, "page": page})
+
+        # Falha não é fim dos dados: a página existe, só não chegou
+        if response is None:
+            raise PaginationError(f"Página {page} de {endpoint} não obtida")
+
+        # Verificar se há dados
+        if data_key not in response:
+            return None
+
+        items = response[data_key]
+
+        # ClickUp retorna last_page=true ou menos de 100 itens
+        is_last_page = response.get("last_page", False) or len(items) < 100
+
+        if transform is not None:
+            items = [transform(item) for item in items]
+
+        return items, is_last_page
+
     def _get_all_paginated(
         self,
         endpoint: str,
         data_key: str = "tasks",
+        max_workers: int = 1,
+        transform: Optional[Callable[[Dict], Any]] = None,
+        stream: bool = False,
         **params
-    ) -> List[Dict]:
+    ) -> Optional[List[Any]]:
         """
         Helper genérico para buscar todos os itens com paginação automática.
 
         A API do ClickUp limita respostas a 100 itens por página.
         Este método busca todas as páginas automaticamente.
 
+        Com max_workers > 1, as próximas páginas são buscadas
+        especulativamente em paralelo (thread pool). A busca para na
+        primeira página com last_page=true ou menos de 100 itens, e os
+        itens são retornados na ordem das páginas.
+
         Args:
             endpoint: Endpoint da API (ex: "list/123/task")
             data_key: Chave dos dados na response (ex: "tasks", "lists", "spaces")
+            max_workers: Páginas buscadas simultaneamente (1 = sequencial)
+            transform: Função aplicada a cada item ao decodificar a página
+            stream: Decodifica cada página incrementalmente (menos pico de memória)
             **params: Parâmetros adicionais da requisição
 
         Returns:
-            Lista completa de items de todas as páginas
+            Lista completa de items de todas as páginas, ou None se alguma
+            página falhar (nunca uma lista parcial)
 
         Example:
             >>> all_tasks = client._get_all_paginated("list/123/task", "tasks")
             >>> print(f"Total: {len(all_tasks)} tasks")
+
+            >>> # 3.000 tasks: ~30 páginas buscadas 8 por vez
+            >>> all_tasks = client._get_all_paginated("list/123/task", max_workers=8)
         """
         all_items = []
-        page = 0
 
-        while True:
-            # Adicionar número da página aos parâmetros
-            params["page"] = page
+        try:
+            if max_workers <= 1:
+                page = 0
 
-            # Fazer requisição
-            response = self._request("GET", endpoint, params=params)
+                while True:
+                    result = self._fetch_page(endpoint, data_key, page, params, transform, stream)
 
-            # Verificar se há dados
-            if not response or data_key not in response:
-                break
+                    if result is None:
+                        break
 
-            items = response[data_key]
-            all_items.extend(items)
+                    items, is_last_page = result
+                    all_items.extend(items)
 
-            # Verificar se é a última página
-            # ClickUp retorna last_page=true ou menos de 100 itens
-            is_last_page = response.get("last_page", False)
-            has_less_than_limit = len(items) < 100
+                    if is_last_page:
+                        break
 
-            if is_last_page or has_less_than_limit:
-                break
+                    page += 1
+
+                return all_items
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {}
+                next_page = 0
+                page = 0
+
+                try:
+                    while True:
+                        # Mantém até max_workers páginas em andamento à frente
+                        while next_page < page + max_workers:
+                            pending[next_page] = executor.submit(
+                                self._fetch_page, endpoint, data_key, next_page, params, transform, stream
+                            )
+                            next_page += 1
+
+                        result = pending.pop(page).result()
+
+                        if result is None:
+                            break
+
+                        items, is_last_page = result
+                        all_items.extend(items)
+
+                        if is_last_page:
+                            break
 
-            page += 1
+                        page += 1
+                finally:
+                    # Descarta páginas especulativas além da última (ou da que falhou)
+                    for future in pending.values():
+                        future.cancel()
 
-        return all_items
+            return all_items
+
+        except PaginationError as e:
+            self._print(f"[red]✗ Paginação interrompida ({len(all_items)} itens descartados): {e}[/red]")
+            return None
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        data_key: str,
+        params: Dict[str, Any],
+        prefetch: int = 0,
+        transform: Optional[Callable[[Dict], Any]] = None,
+        stream: bool = False
+    ):
+        """
+        Generator de páginas (listas de items), opcionalmente com read-ahead.
+
+        Com prefetch > 0, uma thread em background busca as próximas páginas
+        enquanto o chamador processa a atual. A fila é limitada a `prefetch`
+        páginas, então a memória fica limitada mesmo se o consumidor for lento.
+
+        Args:
+            endpoint: Endpoint da API
+            data_key: Chave dos dados na response
+            params: Parâmetros da requisição
+            prefetch: Páginas buscadas à frente do consumidor (0 = sem read-ahead)
+            transform: Função aplicada a cada item ao decodificar a página
+            stream: Decodifica cada página incrementalmente
+
+        Yields:
+            List: Items de uma página, na ordem das páginas
+
+        Raises:
+            PaginationError: Se uma página falhar (após entregar as anteriores)
+        """
+        if prefetch <= 0:
+            page = 0
+
+            while True:
+                result = self._fetch_page(endpoint, data_key, page, params, transform, stream)
+
+                if result is None:
+                    return
+
+                items, is_last_page = result
+                yield items
+
+                if is_last_page:
+                    return
+
+                page += 1
+
+        pages = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        end = object()
+
+        def put(item) -> bool:
+            # Não bloqueia para sempre se o consumidor abandonar o generator
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def producer():
+            page = 0
+            try:
+                while not stop.is_set():
+                    result = self._fetch_page(endpoint, data_key, page, params, transform, stream)
+
+                    if result is None:
+                        break
+
+                    items, is_last_page = result
+
+                    if not put(items) or is_last_page:
+                        break
+
+                    page += 1
+            except Exception as e:
+                put(e)
+            finally:
+                put(end)
+
+        thread = threading.Thread(target=producer, name="kaloi-prefetch", daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                item = pages.get()
+
+                if item is end:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+
+                yield item
+        finally:
+            stop.set()
 
     def _iter_paginated(
         self,
         endpoint: str,
         data_key: str = "tasks",
+        prefetch: int = 0,
+        transform: Optional[Callable[[Dict], Any]] = None,
+        fields: Optional[List[str]] = None,
+        stream: bool = False,
         **params
     ):
         """
@@ -161,39 +825,59 @@ class KaloiClickUpClient:
 
         Mais eficiente em memória que _get_all_paginated para grandes volumes.
 
+        Com prefetch > 0, as próximas páginas são buscadas em background
+        enquanto o chamador processa a página atual, sobrepondo rede e
+        processamento (fila limitada a `prefetch` páginas).
+
         Args:
             endpoint: Endpoint da API
             data_key: Chave dos dados na response
+            prefetch: Páginas buscadas à frente do consumidor (0 = sem read-ahead)
+            transform: Função aplicada a cada item (ex: Task.from_dict)
+            fields: Projeção aplicada a cada item ao decodificar a página
+                (ex: ["name", "status", "custom_fields.<uuid>"])
+            stream: Decodifica os itens direto do stream da response. Sem
+                prefetch, cada item é entregue assim que chega da rede
             **params: Parâmetros adicionais
 
         Yields:
-            Dict: Item individual
+            Dict: Item individual (ou o retorno de transform)
+
+        Raises:
+            PaginationError: Se uma página falhar ou o stream for interrompido
 
         Example:
             >>> for task in client._iter_paginated("list/123/task", "tasks"):
             ...     process_task(task)
-        """
-        page = 0
 
-        while True:
-            params["page"] = page
-            response = self._request("GET", endpoint, params=params)
+            >>> # Busca até 2 páginas à frente enquanto processa
+            >>> for task in client._iter_paginated("list/123/task", prefetch=2):
+            ...     process_task(task)
 
-            if not response or data_key not in response:
-                break
+            >>> # Páginas de vários MB (include_subtasks, descrições longas)
+            >>> for task in client._iter_paginated("list/123/task", stream=True):
+            ...     process_task(task)
+        """
+        transform = self._build_transform(fields, transform=transform)
 
-            items = response[data_key]
+        if stream and prefetch <= 0:
+            page = 0
 
-            for item in items:
-                yield item
+            while True:
+                meta = {}
+                count = 0
 
-            is_last_page = response.get("last_page", False)
-            has_less_than_limit = len(items) < 100
+                for item in self._stream_page(endpoint, data_key, page, params, transform, meta):
+                    count += 1
+                    yield item
 
-            if is_last_page or has_less_than_limit:
-                break
+                if meta.get("last_page", False) or count < 100:
+                    return
+
+                page += 1
 
-            page += 1
+        for items in self._iter_pages(endpoint, data_key, params, prefetch, transform, stream):
+            yield from items
 
     # ================== AUTENTICAÇÃO ==================
 
@@ -207,16 +891,16 @@ class KaloiClickUpClient:
         teams = self.get_teams()
 
         if teams:
-            print(f"[green]✓ Autenticação bem-sucedida com o ClickUp![/green]")
-            print(f"[bold]Workspaces disponíveis:[/bold]")
+            self._print(f"[green]✓ Autenticação bem-sucedida com o ClickUp![/green]")
+            self._print(f"[bold]Workspaces disponíveis:[/bold]")
 
             for team in teams.get("teams", []):
-                print(f"  • {team['name']} (ID: {team['id']})")
+                self._print(f"  • {team['name']} (ID: {team['id']})")
 
             return teams
         else:
-            print(f"[red]✗ Falha na autenticação[/red]")
-            print(f"[yellow]Dica: Verifique se o token no .env é válido[/yellow]")
+            self._print(f"[red]✗ Falha na autenticação[/red]")
+            self._print(f"[yellow]Dica: Verifique se o token no .env é válido[/yellow]")
             return None
 
     def get_user_info(self) -> Optional[Dict]:
@@ -230,10 +914,10 @@ class KaloiClickUpClient:
 
         if data and "user" in data:
             user = data["user"]
-            print(f"[green]✓ Usuário autenticado:[/green]")
-            print(f"  Nome: [bold]{user.get('username', 'N/A')}[/bold]")
-            print(f"  E-mail: {user.get('email', 'N/A')}")
-            print(f"  ID: {user.get('id', 'N/A')}")
+            self._print(f"[green]✓ Usuário autenticado:[/green]")
+            self._print(f"  Nome: [bold]{user.get('username', 'N/A')}[/bold]")
+            self._print(f"  E-mail: {user.get('email', 'N/A')}")
+            self._print(f"  ID: {user.get('id', 'N/A')}")
 
         return data
 
@@ -263,7 +947,7 @@ class KaloiClickUpClient:
         """
         tid = team_id or self.team_id
         params = {"archived": str(archived).lower()}
-        return self._request("GET", f"team/{tid}/space", params=params)
+        return self._cached_request("spaces", f"team/{tid}/space", params=params)
 
     def get_space(self, space_id: str) -> Optional[Dict]:
         """
@@ -289,7 +973,7 @@ class KaloiClickUpClient:
         Returns:
             dict com lista de folders
         """
-        return self._request("GET", f"space/{space_id}/folder")
+        return self._cached_request("folders", f"space/{space_id}/folder")
 
     def get_folder(self, folder_id: str) -> Optional[Dict]:
         """
@@ -315,7 +999,7 @@ class KaloiClickUpClient:
         Returns:
             dict com lista de lists
         """
-        return self._request("GET", f"folder/{folder_id}/list")
+        return self._cached_request("lists", f"folder/{folder_id}/list")
 
     def get_folderless_lists(self, space_id: str) -> Optional[Dict]:
         """
@@ -327,7 +1011,7 @@ class KaloiClickUpClient:
         Returns:
             dict com lista de lists
         """
-        return self._request("GET", f"space/{space_id}/list")
+        return self._cached_request("lists", f"space/{space_id}/list")
 
     def get_list(self, list_id: str) -> Optional[Dict]:
         """
@@ -339,7 +1023,7 @@ class KaloiClickUpClient:
         Returns:
             dict com dados da list
         """
-        return self._request("GET", f"list/{list_id}")
+        return self._cached_request("list", f"list/{list_id}")
 
     # ================== TASKS ==================
 
@@ -356,19 +1040,43 @@ class KaloiClickUpClient:
         task = self._request("GET", f"task/{task_id}")
 
         if task:
-            print(f"[cyan]📋 Task: {task.get('name')}[/cyan]")
-            print(f"  ID: {task.get('id')}")
-            print(f"  Status: {task.get('status', {}).get('status', 'N/A')}")
-            print(f"  URL: {task.get('url')}")
+            self._print(f"[cyan]📋 Task: {task.get('name')}[/cyan]")
+            self._print(f"  ID: {task.get('id')}")
+            self._print(f"  Status: {task.get('status', {}).get('status', 'N/A')}")
+            self._print(f"  URL: {task.get('url')}")
 
         return task
 
+    def _convert_date_filters(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converte filtros de data (DATE_FILTERS) para timestamp em ms.
+
+        Aceita datas fuzzy ("amanhã", "in 7 days", "2024-12-01"), datetime
+        ou timestamp. Modifica e retorna o próprio dict.
+        """
+        for key in self.DATE_FILTERS:
+            value = params.get(key)
+
+            if isinstance(value, datetime):
+                params[key] = int(value.timestamp() * 1000)
+            elif isinstance(value, str):
+                try:
+                    params[key] = fuzzy_time_to_unix(value)
+                except Exception as e:
+                    self._print(f"[yellow]⚠ Aviso: Não foi possível converter {key}: {e}[/yellow]")
+
+        return params
+
     def get_tasks(
         self,
         list_id: str,
         paginate: bool = False,
+        max_workers: int = 1,
+        compact: bool = False,
+        fields: Optional[List[str]] = None,
+        stream: bool = False,
         **filters
-    ) -> Union[Optional[Dict], List[Dict]]:
+    ) -> Union[Optional[Dict], List[Dict], List[Task]]:
         """
         Lista tasks de uma lista com filtros opcionais.
 
@@ -377,6 +1085,12 @@ class KaloiClickUpClient:
         Args:
             list_id: ID da lista
             paginate: Se True, busca TODAS as páginas automaticamente
+            max_workers: Com paginate=True, páginas buscadas em paralelo (1 = sequencial)
+            compact: Se True, retorna objetos Task compactos em vez de dicts
+            fields: Mantém só estas chaves de cada task ("id" sempre incluso).
+                Custom fields individuais: "custom_fields.<uuid>"
+            stream: Com paginate=True, decodifica cada página incrementalmente
+                (menos pico de memória em páginas grandes)
             **filters: Filtros opcionais
 
         Filtros aceitos (PT ou EN):
@@ -385,6 +1099,9 @@ class KaloiClickUpClient:
             - order_by/ordenar_por: Campo para ordenação
             - include_closed/incluir_fechadas: true/false
             - subtasks/incluir_subtasks: true/false
+            - due_date_lt/vence_antes: Vencimento antes de (data fuzzy ou ms)
+            - due_date_gt/vence_depois: Vencimento depois de (data fuzzy ou ms)
+            - date_updated_gt/atualizada_depois, date_updated_lt/atualizada_antes
 
         Exemplos:
             # Buscar primeira página (padrão)
@@ -394,6 +1111,19 @@ class KaloiClickUpClient:
             all_tasks = client.get_tasks("list_id", paginate=True)
             print(f"Total: {len(all_tasks)} tasks")
 
+            # Listas grandes: busca até 8 páginas em paralelo
+            all_tasks = client.get_tasks("list_id", paginate=True, max_workers=8)
+
+            # Syncs enormes: Task compacto (várias vezes menos memória)
+            all_tasks = client.get_tasks("list_id", paginate=True, compact=True)
+
+            # Só as chaves usadas (payload descartado ao decodificar cada página)
+            tasks = client.get_tasks(
+                "list_id",
+                paginate=True,
+                fields=["name", "status", "due_date", "custom_fields.<uuid>"]
+            )
+
             # Com filtros em português
             tasks = client.get_tasks(
                 "list_id",
@@ -402,23 +1132,156 @@ class KaloiClickUpClient:
                 incluir_fechadas=False
             )
 
+            # Só o que vence na próxima semana (ou já venceu): filtro no servidor
+            tasks = client.get_tasks("list_id", paginate=True, vence_antes="in 8 days")
+
         Returns:
             Se paginate=False: dict com lista de tasks (1 página)
-            Se paginate=True: list com TODAS as tasks (todas as páginas)
+            Se paginate=True: list com TODAS as tasks (todas as páginas),
+            ou None se alguma página falhar (nunca uma lista truncada)
+            Com compact=True, as tasks são objetos Task
         """
         # Traduz filtros PT → EN
-        filters_translated = translate_params(filters, to_english=True)
+        filters_translated = self._convert_date_filters(translate_params(filters, to_english=True))
+        transform = self._build_transform(fields, compact)
 
         if paginate:
             # Buscar todas as páginas automaticamente
             return self._get_all_paginated(
                 f"list/{list_id}/task",
                 data_key="tasks",
+                max_workers=max_workers,
+                transform=transform,
+                stream=stream,
                 **filters_translated
             )
         else:
             # Buscar apenas 1 página
-            return self._request("GET", f"list/{list_id}/task", params=filters_translated)
+            result = self._request("GET", f"list/{list_id}/task", params=filters_translated)
+
+            if result and transform is not None:
+                result["tasks"] = [transform(task) for task in result.get("tasks", [])]
+
+            return result
+
+    def query_tasks(
+        self,
+        team_id: Optional[str] = None,
+        list_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        due_date_lt: Union[str, int, None] = None,
+        due_date_gt: Union[str, int, None] = None,
+        date_updated_gt: Union[str, int, None] = None,
+        paginate: bool = True,
+        max_workers: int = 1,
+        compact: bool = False,
+        fields: Optional[List[str]] = None,
+        stream: bool = False,
+        **filters
+    ) -> Union[Optional[Dict], List[Dict], List[Task]]:
+        """
+        Busca tasks do workspace inteiro com filtros aplicados no servidor.
+
+        Usa GET team/{id}/task: uma única cadeia de paginação substitui
+        várias chamadas get_tasks (uma por lista). Aceita filtros em
+        PORTUGUÊS ou INGLÊS; datas aceitam linguagem natural.
+
+        Args:
+            team_id: ID do workspace (usa self.team_id se não fornecido)
+            list_ids: IDs das listas
+            statuses: Status (PT ou EN, ex: ["em progresso", "review"])
+            tags: Nomes das tags
+            due_date_lt: Vencimento antes de (timestamp ms ou data fuzzy)
+            due_date_gt: Vencimento depois de (timestamp ms ou data fuzzy)
+            date_updated_gt: Atualizada depois de (timestamp ms ou data fuzzy)
+            paginate: Se True (padrão), busca TODAS as páginas
+            max_workers: Com paginate=True, páginas buscadas em paralelo
+            compact: Se True, retorna objetos Task compactos
+            fields: Projeção de campos (ver get_tasks)
+            stream: Decodifica cada página incrementalmente
+            **filters: Outros filtros do endpoint
+
+        Filtros adicionais (PT ou EN):
+            - space_ids/espacos, project_ids/pastas: IDs de spaces e folders
+            - assignees/responsaveis: IDs de usuários
+            - include_closed/incluir_fechadas, subtasks/incluir_subtasks
+            - date_created_gt/lt, date_updated_lt, date_done_gt/lt
+            - order_by/ordenar_por, reverse
+
+        Exemplos:
+            # Projetos internos + externos numa única paginação
+            tasks = client.query_tasks(
+                list_ids=["901", "902"],
+                incluir_fechadas=False,
+                due_date_lt="in 7 days"
+            )
+
+            # Em português
+            tasks = client.query_tasks(
+                listas=["901"],
+                status=["em progresso"],
+                etiquetas=["urgente"]
+            )
+
+        Returns:
+            Se paginate=True: list com TODAS as tasks (None se alguma página falhar)
+            Se paginate=False: dict com 1 página ("tasks", "last_page")
+        """
+        tid = team_id or self.team_id
+        params = translate_params(filters, to_english=True)
+
+        # "status" (PT/EN) vira o filtro de array "statuses"
+        if "status" in params:
+            params.setdefault("statuses", params.pop("status"))
+
+        named = {
+            "list_ids": list_ids,
+            "statuses": statuses,
+            "tags": tags,
+            "due_date_lt": due_date_lt,
+            "due_date_gt": due_date_gt,
+            "date_updated_gt": date_updated_gt,
+        }
+        params.update({key: value for key, value in named.items() if value is not None})
+
+        for key in self.QUERY_ARRAY_FILTERS:
+            if key not in params:
+                continue
+
+            values = params.pop(key)
+            if isinstance(values, (str, int)):
+                values = [values]
+            if key == "statuses":
+                values = [translate_status(str(value)) for value in values]
+
+            params[f"{key}[]"] = [str(value) for value in values]
+
+        self._convert_date_filters(params)
+
+        # Booleanos no formato da API ("true"/"false")
+        for key, value in params.items():
+            if isinstance(value, bool):
+                params[key] = str(value).lower()
+
+        transform = self._build_transform(fields, compact)
+
+        if paginate:
+            return self._get_all_paginated(
+                f"team/{tid}/task",
+                data_key="tasks",
+                max_workers=max_workers,
+                transform=transform,
+                stream=stream,
+                **params
+            )
+
+        result = self._request("GET", f"team/{tid}/task", params=params)
+
+        if result and transform is not None:
+            result["tasks"] = [transform(task) for task in result.get("tasks", [])]
+
+        return result
 
     def create_task(
         self,
@@ -497,17 +1360,17 @@ class KaloiClickUpClient:
                 try:
                     kwargs_translated[date_field] = fuzzy_time_to_unix(kwargs_translated[date_field])
                 except Exception as e:
-                    print(f"[yellow]⚠ Aviso: Não foi possível converter {date_field}: {e}[/yellow]")
+                    self._print(f"[yellow]⚠ Aviso: Não foi possível converter {date_field}: {e}[/yellow]")
 
         payload.update(kwargs_translated)
 
         task = self._request("POST", f"list/{list_id}/task", json=payload)
 
         if task:
-            print(f"[green]✓ Task criada com sucesso![/green]")
-            print(f"  Nome: [bold]{task.get('name')}[/bold]")
-            print(f"  ID: {task.get('id')}")
-            print(f"  URL: {task.get('url')}")
+            self._print(f"[green]✓ Task criada com sucesso![/green]")
+            self._print(f"  Nome: [bold]{task.get('name')}[/bold]")
+            self._print(f"  ID: {task.get('id')}")
+            self._print(f"  URL: {task.get('url')}")
 
         return task
 
@@ -556,12 +1419,12 @@ class KaloiClickUpClient:
                 try:
                     updates_translated[date_field] = fuzzy_time_to_unix(updates_translated[date_field])
                 except Exception as e:
-                    print(f"[yellow]⚠ Aviso: Não foi possível converter {date_field}: {e}[/yellow]")
+                    self._print(f"[yellow]⚠ Aviso: Não foi possível converter {date_field}: {e}[/yellow]")
 
         task = self._request("PUT", f"task/{task_id}", json=updates_translated)
 
         if task:
-            print(f"[green]✓ Task atualizada![/green]")
+            self._print(f"[green]✓ Task atualizada![/green]")
 
         return task
 
@@ -578,11 +1441,107 @@ class KaloiClickUpClient:
         result = self._request("DELETE", f"task/{task_id}")
 
         if result is not None:
-            print(f"[green]✓ Task deletada[/green]")
+            self._print(f"[green]✓ Task deletada[/green]")
             return True
 
         return False
 
+    # ================== SYNC LOCAL ==================
+
+    def sync_list(
+        self,
+        list_id: str,
+        store: Optional[TaskStore] = None,
+        full: bool = False,
+        max_workers: int = 4
+    ) -> Optional[int]:
+        """
+        Sincroniza as tasks de uma lista com o store local (SQLite).
+
+        Busca apenas tasks alteradas desde o último sync (date_updated_gt)
+        e faz merge no store. O primeiro sync, full=True ou um último sync
+        completo com mais de FULL_SYNC_INTERVAL baixam a lista inteira e
+        substituem a do store (removendo tasks deletadas ou movidas).
+
+        Args:
+            list_id: ID da lista
+            store: TaskStore a usar (padrão: self.task_store)
+            full: Se True, baixa tudo novamente e substitui a lista no store
+            max_workers: Páginas buscadas em paralelo
+
+        Returns:
+            Número de tasks gravadas no store, ou None se alguma página
+            falhar (nada é gravado e o watermark não avança)
+
+        Example:
+            >>> client = KaloiClickUpClient(task_store=TaskStore("tasks.db"))
+            >>> client.sync_list("list_id")
+            >>> tasks = client.task_store.get_tasks("list_id")
+        """
+        store = store or self.task_store
+
+        if store is None:
+            raise ValueError("Nenhum TaskStore configurado (use task_store= ou store=)")
+
+        watermark = store.get_watermark(list_id)
+
+        # Tasks deletadas/movidas não aparecem no incremental: refaz a lista
+        # inteira quando o último sync completo ficou velho
+        full_synced_at = store.get_full_synced_at(list_id)
+        if (watermark is None or full_synced_at is None
+                or time.time() * 1000 - full_synced_at > self.FULL_SYNC_INTERVAL * 1000):
+            full = True
+
+        params = {"include_closed": "true"}
+
+        if not full:
+            params["date_updated_gt"] = max(watermark - self.SYNC_OVERLAP_MS, 0)
+
+        changed = self._get_all_paginated(
+            f"list/{list_id}/task",
+            data_key="tasks",
+            max_workers=max_workers,
+            archived="false",
+            **params
+        )
+
+        # Tasks arquivadas desde o último sync (no sync completo não interessam)
+        archived = []
+        if not full and changed is not None:
+            archived = self._get_all_paginated(
+                f"list/{list_id}/task",
+                data_key="tasks",
+                max_workers=max_workers,
+                archived="true",
+                **params
+            )
+
+        # Busca incompleta: o watermark não pode avançar, senão as tasks das
+        # páginas que faltaram (atualizadas antes dele) nunca voltam
+        if changed is None or archived is None:
+            self._print(f"[red]✗ Sync da lista {list_id} abortado: busca incompleta "
+                        f"(store e watermark mantidos)[/red]")
+            return None
+
+        changed += archived
+
+        # Sync completo troca a lista inteira numa transação (só depois de
+        # tudo baixado: uma falha no meio não deixa o store vazio)
+        if full:
+            count = store.replace_tasks(list_id, changed)
+            watermark = None
+        else:
+            count = store.upsert_tasks(list_id, changed)
+
+        new_watermark = max(
+            [int(task.get("date_updated") or 0) for task in changed] + [watermark or 0]
+        )
+        store.set_watermark(list_id, new_watermark, full=full)
+
+        self._print(f"[green]✓ Lista {list_id} sincronizada: {count} tasks alteradas[/green]")
+
+        return count
+
     # ================== COMMENTS ==================
 
     def get_task_comments(self, task_id: str) -> Optional[Dict]:
@@ -643,6 +1602,31 @@ class KaloiClickUpClient:
         result = self._request("DELETE", f"task/{task_id}/tag/{tag_name}")
         return result is not None
 
+    # ================== BATCH DE MUTAÇÕES ==================
+
+    def batch(self, max_workers: int = 8) -> MutationBatch:
+        """
+        Cria uma fila de mutações aplicadas concorrentemente no commit.
+
+        Operações suportadas: add_tag, remove_tag, post_task_comment,
+        update_task e set_custom_field. Escritas da mesma task mantêm a
+        ordem; tasks diferentes rodam em paralelo sob o rate limiter.
+
+        Args:
+            max_workers: Tasks processadas em paralelo no commit
+
+        Returns:
+            MutationBatch (use como context manager para commit automático)
+
+        Example:
+            >>> with client.batch() as batch:
+            ...     for task in tasks:
+            ...         batch.add_tag(task["id"], "urgente")
+            ...         batch.update_task(task["id"], prioridade="urgente")
+            >>> print(len(batch.failures))
+        """
+        return MutationBatch(self, max_workers=max_workers)
+
     # ================== A. CUSTOM FIELDS ==================
 
     def get_custom_fields(self, list_id: str) -> Optional[Dict]:
@@ -655,7 +1639,7 @@ class KaloiClickUpClient:
         Returns:
             dict com lista de custom fields
         """
-        return self._request("GET", f"list/{list_id}/field")
+        return self._cached_request("custom_fields", f"list/{list_id}/field")
 
     def set_custom_field(
         self,
@@ -682,7 +1666,7 @@ class KaloiClickUpClient:
         result = self._request("POST", f"task/{task_id}/field/{field_id}", json=payload)
 
         if result:
-            print(f"[green]✓ Custom field atualizado![/green]")
+            self._print(f"[green]✓ Custom field atualizado![/green]")
 
         return result
 
@@ -702,14 +1686,14 @@ class KaloiClickUpClient:
             Lista com resultados
         """
         results = []
-        print(f"[yellow]⚠ Atualizando {len(fields)} custom fields...[/yellow]")
+        self._print(f"[yellow]⚠ Atualizando {len(fields)} custom fields...[/yellow]")
 
         for field_id, value in fields.items():
             result = self.set_custom_field(task_id, field_id, value)
             results.append(result)
 
         successful = sum(1 for r in results if r is not None)
-        print(f"[green]✓ {successful}/{len(fields)} custom fields atualizados[/green]")
+        self._print(f"[green]✓ {successful}/{len(fields)} custom fields atualizados[/green]")
 
         return results
 
@@ -743,7 +1727,7 @@ class KaloiClickUpClient:
         tid = team_id or self.team_id
 
         if not duration:
-            print("[red]✗ Duração é obrigatória[/red]")
+            self._print("[red]✗ Duração é obrigatória[/red]")
             return None
 
         payload = {"duration": duration, "billable": billable}
@@ -761,7 +1745,7 @@ class KaloiClickUpClient:
 
         if result:
             duration_hours = duration / 1000 / 3600
-            print(f"[green]✓ Time entry criado: {duration_hours:.2f}h[/green]")
+            self._print(f"[green]✓ Time entry criado: {duration_hours:.2f}h[/green]")
 
         return result
 
@@ -798,7 +1782,7 @@ class KaloiClickUpClient:
         result = self._request("POST", f"team/{tid}/time_entries/start", json=payload)
 
         if result:
-            print(f"[green]✓ Timer iniciado na task {task_id}[/green]")
+            self._print(f"[green]✓ Timer iniciado na task {task_id}[/green]")
 
         return result
 
@@ -819,7 +1803,7 @@ class KaloiClickUpClient:
         if result:
             duration_ms = int(result.get("duration", 0))
             duration_hours = duration_ms / 1000 / 3600
-            print(f"[green]✓ Timer parado: {duration_hours:.2f}h registradas[/green]")
+            self._print(f"[green]✓ Timer parado: {duration_hours:.2f}h registradas[/green]")
 
         return result
 
@@ -839,10 +1823,10 @@ class KaloiClickUpClient:
 
         if result and result.get("data"):
             timer = result["data"][0] if isinstance(result["data"], list) else result["data"]
-            print(f"[yellow]⏱ Timer rodando: {timer.get('description', 'Sem descrição')}[/yellow]")
+            self._print(f"[yellow]⏱ Timer rodando: {timer.get('description', 'Sem descrição')}[/yellow]")
             return timer
 
-        print("[blue]ℹ Nenhum timer em execução[/blue]")
+        self._print("[blue]ℹ Nenhum timer em execução[/blue]")
         return None
 
     def get_time_entries(
@@ -893,7 +1877,7 @@ class KaloiClickUpClient:
 
         if result:
             count = len(result.get("data", []))
-            print(f"[green]✓ {count} time entries encontrados[/green]")
+            self._print(f"[green]✓ {count} time entries encontrados[/green]")
 
         return result
 
@@ -919,7 +1903,7 @@ class KaloiClickUpClient:
         result = self._request("PUT", f"team/{tid}/time_entries/{timer_id}", json=updates)
 
         if result:
-            print(f"[green]✓ Time entry atualizado[/green]")
+            self._print(f"[green]✓ Time entry atualizado[/green]")
 
         return result
 
@@ -943,17 +1927,70 @@ class KaloiClickUpClient:
         result = self._request("DELETE", f"team/{tid}/time_entries/{timer_id}")
 
         if result is not None:
-            print(f"[green]✓ Time entry deletado[/green]")
+            self._print(f"[green]✓ Time entry deletado[/green]")
             return True
 
         return False
 
     # ================== C. ATTACHMENTS ==================
 
+    @staticmethod
+    def _is_transient(failure: Union[int, Exception, None]) -> bool:
+        """
+        Indica se uma falha de _send vale nova tentativa.
+
+        Transitórias: 429, 5xx, erros de conexão/timeout e circuito aberto
+        (None, requisição não enviada). Demais 4xx (400, 403, 404...) não
+        mudam ao reenviar.
+        """
+        if failure is None:
+            return True
+        if isinstance(failure, Exception):
+            return isinstance(failure, (requests.ConnectionError, requests.Timeout))
+        return failure == 429 or failure >= 500
+
+    def _upload_file(self, task_id: str, file_path: str) -> Tuple[Optional[Dict], bool]:
+        """
+        Envia um arquivo em streaming (sem carregá-lo em memória).
+
+        Usa a session (pool de conexões, retry e rate limiting) com
+        UPLOAD_TIMEOUT. Não imprime mensagens de sucesso.
+
+        Returns:
+            Tupla (dict com dados do attachment ou None em caso de erro,
+            True se a falha for transitória e valer nova tentativa)
+        """
+        failures = []
+
+        with MultipartFileBody("attachment", file_path) as body:
+            # Para upload, usar headers sem o Content-Type JSON
+            headers = {"Authorization": self.token, "Content-Type": body.content_type}
+
+            response = self._send(
+                "POST",
+                f"task/{task_id}/attachment",
+                headers=headers,
+                on_error=failures.append,
+                data=body,
+                timeout=self.UPLOAD_TIMEOUT
+            )
+
+        if response is None:
+            return None, self._is_transient(failures[-1] if failures else None)
+
+        try:
+            return (response.json() if response.text else {}), False
+        except ValueError as e:
+            # O arquivo já foi aceito: reenviar duplicaria o anexo
+            self._print(f"[red]✗ Erro na requisição: {str(e)}[/red]")
+            return None, False
+
     def upload_attachment(self, task_id: str, file_path: str) -> Optional[Dict]:
         """
         Faz upload de anexo para uma task.
 
+        O arquivo é enviado em streaming, lido do disco em blocos.
+
         Args:
             task_id: ID da task
             file_path: Caminho do arquivo local
@@ -961,39 +1998,242 @@ class KaloiClickUpClient:
         Returns:
             dict com dados do attachment
         """
-        import os
-
         if not os.path.exists(file_path):
-            print(f"[red]✗ Arquivo não encontrado: {file_path}[/red]")
+            self._print(f"[red]✗ Arquivo não encontrado: {file_path}[/red]")
             return None
 
         filename = os.path.basename(file_path)
+        result, _ = self._upload_file(task_id, file_path)
 
-        # Para upload, usar headers sem Content-Type (requests define automaticamente)
-        headers = {"Authorization": self.token}
+        if result is None:
+            self._print(f"[red]✗ Erro no upload: {filename}[/red]")
+            return None
 
-        with open(file_path, 'rb') as f:
-            files = {"attachment": (filename, f)}
+        if result:
+            self._print(f"[green]✓ Anexo enviado: {filename}[/green]")
 
-            url = f"{self.base_url}/task/{task_id}/attachment"
+        return result
 
-            try:
-                response = requests.post(url, files=files, headers=headers)
+    def upload_attachments(
+        self,
+        uploads: List[Tuple[str, str]],
+        max_workers: int = 4,
+        retries: int = 2
+    ) -> List[Optional[Dict]]:
+        """
+        Faz upload de vários anexos em paralelo.
 
-                if response.status_code >= 400:
-                    print(f"[red]✗ Erro {response.status_code}: {response.text}[/red]")
-                    return None
+        Cada arquivo é enviado em streaming pela session (pool de conexões
+        e rate limiter compartilhados). Uploads com falha transitória (429,
+        5xx, erro de conexão) são tentados de novo até `retries` vezes;
+        demais 4xx (400, 403, 404...) falham na hora. No fim, imprime o total enviado e a
+        vazão (MB/s) do lote.
 
-                result = response.json() if response.text else {}
+        Args:
+            uploads: Lista de (task_id, caminho do arquivo)
+            max_workers: Uploads simultâneos
+            retries: Novas tentativas por arquivo após uma falha transitória
 
-                if result:
-                    print(f"[green]✓ Anexo enviado: {filename}[/green]")
+        Returns:
+            Lista com o dict do attachment (ou None se falhou), na ordem de `uploads`
 
-                return result
+        Example:
+            >>> results = client.upload_attachments([
+            ...     ("86a1", "notas/nf-001.pdf"),
+            ...     ("86a2", "propostas/proposta-acme.pdf"),
+            ... ], max_workers=8)
+            >>> falhas = [up for up, r in zip(uploads, results) if r is None]
+        """
+        def upload(item: Tuple[str, str]) -> Tuple[Optional[Dict], int]:
+            task_id, file_path = item
+
+            if not os.path.exists(file_path):
+                self._print(f"[red]✗ Arquivo não encontrado: {file_path}[/red]")
+                return None, 0
+
+            for attempt in range(retries + 1):
+                result, transient = self._upload_file(task_id, file_path)
+                if result is not None:
+                    return result, os.path.getsize(file_path)
+                if not transient:
+                    break
+                if attempt < retries:
+                    self._print(f"[yellow]⚠ Upload falhou, tentando de novo "
+                                f"({attempt + 1}/{retries}): {os.path.basename(file_path)}[/yellow]")
+
+            self._print(f"[red]✗ Erro no upload: {os.path.basename(file_path)} (task {task_id})[/red]")
+            return None, 0
+
+        if not uploads:
+            return []
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            outcomes = list(executor.map(upload, uploads))
+
+        elapsed = time.perf_counter() - started
+        results = [result for result, _ in outcomes]
+        sent = sum(1 for result in results if result is not None)
+        megabytes = sum(size for _, size in outcomes) / (1024 * 1024)
+        rate = megabytes / elapsed if elapsed > 0 else 0.0
+
+        color = "green" if sent == len(uploads) else "yellow"
+        self._print(f"[{color}]✓ {sent}/{len(uploads)} anexos enviados "
+                    f"({megabytes:.1f} MB em {elapsed:.1f}s, {rate:.2f} MB/s)[/{color}]")
 
-            except Exception as e:
-                print(f"[red]✗ Erro no upload: {str(e)}[/red]")
-                return None
+        return results
+
+    def _download_file(self, url: str, path: str, size: Optional[int] = None) -> Tuple[str, int]:
+        """
+        Baixa um arquivo em streaming para `path`.
+
+        O conteúdo é gravado em "<path>.part" em chunks de DOWNLOAD_CHUNK_SIZE
+        e renomeado só no fim. Se um .part existir (download interrompido),
+        continua de onde parou com o header Range; um .part inválido (Range
+        rejeitado com 416 ou tamanho final errado) é apagado e o download
+        recomeça do zero.
+
+        Args:
+            url: URL do arquivo (CDN do ClickUp)
+            path: Caminho final
+            size: Tamanho esperado em bytes (da API), se conhecido
+
+        Returns:
+            Tupla (status, bytes baixados): status "skipped", "downloaded" ou "failed"
+        """
+        if size is not None and os.path.exists(path) and os.path.getsize(path) == size:
+            return "skipped", 0
+
+        part_path = f"{path}.part"
+        received = 0
+
+        try:
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+            # Com .part, até 2 tentativas: Range rejeitado (416) ou tamanho final
+            # errado indicam um .part inválido, que é apagado e baixado do zero
+            while True:
+                headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+                # URL assinada fora da API: sem o token, mas pela mesma session (pool)
+                with self.session.get(url, headers=headers, stream=True,
+                                      timeout=self.DOWNLOAD_TIMEOUT) as response:
+                    if response.status_code == 416 and size is not None and offset == size:
+                        pass  # .part já estava completo
+                    elif response.status_code == 416 and offset:
+                        os.remove(part_path)
+                        offset = 0
+                        continue
+                    elif response.status_code >= 400:
+                        self._print(f"[red]✗ Erro {response.status_code} ao baixar: {os.path.basename(path)}[/red]")
+                        return "failed", received
+                    else:
+                        # 200 = servidor ignorou o Range: recomeça do zero
+                        mode = "ab" if response.status_code == 206 else "wb"
+
+                        with open(part_path, mode) as f:
+                            for chunk in response.iter_content(self.DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                                received += len(chunk)
+
+                if size is not None and os.path.getsize(part_path) != size:
+                    os.remove(part_path)
+                    if offset:
+                        offset = 0
+                        continue
+
+                    self._print(f"[red]✗ Download incompleto: {os.path.basename(path)}[/red]")
+                    return "failed", received
+
+                break
+
+            os.replace(part_path, path)
+
+        except (requests.RequestException, OSError) as e:
+            self._print(f"[red]✗ Erro ao baixar {os.path.basename(path)}: {str(e)}[/red]")
+            return "failed", received
+
+        return "downloaded", received
+
+    def download_attachments(
+        self,
+        task_ids: List[str],
+        dest_dir: str,
+        max_workers: int = 4
+    ) -> List[str]:
+        """
+        Baixa os anexos de várias tasks para o disco, em paralelo.
+
+        Os anexos são descobertos no payload de cada task e salvos em
+        dest_dir/<task_id>/<título>. Cada arquivo é gravado em streaming
+        (sem ficar inteiro em memória) pela session (pool de conexões).
+        Arquivos já presentes com o mesmo tamanho são pulados, e downloads
+        interrompidos continuam de onde pararam (arquivos .part).
+
+        Args:
+            task_ids: IDs das tasks
+            dest_dir: Diretório de destino
+            max_workers: Downloads simultâneos
+
+        Returns:
+            Caminhos locais dos anexos disponíveis (baixados ou já presentes)
+
+        Example:
+            >>> paths = client.download_attachments(["86a1", "86a2"], "arquivo/2024")
+            >>> print(f"{len(paths)} arquivos em disco")
+        """
+        def fetch_task(task_id: str) -> Optional[Dict]:
+            return self._request("GET", f"task/{task_id}")
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            downloads = []
+
+            for task_id, task in zip(task_ids, executor.map(fetch_task, task_ids)):
+                if not task:
+                    self._print(f"[red]✗ Task não encontrada: {task_id}[/red]")
+                    continue
+
+                task_dir = os.path.join(dest_dir, task_id)
+                seen = set()
+
+                for attachment in task.get("attachments") or []:
+                    url = attachment.get("url")
+                    if not url:
+                        continue
+
+                    title = attachment.get("title") or str(attachment.get("id"))
+                    name = title.replace("/", "_").replace(os.sep, "_").strip()
+                    # "", "." e ".." apontariam para um diretório
+                    if name in ("", ".", ".."):
+                        name = f"attachment-{attachment.get('id')}"
+                    if name in seen:
+                        name = f"{attachment.get('id')}-{name}"
+                    seen.add(name)
+
+                    size = str(attachment.get("size") or "")
+                    downloads.append((url, os.path.join(task_dir, name), int(size) if size.isdigit() else None))
+
+            for task_dir in {os.path.dirname(path) for _, path, _ in downloads}:
+                os.makedirs(task_dir, exist_ok=True)
+
+            outcomes = list(executor.map(lambda item: self._download_file(*item), downloads))
+
+        elapsed = time.perf_counter() - started
+        paths = [path for (_, path, _), (status, _) in zip(downloads, outcomes) if status != "failed"]
+        counts = {status: sum(1 for s, _ in outcomes if s == status)
+                  for status in ("downloaded", "skipped", "failed")}
+        megabytes = sum(received for _, received in outcomes) / (1024 * 1024)
+        rate = megabytes / elapsed if elapsed > 0 else 0.0
+
+        color = "green" if not counts["failed"] else "yellow"
+        self._print(f"[{color}]✓ {counts['downloaded']} anexos baixados, {counts['skipped']} já em disco, "
+                    f"{counts['failed']} falharam ({megabytes:.1f} MB em {elapsed:.1f}s, "
+                    f"{rate:.2f} MB/s)[/{color}]")
+
+        return paths
 
     # ================== D. CHECKLISTS ==================
 
@@ -1012,7 +2252,7 @@ class KaloiClickUpClient:
         result = self._request("POST", f"task/{task_id}/checklist", json=payload)
 
         if result:
-            print(f"[green]✓ Checklist criada: {name}[/green]")
+            self._print(f"[green]✓ Checklist criada: {name}[/green]")
 
         return result
 
@@ -1041,7 +2281,7 @@ class KaloiClickUpClient:
         result = self._request("POST", f"checklist/{checklist_id}/checklist_item", json=payload)
 
         if result:
-            print(f"[green]✓ Item adicionado: {name}[/green]")
+            self._print(f"[green]✓ Item adicionado: {name}[/green]")
 
         return result
 
@@ -1079,7 +2319,7 @@ class KaloiClickUpClient:
         result = self._request("DELETE", f"checklist/{checklist_id}")
 
         if result is not None:
-            print(f"[green]✓ Checklist deletado[/green]")
+            self._print(f"[green]✓ Checklist deletado[/green]")
             return True
 
         return False
@@ -1126,7 +2366,7 @@ class KaloiClickUpClient:
         result = self._request("POST", f"team/{tid}/goal", json=payload)
 
         if result:
-            print(f"[green]✓ Meta criada: {name}[/green]")
+            self._print(f"[green]✓ Meta criada: {name}[/green]")
 
         return result
 
@@ -1167,11 +2407,11 @@ class KaloiClickUpClient:
         Returns:
             dict com membros
         """
-        result = self._request("GET", f"list/{list_id}/member")
+        result = self._cached_request("list_members", f"list/{list_id}/member")
 
         if result:
             members = result.get("members", [])
-            print(f"[green]✓ {len(members)} membros encontrados[/green]")
+            self._print(f"[green]✓ {len(members)} membros encontrados[/green]")
 
         return result
 
@@ -1189,7 +2429,7 @@ class KaloiClickUpClient:
 
         if result:
             members = result.get("members", [])
-            print(f"[green]✓ {len(members)} membros encontrados[/green]")
+            self._print(f"[green]✓ {len(members)} membros encontrados[/green]")
 
         return result
 
@@ -1213,7 +2453,7 @@ class KaloiClickUpClient:
         result = self._request("PUT", f"task/{task_id}", json=payload)
 
         if result:
-            print(f"[green]✓ {len(user_ids)} assignees adicionados[/green]")
+            self._print(f"[green]✓ {len(user_ids)} assignees adicionados[/green]")
 
         return result
 
@@ -1276,7 +2516,7 @@ class KaloiClickUpClient:
 
         if result:
             webhook_id = result.get("id")
-            print(f"[green]✓ Webhook criado: {webhook_id}[/green]")
+            self._print(f"[green]✓ Webhook criado: {webhook_id}[/green]")
 
         return result
 
@@ -1306,7 +2546,7 @@ class KaloiClickUpClient:
         result = self._request("DELETE", f"webhook/{webhook_id}")
 
         if result is not None:
-            print(f"[green]✓ Webhook deletado[/green]")
+            self._print(f"[green]✓ Webhook deletado[/green]")
             return True
 
         return False
@@ -1327,7 +2567,7 @@ class KaloiClickUpClient:
 
         if result:
             views = result.get("views", [])
-            print(f"[green]✓ {len(views)} views encontradas[/green]")
+            self._print(f"[green]✓ {len(views)} views encontradas[/green]")
 
         return result
 
@@ -1363,7 +2603,7 @@ class KaloiClickUpClient:
 
         if result:
             tasks = result.get("tasks", [])
-            print(f"[green]✓ {len(tasks)} tasks na view[/green]")
+            self._print(f"[green]✓ {len(tasks)} tasks na view[/green]")
 
         return result
 
@@ -1402,7 +2642,7 @@ class KaloiClickUpClient:
         result = self._request("PUT", f"view/{view_id}", json=payload)
 
         if result:
-            print(f"[green]✓ View atualizada[/green]")
+            self._print(f"[green]✓ View atualizada[/green]")
 
         return result
 
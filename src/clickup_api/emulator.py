@@ -0,0 +1,939 @@
+# -*- coding: utf-8 -*-
+"""
+Emulador local da API v2 do ClickUp para testes offline de carga e latência.
+
+Servidor HTTP da stdlib (ThreadingHTTPServer) com um workspace sintético
+em memória e as rotas que o KaloiClickUpClient usa: hierarquia (team,
+space, folder, list), tasks com paginação e filtros, tags, comentários,
+custom fields, anexos, time entries, webhooks, views e membros.
+
+Também injeta latência (com jitter), rate limit com headers
+X-RateLimit-* e respostas 429, e erros 5xx aleatórios, para medir
+paginação paralela, rate limiter, circuit breaker etc. sem tocar em
+produção.
+
+Uso pela linha de comando:
+    python -m src.clickup_api.emulator --port 8765 --tasks-per-list 2000 --latency 80
+    export CLICKUP_BASE_URL=http://127.0.0.1:8765/api/v2
+    export CLICKUP_TEAM_ID=9000
+
+Uso em código (porta livre escolhida automaticamente):
+    with ClickUpEmulator(tasks_per_list=500, latency=0.05) as emulator:
+        os.environ["CLICKUP_BASE_URL"] = emulator.base_url
+        client = KaloiClickUpClient()
+        tasks = client.get_tasks(emulator.list_ids[0], paginate=True)
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+API_PREFIX = "/api/v2"
+PAGE_SIZE = 100
+
+STATUSES = [
+    {"status": "to do", "type": "open", "color": "#d3d3d3", "orderindex": 0},
+    {"status": "in progress", "type": "custom", "color": "#4194f6", "orderindex": 1},
+    {"status": "review", "type": "custom", "color": "#a875ff", "orderindex": 2},
+    {"status": "complete", "type": "closed", "color": "#6bc950", "orderindex": 3},
+]
+PRIORITIES = [None, "urgent", "high", "normal", "low"]
+TAGS = ["urgente", "cliente", "interno", "financeiro", "revisar", "bloqueado"]
+FIELD_TYPES = ["currency", "number", "drop_down", "date", "short_text"]
+
+DAY_MS = 24 * 3600 * 1000
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class WorkspaceState:
+    """Workspace sintético em memória (thread-safe via lock único)."""
+
+    def __init__(
+        self,
+        spaces: int = 2,
+        folders_per_space: int = 2,
+        lists_per_folder: int = 2,
+        tasks_per_list: int = 250,
+        fields_per_list: int = 4,
+        description_size: int = 200,
+        seed: int = 42
+    ):
+        self.lock = threading.Lock()
+        self._ids = count(1)
+        rng = random.Random(seed)
+
+        self.team_id = "9000"
+        self.user = {"id": 1, "username": "Emulador", "email": "emulador@example.com",
+                     "color": "#000000", "initials": "EM"}
+        self.members = [self.user] + [
+            {"id": i, "username": f"Membro {i}", "email": f"membro{i}@example.com"}
+            for i in range(2, 6)
+        ]
+
+        self.spaces: Dict[str, Dict] = {}
+        self.folders: Dict[str, Dict] = {}
+        self.lists: Dict[str, Dict] = {}
+        self.fields: Dict[str, List[Dict]] = {}
+        self.tasks: Dict[str, Dict] = {}
+        self.list_tasks: Dict[str, List[str]] = {}
+        self.comments: Dict[str, List[Dict]] = {}
+        self.files: Dict[str, bytes] = {}
+        self.time_entries: List[Dict] = []
+        self.running_timer: Optional[Dict] = None
+        self.webhooks: Dict[str, Dict] = {}
+        self.views: Dict[str, Dict] = {}
+
+        # Mudanças nas tasks invalidam os filtros memorizados (paginação
+        # pede a mesma busca uma vez por página)
+        self.version = 0
+        self._filtered: Dict[Any, Tuple[int, List[Dict]]] = {}
+
+        now = _now_ms()
+
+        for _ in range(spaces):
+            space_id = self.new_id()
+            self.spaces[space_id] = {"id": space_id, "name": f"Space {space_id}",
+                                     "private": False, "statuses": STATUSES}
+
+            for _ in range(folders_per_space):
+                folder_id = self.new_id()
+                self.folders[folder_id] = {"id": folder_id, "name": f"Folder {folder_id}",
+                                           "space": {"id": space_id}, "lists": []}
+
+                for _ in range(lists_per_folder):
+                    list_id = self.new_id()
+                    self.lists[list_id] = {"id": list_id, "name": f"List {list_id}",
+                                           "folder": {"id": folder_id}, "space": {"id": space_id},
+                                           "statuses": STATUSES}
+                    self.folders[folder_id]["lists"].append({"id": list_id})
+
+                    self.fields[list_id] = [
+                        {"id": f"cf-{list_id}-{i}", "name": f"Campo {i}",
+                         "type": FIELD_TYPES[i % len(FIELD_TYPES)], "type_config": {}}
+                        for i in range(fields_per_list)
+                    ]
+                    self.views[f"view-{list_id}"] = {"id": f"view-{list_id}", "name": "Lista",
+                                                     "type": "list", "parent": {"id": list_id, "type": 6}}
+                    self.list_tasks[list_id] = []
+
+                    for _ in range(tasks_per_list):
+                        self._seed_task(rng, list_id, now, description_size)
+
+    def new_id(self) -> str:
+        return str(next(self._ids))
+
+    def _seed_task(self, rng: random.Random, list_id: str, now: int, description_size: int):
+        status = rng.choices(STATUSES, weights=[4, 3, 2, 1])[0]
+        priority = rng.randrange(len(PRIORITIES))
+        created = now - rng.randrange(365) * DAY_MS
+        due = now + rng.randrange(-30, 90) * DAY_MS if rng.random() < 0.8 else None
+
+        fields = []
+        for field in self.fields[list_id]:
+            value = None
+            if rng.random() < 0.7:
+                value = {"currency": round(rng.uniform(100, 100000), 2),
+                         "number": rng.randrange(1000),
+                         "drop_down": rng.randrange(4),
+                         "date": str(now + rng.randrange(-30, 90) * DAY_MS),
+                         "short_text": f"texto {rng.randrange(1000)}"}[field["type"]]
+            fields.append({**field, "value": value})
+
+        task = self.create_task(list_id, {
+            "name": f"Task {rng.randrange(10**6)}",
+            "description": "x" * rng.randrange(description_size + 1),
+            "status": status["status"],
+            "priority": priority or None,
+            "due_date": due,
+            "tags": rng.sample(TAGS, rng.randrange(3)),
+        })
+        task["date_created"] = task["date_updated"] = str(created)
+        task["custom_fields"] = fields
+
+    # ================== TASKS ==================
+
+    def create_task(self, list_id: str, data: Dict[str, Any]) -> Dict:
+        task_id = f"t{self.new_id()}"
+        lst = self.lists[list_id]
+        now = str(_now_ms())
+
+        task = {
+            "id": task_id,
+            "custom_id": None,
+            "name": data.get("name", "Nova task"),
+            "text_content": data.get("description", ""),
+            "description": data.get("description", ""),
+            "status": self._status(data.get("status")),
+            "orderindex": str(len(self.list_tasks[list_id])),
+            "date_created": now,
+            "date_updated": now,
+            "date_closed": None,
+            "archived": False,
+            "creator": self.user,
+            "assignees": [m for m in self.members if m["id"] in (data.get("assignees") or [])],
+            "watchers": [],
+            "checklists": [],
+            "tags": [{"name": tag} for tag in data.get("tags") or []],
+            "parent": None,
+            "priority": self._priority(data.get("priority")),
+            "due_date": str(data["due_date"]) if data.get("due_date") else None,
+            "start_date": str(data["start_date"]) if data.get("start_date") else None,
+            "time_estimate": data.get("time_estimate"),
+            "custom_fields": [{**field, "value": None} for field in self.fields[list_id]],
+            "attachments": [],
+            "list": {"id": list_id, "name": lst["name"]},
+            "folder": {"id": lst["folder"]["id"]},
+            "space": {"id": lst["space"]["id"]},
+            "url": f"https://app.clickup.com/t/{task_id}",
+        }
+
+        self.tasks[task_id] = task
+        self.list_tasks[list_id].append(task_id)
+        self.version += 1
+        return task
+
+    def update_task(self, task: Dict, data: Dict[str, Any]):
+        for key in ("name", "description", "time_estimate"):
+            if key in data:
+                task[key] = data[key]
+        if "status" in data:
+            task["status"] = self._status(data["status"])
+            task["date_closed"] = str(_now_ms()) if task["status"]["type"] == "closed" else None
+        if "priority" in data:
+            task["priority"] = self._priority(data["priority"])
+        for key in ("due_date", "start_date"):
+            if key in data:
+                task[key] = str(data[key]) if data[key] else None
+        if "archived" in data:
+            task["archived"] = bool(data["archived"])
+        self.touch(task)
+
+    def touch(self, task: Dict):
+        task["date_updated"] = str(_now_ms())
+        self.version += 1
+
+    @staticmethod
+    def _status(name: Optional[str]) -> Dict:
+        for status in STATUSES:
+            if status["status"] == (name or "to do"):
+                return dict(status)
+        return {"status": name, "type": "custom", "color": "#000000", "orderindex": 9}
+
+    @staticmethod
+    def _priority(value: Any) -> Optional[Dict]:
+        try:
+            level = int(value)
+        except (TypeError, ValueError):
+            return None
+        if not 1 <= level <= 4:
+            return None
+        return {"id": str(level), "priority": PRIORITIES[level]}
+
+    def filter_tasks(self, task_ids: List[str], query: Dict[str, List[str]],
+                     scope: Any = None) -> List[Dict]:
+        """
+        Aplica os filtros de GET list/{id}/task e team/{id}/task.
+
+        Com `scope`, o resultado fica memorizado (por escopo e filtros, sem
+        a página) até a próxima mudança nas tasks.
+        """
+        if scope is not None:
+            key = (scope, tuple(sorted((k, tuple(v)) for k, v in query.items() if k != "page")))
+            cached = self._filtered.get(key)
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+            result = self.filter_tasks(task_ids, query)
+            self._filtered[key] = (self.version, result)
+            return result
+
+        def first(key: str) -> Optional[str]:
+            values = query.get(key)
+            return values[0] if values else None
+
+        archived = (first("archived") or "").lower() == "true"
+        include_closed = (first("include_closed") or "").lower() == "true"
+        statuses = set(query.get("statuses[]", []))
+        tags = set(query.get("tags[]", []))
+        assignees = set(query.get("assignees[]", []))
+        ranges = [
+            (key[:-3], key.endswith("_gt"), int(first(key)))
+            for key in ("due_date_gt", "due_date_lt", "date_created_gt", "date_created_lt",
+                        "date_updated_gt", "date_updated_lt", "date_done_gt", "date_done_lt")
+            if first(key) and first(key).lstrip("-").isdigit()
+        ]
+
+        result = []
+        for task_id in task_ids:
+            task = self.tasks.get(task_id)
+            if task is None or task["archived"] != archived:
+                continue
+            if not include_closed and task["status"]["type"] == "closed":
+                continue
+            if statuses and task["status"]["status"] not in statuses:
+                continue
+            if tags and not tags & {tag["name"] for tag in task["tags"]}:
+                continue
+            if assignees and not assignees & {str(m["id"]) for m in task["assignees"]}:
+                continue
+
+            matches = True
+            for field, greater, limit in ranges:
+                value = task.get("date_closed" if field == "date_done" else field)
+                if value is None or (int(value) <= limit if greater else int(value) >= limit):
+                    matches = False
+                    break
+
+            if matches:
+                result.append(task)
+
+        return result
+
+
+class ClickUpEmulator:
+    """
+    Servidor local que emula a API v2 do ClickUp.
+
+    Exemplo de uso:
+        emulator = ClickUpEmulator(tasks_per_list=1000, latency=0.08, rate_limit=100)
+        emulator.start()
+        print(emulator.base_url)   # http://127.0.0.1:54321/api/v2
+        ...
+        emulator.stop()
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: int = 42,
+        **workspace
+    ):
+        """
+        Args:
+            host: Interface de escuta
+            port: Porta (0 = porta livre automática)
+            latency: Latência base por requisição, em segundos
+            jitter: Variação aleatória (+/-) somada à latência, em segundos
+            rate_limit: Requisições por minuto por token (None = sem limite).
+                Acima disso responde 429 com headers X-RateLimit-*
+            error_rate: Fração de requisições respondidas com 503 (0-1)
+            seed: Semente do workspace sintético e das falhas injetadas
+            **workspace: Tamanho do workspace (ver WorkspaceState: spaces,
+                folders_per_space, lists_per_folder, tasks_per_list, ...)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.state = WorkspaceState(seed=seed, **workspace)
+
+        self._rng = random.Random(seed)
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        self._windows_lock = threading.Lock()
+        self.requests = 0
+
+        self.server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    @property
+    def team_id(self) -> str:
+        return self.state.team_id
+
+    @property
+    def list_ids(self) -> List[str]:
+        return list(self.state.lists)
+
+    def start(self) -> "ClickUpEmulator":
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        name="clickup-emulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "ClickUpEmulator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ================== INJEÇÃO DE LATÊNCIA / LIMITES ==================
+
+    def _delay(self):
+        if self.latency or self.jitter:
+            time.sleep(max(self.latency + self._rng.uniform(-self.jitter, self.jitter), 0.0))
+
+    def _check_rate_limit(self, token: str) -> Tuple[bool, Dict[str, str]]:
+        """Janela fixa de 60s por token. Retorna (permitido, headers)."""
+        if not self.rate_limit:
+            return True, {}
+
+        now = time.time()
+        with self._windows_lock:
+            started, used = self._windows.get(token, (now, 0))
+            if now - started >= 60:
+                started, used = now, 0
+            used += 1
+            self._windows[token] = (started, used)
+
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(self.rate_limit - used, 0)),
+            "X-RateLimit-Reset": str(int(started + 60)),
+        }
+        return used <= self.rate_limit, headers
+
+    def _should_fail(self) -> bool:
+        return self.error_rate > 0 and self._rng.random() < self.error_rate
+
+    def dispatch(self, method: str, path: str, query: Dict[str, List[str]],
+                 body: Any, raw_body: bytes, headers) -> Tuple[int, Any]:
+        return dispatch(self.state, method, path, query, body, raw_body, headers)
+
+
+def dispatch(state: WorkspaceState, method: str, path: str, query: Dict[str, List[str]],
+             body: Any, raw_body: bytes, headers) -> Tuple[int, Any]:
+    """
+    Roteia uma requisição para o workspace, sem HTTP.
+
+    Usado pelo servidor e por transports em memória (ex: benchmarks).
+
+    Args:
+        state: Workspace emulado
+        method: Método HTTP
+        path: Caminho sem o prefixo /api/v2 (ex: "list/123/task")
+        query: Query string já decodificada (parse_qs)
+        body: Corpo JSON decodificado (ou None)
+        raw_body: Corpo bruto (uploads multipart)
+        headers: Headers da requisição
+
+    Returns:
+        (status, payload JSON ou bytes)
+    """
+    for route_method, pattern, handler in ROUTES:
+        if route_method != method:
+            continue
+        match = pattern.fullmatch(path)
+        if match:
+            with state.lock:
+                return handler(state, *map(unquote, match.groups()),
+                               query=query, body=body, raw_body=raw_body, headers=headers)
+
+    return 404, {"err": f"Rota não emulada: {method} {path}", "ECODE": "EMU_404"}
+
+
+def _page(tasks: List[Dict], query: Dict[str, List[str]]) -> Dict:
+    page = int((query.get("page") or ["0"])[0])
+    chunk = tasks[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+    return {"tasks": chunk, "last_page": (page + 1) * PAGE_SIZE >= len(tasks)}
+
+
+def _task_or_404(state: WorkspaceState, task_id: str):
+    task = state.tasks.get(task_id)
+    if task is None:
+        return None, (404, {"err": "Task not found", "ECODE": "ITEM_013"})
+    return task, None
+
+
+def _get_team(state, **_):
+    return 200, {"teams": [{"id": state.team_id, "name": "Workspace Emulado",
+                            "members": [{"user": m} for m in state.members]}]}
+
+
+def _get_user(state, **_):
+    return 200, {"user": state.user}
+
+
+def _get_spaces(state, team_id, **_):
+    return 200, {"spaces": list(state.spaces.values())}
+
+
+def _get_space(state, space_id, **_):
+    space = state.spaces.get(space_id)
+    return (200, space) if space else (404, {"err": "Space not found"})
+
+
+def _get_folders(state, space_id, **_):
+    return 200, {"folders": [f for f in state.folders.values() if f["space"]["id"] == space_id]}
+
+
+def _get_folder(state, folder_id, **_):
+    folder = state.folders.get(folder_id)
+    return (200, folder) if folder else (404, {"err": "Folder not found"})
+
+
+def _get_lists(state, folder_id, **_):
+    return 200, {"lists": [l for l in state.lists.values() if l["folder"]["id"] == folder_id]}
+
+
+def _get_folderless_lists(state, space_id, **_):
+    return 200, {"lists": []}
+
+
+def _get_list(state, list_id, **_):
+    lst = state.lists.get(list_id)
+    return (200, lst) if lst else (404, {"err": "List not found"})
+
+
+def _get_fields(state, list_id, **_):
+    return 200, {"fields": state.fields.get(list_id, [])}
+
+
+def _get_members(state, _id, **_):
+    return 200, {"members": state.members}
+
+
+def _get_list_tasks(state, list_id, query, **_):
+    if list_id not in state.lists:
+        return 404, {"err": "List not found"}
+    tasks = state.filter_tasks(state.list_tasks[list_id], query, scope=("list", list_id))
+    return 200, _page(tasks, query)
+
+
+def _get_team_tasks(state, team_id, query, **_):
+    list_ids = set(query.get("list_ids[]", []))
+    space_ids = set(query.get("space_ids[]", []))
+    folder_ids = set(query.get("project_ids[]", []))
+
+    task_ids = [
+        task_id
+        for list_id, lst in state.lists.items()
+        if (not list_ids or list_id in list_ids)
+        and (not space_ids or lst["space"]["id"] in space_ids)
+        and (not folder_ids or lst["folder"]["id"] in folder_ids)
+        for task_id in state.list_tasks[list_id]
+    ]
+    return 200, _page(state.filter_tasks(task_ids, query, scope=("team", team_id)), query)
+
+
+def _create_task(state, list_id, body, **_):
+    if list_id not in state.lists:
+        return 404, {"err": "List not found"}
+    return 200, state.create_task(list_id, body or {})
+
+
+def _get_task(state, task_id, **_):
+    task, error = _task_or_404(state, task_id)
+    return error or (200, task)
+
+
+def _update_task(state, task_id, body, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+    state.update_task(task, body or {})
+    return 200, task
+
+
+def _delete_task(state, task_id, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+    del state.tasks[task_id]
+    state.list_tasks[task["list"]["id"]].remove(task_id)
+    state.version += 1
+    return 204, {}
+
+
+def _add_tag(state, task_id, tag_name, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+    if tag_name not in {tag["name"] for tag in task["tags"]}:
+        task["tags"].append({"name": tag_name})
+        state.touch(task)
+    return 200, {}
+
+
+def _remove_tag(state, task_id, tag_name, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+    task["tags"] = [tag for tag in task["tags"] if tag["name"] != tag_name]
+    state.touch(task)
+    return 200, {}
+
+
+def _get_comments(state, task_id, **_):
+    task, error = _task_or_404(state, task_id)
+    return error or (200, {"comments": state.comments.get(task_id, [])})
+
+
+def _post_comment(state, task_id, body, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+    comment = {"id": state.new_id(), "hist_id": state.new_id(), "date": _now_ms(),
+               "comment_text": (body or {}).get("comment_text", ""), "user": state.user}
+    state.comments.setdefault(task_id, []).append(comment)
+    return 200, {"id": comment["id"], "hist_id": comment["hist_id"], "date": comment["date"]}
+
+
+def _set_field(state, task_id, field_id, body, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+    for field in task["custom_fields"]:
+        if field["id"] == field_id:
+            field["value"] = (body or {}).get("value")
+            state.touch(task)
+            return 200, {}
+    return 400, {"err": "Custom field not found", "ECODE": "FIELD_002"}
+
+
+def _remove_field(state, task_id, field_id, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+    for field in task["custom_fields"]:
+        if field["id"] == field_id:
+            field["value"] = None
+            state.touch(task)
+    return 200, {}
+
+
+def _upload_attachment(state, task_id, raw_body, headers, **_):
+    task, error = _task_or_404(state, task_id)
+    if error:
+        return error
+
+    match = re.search(rb'filename="([^"]*)"\r\n(?:[^\r\n]*\r\n)*\r\n', raw_body)
+    boundary = (headers.get("Content-Type") or "").partition("boundary=")[2].encode()
+    if not match or not boundary:
+        return 400, {"err": "Multipart inválido"}
+
+    content = raw_body[match.end():raw_body.rfind(b"\r\n--" + boundary)]
+    attachment_id = state.new_id()
+    state.files[attachment_id] = content
+
+    attachment = {"id": attachment_id, "title": match.group(1).decode("utf-8"),
+                  "size": len(content), "date": str(_now_ms()),
+                  "url": f"{headers.get('X-Emulator-Origin', '')}/_files/{attachment_id}"}
+    task["attachments"].append(attachment)
+    state.touch(task)
+    return 200, attachment
+
+
+def _download_file(state, file_id, headers, **_):
+    content = state.files.get(file_id)
+    if content is None:
+        return 404, {"err": "File not found"}
+
+    match = re.fullmatch(r"bytes=(\d+)-", headers.get("Range") or "")
+    if match:
+        start = int(match.group(1))
+        if start >= len(content):
+            return 416, b""
+        return 206, content[start:]
+    return 200, content
+
+
+def _get_time_entries(state, team_id, query, **_):
+    entries = state.time_entries
+    task_id = (query.get("task_id") or [None])[0]
+    if task_id:
+        entries = [e for e in entries if e.get("task", {}).get("id") == task_id]
+    return 200, {"data": entries}
+
+
+def _create_time_entry(state, team_id, body, **_):
+    body = body or {}
+    entry = {"id": state.new_id(), "user": state.user, "billable": body.get("billable", False),
+             "start": str(body.get("start", _now_ms())), "duration": str(body.get("duration", 0)),
+             "description": body.get("description", ""),
+             "task": {"id": body.get("tid")} if body.get("tid") else {}}
+    state.time_entries.append(entry)
+    return 200, {"data": entry}
+
+
+def _start_timer(state, team_id, body, **_):
+    body = body or {}
+    state.running_timer = {"id": state.new_id(), "user": state.user, "start": str(_now_ms()),
+                           "duration": "-1", "description": body.get("description", ""),
+                           "task": {"id": body.get("tid")} if body.get("tid") else {}}
+    return 200, {"data": state.running_timer}
+
+
+def _stop_timer(state, team_id, **_):
+    timer = state.running_timer
+    if timer is None:
+        return 400, {"err": "No timer running", "ECODE": "TIMER_001"}
+    timer["duration"] = str(_now_ms() - int(timer["start"]))
+    state.time_entries.append(timer)
+    state.running_timer = None
+    return 200, {"data": timer, "duration": timer["duration"]}
+
+
+def _current_timer(state, team_id, **_):
+    return 200, {"data": state.running_timer}
+
+
+def _update_time_entry(state, team_id, entry_id, body, **_):
+    for entry in state.time_entries:
+        if entry["id"] == entry_id:
+            entry.update({k: str(v) if k in ("start", "duration") else v
+                          for k, v in (body or {}).items()})
+            return 200, {"data": [entry]}
+    return 404, {"err": "Time entry not found"}
+
+
+def _delete_time_entry(state, team_id, entry_id, **_):
+    state.time_entries = [e for e in state.time_entries if e["id"] != entry_id]
+    return 200, {"data": {"id": entry_id}}
+
+
+def _get_webhooks(state, team_id, **_):
+    return 200, {"webhooks": list(state.webhooks.values())}
+
+
+def _create_webhook(state, team_id, body, **_):
+    body = body or {}
+    webhook_id = f"wh-{state.new_id()}"
+    webhook = {"id": webhook_id, "userid": state.user["id"], "team_id": team_id,
+               "endpoint": body.get("endpoint"), "events": body.get("events", []),
+               "health": {"status": "active", "fail_count": 0}, "secret": "emulador"}
+    state.webhooks[webhook_id] = webhook
+    return 200, {"id": webhook_id, "webhook": webhook}
+
+
+def _update_webhook(state, webhook_id, body, **_):
+    webhook = state.webhooks.get(webhook_id)
+    if webhook is None:
+        return 404, {"err": "Webhook not found"}
+    webhook.update(body or {})
+    return 200, {"id": webhook_id, "webhook": webhook}
+
+
+def _delete_webhook(state, webhook_id, **_):
+    state.webhooks.pop(webhook_id, None)
+    return 200, {}
+
+
+def _get_views(state, list_id, **_):
+    return 200, {"views": [v for v in state.views.values() if v["parent"]["id"] == list_id]}
+
+
+def _get_view(state, view_id, **_):
+    view = state.views.get(view_id)
+    return (200, {"view": view}) if view else (404, {"err": "View not found"})
+
+
+def _update_view(state, view_id, body, **_):
+    view = state.views.get(view_id)
+    if view is None:
+        return 404, {"err": "View not found"}
+    view.update(body or {})
+    return 200, {"view": view}
+
+
+def _get_view_tasks(state, view_id, query, **_):
+    view = state.views.get(view_id)
+    if view is None:
+        return 404, {"err": "View not found"}
+    list_id = view["parent"]["id"]
+    return 200, _page(state.filter_tasks(state.list_tasks[list_id], {"include_closed": ["true"]},
+                                         scope=("view", view_id)), query)
+
+
+def _route(method: str, pattern: str, handler) -> Tuple[str, "re.Pattern", Any]:
+    return method, re.compile(pattern.replace("{}", "([^/]+)")), handler
+
+
+ROUTES = [
+    _route("GET", "team", _get_team),
+    _route("GET", "user", _get_user),
+    _route("GET", "team/{}/space", _get_spaces),
+    _route("GET", "space/{}", _get_space),
+    _route("GET", "space/{}/folder", _get_folders),
+    _route("GET", "space/{}/list", _get_folderless_lists),
+    _route("GET", "folder/{}", _get_folder),
+    _route("GET", "folder/{}/list", _get_lists),
+    _route("GET", "list/{}", _get_list),
+    _route("GET", "list/{}/field", _get_fields),
+    _route("GET", "list/{}/member", _get_members),
+    _route("GET", "list/{}/task", _get_list_tasks),
+    _route("POST", "list/{}/task", _create_task),
+    _route("GET", "list/{}/view", _get_views),
+    _route("GET", "team/{}/task", _get_team_tasks),
+    _route("GET", "task/{}", _get_task),
+    _route("PUT", "task/{}", _update_task),
+    _route("DELETE", "task/{}", _delete_task),
+    _route("GET", "task/{}/member", _get_members),
+    _route("POST", "task/{}/tag/{}", _add_tag),
+    _route("DELETE", "task/{}/tag/{}", _remove_tag),
+    _route("GET", "task/{}/comment", _get_comments),
+    _route("POST", "task/{}/comment", _post_comment),
+    _route("POST", "task/{}/field/{}", _set_field),
+    _route("DELETE", "task/{}/field/{}", _remove_field),
+    _route("POST", "task/{}/attachment", _upload_attachment),
+    _route("GET", "_files/{}", _download_file),
+    _route("GET", "team/{}/time_entries", _get_time_entries),
+    _route("POST", "team/{}/time_entries", _create_time_entry),
+    _route("POST", "team/{}/time_entries/start", _start_timer),
+    _route("POST", "team/{}/time_entries/stop", _stop_timer),
+    _route("GET", "team/{}/time_entries/current", _current_timer),
+    _route("PUT", "team/{}/time_entries/{}", _update_time_entry),
+    _route("DELETE", "team/{}/time_entries/{}", _delete_time_entry),
+    _route("GET", "team/{}/webhook", _get_webhooks),
+    _route("POST", "team/{}/webhook", _create_webhook),
+    _route("PUT", "webhook/{}", _update_webhook),
+    _route("DELETE", "webhook/{}", _delete_webhook),
+    _route("GET", "view/{}", _get_view),
+    _route("PUT", "view/{}", _update_view),
+    _route("GET", "view/{}/task", _get_view_tasks),
+]
+
+
+def _make_handler(emulator: ClickUpEmulator):
+    """Cria a classe de handler HTTP ligada a um emulador."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        server_version = "ClickUpEmulator/1.0"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _handle(self, method: str):
+            url = urlsplit(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+
+            emulator.requests += 1
+            emulator._delay()
+
+            allowed, limit_headers = emulator._check_rate_limit(self.headers.get("Authorization") or "")
+
+            if not allowed:
+                status, payload = 429, {"err": "Rate limit reached", "ECODE": "APP_002"}
+            elif emulator._should_fail():
+                status, payload = 503, {"err": "Service unavailable (injetado)", "ECODE": "EMU_503"}
+            elif url.path.startswith("/_files/"):
+                status, payload = emulator.dispatch(method, url.path.strip("/"), {}, None,
+                                                    raw_body, self.headers)
+            elif not url.path.startswith(API_PREFIX + "/"):
+                status, payload = 404, {"err": "Use o prefixo /api/v2"}
+            else:
+                body = None
+                if raw_body and "json" in (self.headers.get("Content-Type") or ""):
+                    try:
+                        body = json.loads(raw_body)
+                    except ValueError:
+                        status, payload = 400, {"err": "JSON inválido"}
+                        return self._reply(status, payload, limit_headers)
+
+                headers = dict(self.headers.items())
+                headers["X-Emulator-Origin"] = f"http://{self.headers.get('Host')}"
+                status, payload = emulator.dispatch(
+                    method,
+                    url.path[len(API_PREFIX) + 1:].strip("/"),
+                    parse_qs(url.query),
+                    body,
+                    raw_body,
+                    headers,
+                )
+
+            self._reply(status, payload, limit_headers)
+
+        def _reply(self, status: int, payload: Any, extra_headers: Dict[str, str]):
+            if isinstance(payload, bytes):
+                data, content_type = payload, "application/octet-stream"
+            else:
+                data, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+
+            if status == 204:
+                data = b""
+
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in extra_headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PUT(self):
+            self._handle("PUT")
+
+        def do_DELETE(self):
+            self._handle("DELETE")
+
+    return Handler
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Emulador local da API v2 do ClickUp")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--spaces", type=int, default=2)
+    parser.add_argument("--folders-per-space", type=int, default=2)
+    parser.add_argument("--lists-per-folder", type=int, default=2)
+    parser.add_argument("--tasks-per-list", type=int, default=250)
+    parser.add_argument("--description-size", type=int, default=200,
+                        help="Tamanho máximo da descrição das tasks (caracteres)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latência base em ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Variação da latência em ms")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Requisições/min por token")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fração de respostas 503")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    emulator = ClickUpEmulator(
+        host=args.host,
+        port=args.port,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        spaces=args.spaces,
+        folders_per_space=args.folders_per_space,
+        lists_per_folder=args.lists_per_folder,
+        tasks_per_list=args.tasks_per_list,
+        description_size=args.description_size,
+    )
+
+    print(f"Emulador ClickUp: {len(emulator.state.tasks)} tasks em {len(emulator.list_ids)} listas")
+    print(f"  export CLICKUP_BASE_URL={emulator.base_url}")
+    print(f"  export CLICKUP_TEAM_ID={emulator.team_id}")
+    print(f"  Listas: {', '.join(emulator.list_ids)}")
+
+    try:
+        emulator.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,39 +4,210 @@ Utilitários para parsing de datas em linguagem natural.
 
 Substitui o Pendulum usando dateparser (compatível com Python 3.13).
 Suporta datas em português e inglês.
+
+O dateparser só é importado no primeiro texto livre (o import sozinho leva
+uma fração de segundo), então importar este módulo, e o cliente, é barato.
+
+Os resultados ficam num memo LRU (ver date_cache_info / clear_date_cache):
+datas absolutas valem para sempre, expressões relativas ao dia
+("próxima segunda") valem só no dia em que foram calculadas, e
+deslocamentos a partir de agora ("amanhã", "in 3 days") guardam o
+deslocamento e são reaplicados ao horário atual. Deslocamentos de mês/ano
+("next month", "in 2 years") variam de tamanho e são sempre recalculados.
 """
 
-import dateparser
+from array import array
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Union, Optional
+from typing import Any, Dict, Hashable, Iterable, List, Tuple, Union, Optional
 import re
-
-
-def _get_next_weekday(target_day: str) -> datetime:
+import threading
+
+
+WEEKDAYS = {
+    'monday': 0,
+    'tuesday': 1,
+    'wednesday': 2,
+    'thursday': 3,
+    'friday': 4,
+    'saturday': 5,
+    'sunday': 6
+}
+
+# Mapeamento de traduções PT -> EN aplicado antes do parsing
+PT_TO_EN = {
+    # Dias da semana
+    'segunda': 'monday',
+    'segunda-feira': 'monday',
+    'segunda feira': 'monday',
+    'terça': 'tuesday',
+    'terça-feira': 'tuesday',
+    'terça feira': 'tuesday',
+    'quarta': 'wednesday',
+    'quarta-feira': 'wednesday',
+    'quarta feira': 'wednesday',
+    'quinta': 'thursday',
+    'quinta-feira': 'thursday',
+    'quinta feira': 'thursday',
+    'sexta': 'friday',
+    'sexta-feira': 'friday',
+    'sexta feira': 'friday',
+    'sábado': 'saturday',
+    'sabado': 'saturday',
+    'domingo': 'sunday',
+
+    # Temporais
+    'próxima': 'next',
+    'proxima': 'next',
+    'próximo': 'next',
+    'proximo': 'next',
+    'que vem': 'next',
+    'amanhã': 'tomorrow',
+    'amanha': 'tomorrow',
+    'hoje': 'today',
+    'ontem': 'yesterday',
+}
+
+# Todas as traduções numa única passada: alternação da chave mais longa
+# para a mais curta ("segunda-feira" antes de "segunda"), só palavras inteiras
+_PT_TO_EN_RE = re.compile(
+    r'(?<!\w)(' + '|'.join(re.escape(pt) for pt in sorted(PT_TO_EN, key=len, reverse=True)) + r')(?!\w)'
+)
+
+_WEEKDAY_NAMES = '|'.join(WEEKDAYS)
+_NEXT_WEEKDAY_RE = re.compile(rf'\bnext\s+({_WEEKDAY_NAMES})\b|\b({_WEEKDAY_NAMES})\s+next\b')
+
+# Formatos fixos resolvidos sem o dateparser
+_ISO_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[t ](\d{2}):(\d{2})(?::(\d{2}))?)?')
+_DMY_RE = re.compile(r'(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})')
+_RELATIVE_DAYS = {'today': 0, 'tomorrow': 1, 'yesterday': -1}
+
+# Formatos uniformes do parsing em lote: epoch | ISO | DD/MM/YYYY
+_UNIFORM_RE = re.compile(
+    r'(-?\d+)'
+    r'|(\d{4})-(\d{2})-(\d{2})(?:[t ](\d{2}):(\d{2})(?::(\d{2}))?)?'
+    r'|(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})'
+)
+
+# Mapeamento de escalas de tempo (durações)
+DURATION_SCALES = {
+    # Inglês
+    "second": 1,
+    "seconds": 1,
+    "sec": 1,
+    "secs": 1,
+    "minute": 60,
+    "minutes": 60,
+    "min": 60,
+    "mins": 60,
+    "hour": 3600,
+    "hours": 3600,
+    "hr": 3600,
+    "hrs": 3600,
+    "day": 86400,
+    "days": 86400,
+    "week": 604800,
+    "weeks": 604800,
+    "month": 2592000,  # 30 dias
+    "months": 2592000,
+    "year": 31536000,  # 365 dias
+    "years": 31536000,
+
+    # Português
+    "segundo": 1,
+    "segundos": 1,
+    "seg": 1,
+    "minuto": 60,
+    "minutos": 60,
+    "hora": 3600,
+    "horas": 3600,
+    "dia": 86400,
+    "dias": 86400,
+    "semana": 604800,
+    "semanas": 604800,
+    "mês": 2592000,
+    "meses": 2592000,
+    "ano": 31536000,
+    "anos": 31536000,
+}
+
+# Tipos de resultado, que definem por quanto tempo o memo vale
+_ABSOLUTE = "absolute"          # "2024-12-01": sempre o mesmo
+_DAY_RELATIVE = "day"           # "próxima segunda": muda com o dia
+_NOW_RELATIVE = "now"           # "amanhã", "in 3 days": agora + deslocamento
+_UNCACHED = "uncached"          # "next month", "in 2 years": sem memo
+
+# Deslocamentos de calendário (mês/ano) não são um timedelta fixo:
+# "in 1 month" vale 28 a 31 dias conforme o dia em que é calculado
+_CALENDAR_OFFSET_RE = re.compile(r'(?<!\w)(months?|years?|decades?|mês|meses|anos?)(?!\w)')
+
+# Entradas de cada memo LRU
+DATE_CACHE_SIZE = 2048
+
+
+class _ParseCache:
+    """Memo LRU limitado e thread-safe, com contadores de acertos."""
+
+    def __init__(self, maxsize: int = DATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._data), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_UNIX_CACHE = _ParseCache()
+_SECONDS_CACHE = _ParseCache()
+
+
+def _get_next_weekday(target_day: str, today: Optional[datetime] = None) -> datetime:
     """
     Retorna a próxima ocorrência de um dia da semana.
 
     Args:
         target_day: Nome do dia da semana em inglês (monday, tuesday, etc.)
+        today: Data de referência (padrão: agora)
 
     Returns:
         datetime da próxima ocorrência desse dia
     """
-    weekdays = {
-        'monday': 0,
-        'tuesday': 1,
-        'wednesday': 2,
-        'thursday': 3,
-        'friday': 4,
-        'saturday': 5,
-        'sunday': 6
-    }
-
-    if target_day.lower() not in weekdays:
+    if target_day.lower() not in WEEKDAYS:
         return None
 
-    today = datetime.now()
-    target_weekday = weekdays[target_day.lower()]
+    today = today or datetime.now()
+    target_weekday = WEEKDAYS[target_day.lower()]
     current_weekday = today.weekday()
 
     # Calcula quantos dias até o próximo target_day
@@ -49,19 +220,62 @@ def _get_next_weekday(target_day: str) -> datetime:
     return next_date.replace(hour=0, minute=0, second=0, microsecond=0)
 
 
+def _translate_pt(text: str) -> str:
+    """Traduz os termos em português (texto já em minúsculas) para inglês."""
+    return _PT_TO_EN_RE.sub(lambda match: PT_TO_EN[match.group(1)], text)
+
+
+def _parse_fixed_format(text: str) -> Optional[datetime]:
+    """
+    Parsing rápido de formatos fixos, sem o dateparser.
+
+    - ISO sem fuso: "2024-12-01", "2024-12-01T10:30", "2024-12-01 10:30:00"
+    - DD/MM/YYYY (também com "-" ou "."): "31/12/2024", "05.03.2025"
+
+    Args:
+        text: Data em minúsculas e sem espaços nas pontas
+
+    Returns:
+        datetime local, ou None se não for um desses formatos (ou for uma
+        data inválida, ex: "12/31/2024", que segue para o dateparser)
+    """
+    match = _ISO_RE.fullmatch(text)
+    if match:
+        year, month, day, hour, minute, second = (int(g) if g else 0 for g in match.groups())
+        try:
+            return datetime(year, month, day, hour, minute, second)
+        except ValueError:
+            return None
+
+    match = _DMY_RE.fullmatch(text)
+    if match:
+        day, month, year = (int(g) for g in match.groups())
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            return None
+
+    return None
+
+
 def fuzzy_time_to_unix(text: Union[str, int]) -> int:
     """
     Converte data em linguagem natural para Unix timestamp (milissegundos).
 
     Compatível com ClickUp API que espera timestamps em milissegundos.
 
+    Formatos fixos (ISO, DD/MM/YYYY), "hoje"/"amanhã"/"ontem" e
+    "próxima <dia da semana>" são resolvidos direto; o dateparser só é
+    usado para texto livre.
+
     Args:
         text: Data em formato legível ou timestamp Unix
 
     Suporta:
         - Linguagem natural: "tomorrow", "next week", "december 1st", "next monday"
         - Português: "amanhã", "próxima semana", "1 de dezembro", "próxima segunda"
-        - ISO 8601: "2024-12-01T00:00:00Z"
+        - ISO 8601: "2024-12-01", "2024-12-01T00:00:00Z"
+        - DD/MM/YYYY: "31/12/2024"
         - Timestamp Unix (retorna como está se já for número)
 
     Returns:
@@ -79,6 +293,9 @@ def fuzzy_time_to_unix(text: Union[str, int]) -> int:
 
         >>> fuzzy_time_to_unix("próxima segunda")
         1701993600000
+
+        >>> fuzzy_time_to_unix("01/12/2023")
+        1701388800000
     """
     # Se já é um timestamp (número ou string numérica)
     try:
@@ -91,75 +308,95 @@ def fuzzy_time_to_unix(text: Union[str, int]) -> int:
     except (ValueError, TypeError):
         pass
 
-    # Traduz termos em português para inglês
     text_str = str(text).lower().strip()
+    now = datetime.now()
 
-    # Mapeamento de traduções PT -> EN
-    translations = {
-        # Dias da semana
-        'segunda': 'monday',
-        'segunda-feira': 'monday',
-        'segunda feira': 'monday',
-        'terça': 'tuesday',
-        'terça-feira': 'tuesday',
-        'terça feira': 'tuesday',
-        'quarta': 'wednesday',
-        'quarta-feira': 'wednesday',
-        'quarta feira': 'wednesday',
-        'quinta': 'thursday',
-        'quinta-feira': 'thursday',
-        'quinta feira': 'thursday',
-        'sexta': 'friday',
-        'sexta-feira': 'friday',
-        'sexta feira': 'friday',
-        'sábado': 'saturday',
-        'sabado': 'saturday',
-        'domingo': 'sunday',
-
-        # Temporais
-        'próxima': 'next',
-        'proxima': 'next',
-        'próximo': 'next',
-        'proximo': 'next',
-        'que vem': 'next',
-        'amanhã': 'tomorrow',
-        'amanha': 'tomorrow',
-        'hoje': 'today',
-        'ontem': 'yesterday',
-    }
+    # Memo: absolutas/deslocamentos por texto, relativas ao dia por (texto, dia)
+    cached = _UNIX_CACHE.get(text_str) or _UNIX_CACHE.get((text_str, now.date()))
+    _UNIX_CACHE.count(hit=cached is not None)
+
+    if cached is not None:
+        kind, value = cached
+        if kind == _NOW_RELATIVE:
+            return int((now + value).timestamp() * 1000)
+        return value
+
+    dt, kind = _parse_datetime(text_str, now)
+
+    if dt is None:
+        raise ValueError(
+            f"Não foi possível converter '{text}' para data. "
+            f"Formatos suportados: 'amanhã', 'próxima segunda', 'tomorrow', 'next monday', '2024-12-01', etc."
+        )
+
+    # Converte para Unix timestamp em milissegundos
+    timestamp_ms = int(dt.timestamp() * 1000)
+
+    if kind == _UNCACHED:
+        pass
+    elif kind == _ABSOLUTE:
+        _UNIX_CACHE.put(text_str, (kind, timestamp_ms))
+    elif kind == _NOW_RELATIVE:
+        _UNIX_CACHE.put(text_str, (kind, dt - now))
+    else:
+        _UNIX_CACHE.put((text_str, now.date()), (kind, timestamp_ms))
+
+    return timestamp_ms
 
-    # Aplica traduções
-    for pt, en in translations.items():
-        text_str = text_str.replace(pt, en)
 
-    # Detecta padrões "next [weekday]" e usa função customizada
-    next_weekday_pattern = r'\bnext\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b'
-    match = re.search(next_weekday_pattern, text_str)
+def _parse_datetime(text_str: str, now: datetime) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    Faz o parsing de uma data (texto em minúsculas) relativa a `now`.
+
+    Returns:
+        (datetime, tipo do resultado) ou (None, None) se não reconhecida.
+        O tipo diz por quanto tempo o resultado pode ficar no memo.
+    """
+    # Formatos fixos (ISO, DD/MM/YYYY)
+    dt = _parse_fixed_format(text_str)
+    if dt is not None:
+        return dt, _ABSOLUTE
+
+    # Traduz termos em português para inglês (uma passada)
+    text_str = _translate_pt(text_str)
+
+    # hoje / amanhã / ontem (mesmo horário de agora, como o dateparser)
+    days = _RELATIVE_DAYS.get(text_str)
+    if days is not None:
+        return now + timedelta(days=days), _NOW_RELATIVE
+
+    # Detecta padrões "next [weekday]" / "[weekday] next" e usa função customizada
+    match = _NEXT_WEEKDAY_RE.search(text_str)
     if match:
-        weekday = match.group(1)
-        dt = _get_next_weekday(weekday)
+        weekday = match.group(1) or match.group(2)
+        dt = _get_next_weekday(weekday, now)
         if dt:
-            return int(dt.timestamp() * 1000)
+            return dt, _DAY_RELATIVE
+
+    # Parse com dateparser (import preguiçoso)
+    import dateparser
 
-    # Parse com dateparser
     dt = dateparser.parse(
         text_str,
         languages=['en'],  # Usa apenas inglês após tradução
         settings={
             'PREFER_DATES_FROM': 'future',
             'RETURN_AS_TIMEZONE_AWARE': False,
-            'RELATIVE_BASE': datetime.now()
+            'RELATIVE_BASE': now
         }
     )
 
     if dt is None:
-        raise ValueError(
-            f"Não foi possível converter '{text}' para data. "
-            f"Formatos suportados: 'amanhã', 'próxima segunda', 'tomorrow', 'next monday', '2024-12-01', etc."
-        )
+        return None, None
 
-    # Converte para Unix timestamp em milissegundos
-    return int(dt.timestamp() * 1000)
+    # Deslocamentos ("in 2 hours", "next week") herdam segundos e
+    # microssegundos da base; o resto ("december 1st", "monday") vem à
+    # meia-noite e depende no máximo do dia
+    if (dt.second, dt.microsecond) == (now.second, now.microsecond):
+        if _CALENDAR_OFFSET_RE.search(text_str):
+            return dt, _UNCACHED
+        return dt, _NOW_RELATIVE
+    return dt, _DAY_RELATIVE
 
 
 def fuzzy_time_to_seconds(text: Union[str, int]) -> int:
@@ -193,49 +430,13 @@ def fuzzy_time_to_seconds(text: Union[str, int]) -> int:
     except (ValueError, TypeError):
         pass
 
-    # Mapeamento de escalas de tempo
-    SCALES = {
-        # Inglês
-        "second": 1,
-        "seconds": 1,
-        "sec": 1,
-        "secs": 1,
-        "minute": 60,
-        "minutes": 60,
-        "min": 60,
-        "mins": 60,
-        "hour": 3600,
-        "hours": 3600,
-        "hr": 3600,
-        "hrs": 3600,
-        "day": 86400,
-        "days": 86400,
-        "week": 604800,
-        "weeks": 604800,
-        "month": 2592000,  # 30 dias
-        "months": 2592000,
-        "year": 31536000,  # 365 dias
-        "years": 31536000,
-
-        # Português
-        "segundo": 1,
-        "segundos": 1,
-        "seg": 1,
-        "minuto": 60,
-        "minutos": 60,
-        "hora": 3600,
-        "horas": 3600,
-        "dia": 86400,
-        "dias": 86400,
-        "semana": 604800,
-        "semanas": 604800,
-        "mês": 2592000,
-        "meses": 2592000,
-        "ano": 31536000,
-        "anos": 31536000,
-    }
-
     text_lower = str(text).lower().strip()
+
+    cached = _SECONDS_CACHE.get(text_lower)
+    _SECONDS_CACHE.count(hit=cached is not None)
+    if cached is not None:
+        return cached
+
     total_seconds = 0
 
     # Divide em palavras e processa
@@ -249,8 +450,8 @@ def fuzzy_time_to_seconds(text: Union[str, int]) -> int:
                 value = float(words[i])
                 unit = words[i + 1]
 
-                if unit in SCALES:
-                    total_seconds += value * SCALES[unit]
+                if unit in DURATION_SCALES:
+                    total_seconds += value * DURATION_SCALES[unit]
                     i += 2
                     continue
             except ValueError:
@@ -259,6 +460,7 @@ def fuzzy_time_to_seconds(text: Union[str, int]) -> int:
         i += 1
 
     if total_seconds > 0:
+        _SECONDS_CACHE.put(text_lower, int(total_seconds))
         return int(total_seconds)
 
     raise ValueError(
@@ -299,3 +501,132 @@ def parse_date(text: Union[str, int, datetime], to_milliseconds: bool = True) ->
 
     # Converte timestamp ms para datetime
     return datetime.fromtimestamp(timestamp_ms / 1000)
+
+
+def fuzzy_times_to_unix(texts: Iterable[Union[str, int, datetime]]) -> array:
+    """
+    Versão em lote de fuzzy_time_to_unix, para planilhas e importações.
+
+    As entradas são deduplicadas; os formatos uniformes (timestamp, ISO,
+    DD/MM/YYYY) são reconhecidos numa única passada de regex e convertidos
+    sem passar pelo parsing individual. Só o texto livre ("amanhã",
+    "próxima sexta") cai no fuzzy_time_to_unix, um por valor distinto.
+
+    Args:
+        texts: Datas em qualquer formato aceito por fuzzy_time_to_unix
+            (datetime também é aceito, como em parse_date)
+
+    Returns:
+        array('q') (int64) com os timestamps em ms, na ordem da entrada
+
+    Raises:
+        ValueError: Na primeira data que não puder ser convertida
+
+    Exemplos:
+        >>> fuzzy_times_to_unix(["2024-12-01", "01/12/2024", 1733011200, "amanhã"])
+        array('q', [1733011200000, 1733011200000, 1733011200000, 1701475200000])
+    """
+    # Deduplica: cada valor distinto vira um slot; positions aponta para ele
+    slots: Dict[Hashable, int] = {}
+    uniques: List[Any] = []
+    positions = array('q')
+
+    for text in texts:
+        key = text.lower().strip() if isinstance(text, str) else text
+        slot = slots.get(key)
+        if slot is None:
+            slot = slots[key] = len(uniques)
+            uniques.append(key)
+        positions.append(slot)
+
+    values = array('q', bytes(8 * len(uniques)))
+
+    # Passada única sobre os textos distintos
+    matches = map(_UNIFORM_RE.fullmatch, [
+        key if isinstance(key, str) else str(key) if type(key) is int else ""
+        for key in uniques
+    ])
+
+    for slot, (key, match) in enumerate(zip(uniques, matches)):
+        if match is None:
+            if isinstance(key, datetime):
+                values[slot] = int(key.timestamp() * 1000)
+            else:
+                values[slot] = fuzzy_time_to_unix(key)
+            continue
+
+        epoch, year, month, day, hour, minute, second, dmy_day, dmy_month, dmy_year = match.groups()
+
+        if epoch is not None:
+            timestamp = int(epoch)
+            values[slot] = timestamp if timestamp > 10000000000 else timestamp * 1000
+            continue
+
+        try:
+            if year is not None:
+                dt = datetime(int(year), int(month), int(day),
+                              int(hour or 0), int(minute or 0), int(second or 0))
+            else:
+                dt = datetime(int(dmy_year), int(dmy_month), int(dmy_day))
+        except ValueError:
+            # Data impossível no formato fixo (ex: "12/31/2024"): mesmo
+            # caminho do fuzzy_time_to_unix, que tenta o dateparser
+            dt = None
+
+        values[slot] = int(dt.timestamp() * 1000) if dt else fuzzy_time_to_unix(key)
+
+    return array('q', [values[slot] for slot in positions])
+
+
+def parse_dates(
+    texts: Iterable[Union[str, int, datetime]],
+    to_milliseconds: bool = True
+) -> Union[array, List[datetime]]:
+    """
+    Versão em lote de parse_date (ver fuzzy_times_to_unix).
+
+    Args:
+        texts: Datas em qualquer formato suportado (inclusive datetime)
+        to_milliseconds: Se True, retorna timestamps em ms. Se False, datetimes
+
+    Returns:
+        array('q') com os timestamps em ms, ou lista de datetime
+
+    Exemplos:
+        >>> parse_dates(["2024-12-01", "31/12/2024"])
+        array('q', [1733011200000, 1735603200000])
+
+        >>> parse_dates(["2024-12-01"], to_milliseconds=False)
+        [datetime.datetime(2024, 12, 1, 0, 0)]
+    """
+    timestamps = fuzzy_times_to_unix(texts)
+
+    if to_milliseconds:
+        return timestamps
+
+    return [datetime.fromtimestamp(timestamp_ms / 1000) for timestamp_ms in timestamps]
+
+
+def date_cache_info() -> Dict[str, Dict[str, int]]:
+    """
+    Estatísticas dos memos de parsing (acertos, faltas, tamanho).
+
+    parse_date usa o memo de fuzzy_time_to_unix.
+
+    Returns:
+        {"fuzzy_time_to_unix": {...}, "fuzzy_time_to_seconds": {...}}
+
+    Exemplos:
+        >>> date_cache_info()["fuzzy_time_to_unix"]
+        {'hits': 4980, 'misses': 20, 'size': 20, 'maxsize': 2048}
+    """
+    return {
+        "fuzzy_time_to_unix": _UNIX_CACHE.info(),
+        "fuzzy_time_to_seconds": _SECONDS_CACHE.info(),
+    }
+
+
+def clear_date_cache():
+    """Esvazia os memos de parsing e zera os contadores."""
+    _UNIX_CACHE.clear()
+    _SECONDS_CACHE.clear()
@@ -46,6 +46,16 @@ PARAM_NAMES_PT_TO_EN = {
     "incluir_fechadas": "include_closed",
     "incluir_subtasks": "subtasks",
 
+    # Escopo e janelas de data das buscas (get_tasks / query_tasks)
+    "listas": "list_ids",
+    "espaços": "space_ids",
+    "espacos": "space_ids",
+    "pastas": "project_ids",
+    "vence_antes": "due_date_lt",
+    "vence_depois": "due_date_gt",
+    "atualizada_depois": "date_updated_gt",
+    "atualizada_antes": "date_updated_lt",
+
     # Estimativas
     "tempo_estimado": "time_estimate",
     "tempo_gasto": "time_spent",
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentação de latência e vazão por endpoint do KaloiClickUpClient.
+
+Listeners registrados com client.add_listener() recebem um RequestEvent
+a cada requisição (método, template do endpoint, status, latência,
+retries e bytes). Sem listeners registrados o custo é praticamente zero:
+nenhum evento é criado.
+
+O LatencyAggregator é um listener pronto que acumula os eventos em
+memória e gera um relatório p50/p95/p99 por endpoint no fim da execução.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+# Segmentos fixos que aparecem em posição de ID (ex: time_entries/start)
+LITERAL_SEGMENTS = {"start", "stop", "current"}
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Converte um endpoint concreto no template correspondente.
+
+    Os endpoints da API v2 alternam recurso/ID, então os segmentos em
+    posição ímpar são parâmetros.
+
+    Args:
+        endpoint: Endpoint da requisição (ex: "task/abc123/tag/urgente")
+
+    Returns:
+        Template do endpoint (ex: "task/{id}/tag/{name}")
+
+    Exemplos:
+        >>> endpoint_template("list/901/task")
+        "list/{id}/task"
+
+        >>> endpoint_template("team/1/time_entries/current")
+        "team/{id}/time_entries/current"
+    """
+    segments = endpoint.strip("/").split("/")
+
+    for i in range(1, len(segments), 2):
+        if segments[i] in LITERAL_SEGMENTS:
+            continue
+        segments[i] = "{name}" if segments[i - 1] == "tag" else "{id}"
+
+    return "/".join(segments)
+
+
+@dataclass
+class RequestEvent:
+    """Dados de uma requisição finalizada (sucesso ou erro)."""
+
+    method: str
+    endpoint: str
+    status: Optional[int]
+    latency: float
+    retries: int
+    bytes: int
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por nearest-rank de uma lista já ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LatencyAggregator:
+    """
+    Listener que agrega latência e vazão por endpoint em memória.
+
+    Exemplo de uso:
+        stats = LatencyAggregator()
+        client.add_listener(stats)
+
+        run_automation(client)
+
+        stats.report()  # tabela p50/p95/p99 por endpoint
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, List[float]] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def __call__(self, event: RequestEvent):
+        key = f"{event.method} {event.endpoint}"
+        now = time.monotonic()
+
+        with self._lock:
+            if self._started is None:
+                self._started = now - event.latency
+            self._finished = now
+
+            self._latencies.setdefault(key, []).append(event.latency)
+            counters = self._counters.setdefault(
+                key, {"calls": 0, "errors": 0, "retries": 0, "bytes": 0}
+            )
+            counters["calls"] += 1
+            counters["errors"] += 0 if event.ok else 1
+            counters["retries"] += event.retries
+            counters["bytes"] += event.bytes
+
+    def reset(self):
+        """Descarta todos os eventos acumulados."""
+        with self._lock:
+            self._latencies.clear()
+            self._counters.clear()
+            self._started = None
+            self._finished = None
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Estatísticas por endpoint.
+
+        Returns:
+            {"GET list/{id}/task": {"calls", "errors", "retries", "bytes",
+             "total_s", "p50_ms", "p95_ms", "p99_ms", "max_ms"}, ...}
+        """
+        with self._lock:
+            items = [
+                (key, sorted(latencies), dict(self._counters[key]))
+                for key, latencies in self._latencies.items()
+            ]
+
+        result = {}
+        for key, latencies, counters in items:
+            result[key] = {
+                **counters,
+                "total_s": sum(latencies),
+                "p50_ms": _percentile(latencies, 50) * 1000,
+                "p95_ms": _percentile(latencies, 95) * 1000,
+                "p99_ms": _percentile(latencies, 99) * 1000,
+                "max_ms": latencies[-1] * 1000,
+            }
+
+        return result
+
+    @property
+    def elapsed(self) -> float:
+        """Segundos entre o início da primeira e o fim da última requisição."""
+        if self._started is None:
+            return 0.0
+        return self._finished - self._started
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Imprime a tabela de latência por endpoint (ordenada por tempo total).
+
+        Returns:
+            O mesmo dict de summary()
+        """
+        from rich import print
+        from rich.console import Console
+        from rich.table import Table
+
+        summary = self.summary()
+
+        table = Table(title="Latência por endpoint")
+        for column in ("Endpoint", "Calls", "Erros", "Retries", "p50 ms",
+                       "p95 ms", "p99 ms", "Total s", "KB"):
+            is_endpoint = column == "Endpoint"
+            table.add_column(column, justify="left" if is_endpoint else "right", no_wrap=is_endpoint)
+
+        ordered = sorted(summary.items(), key=lambda kv: kv[1]["total_s"], reverse=True)
+        for key, stats in ordered:
+            table.add_row(
+                key,
+                str(stats["calls"]),
+                str(stats["errors"]),
+                str(stats["retries"]),
+                f"{stats['p50_ms']:.0f}",
+                f"{stats['p95_ms']:.0f}",
+                f"{stats['p99_ms']:.0f}",
+                f"{stats['total_s']:.2f}",
+                f"{stats['bytes'] / 1024:.1f}",
+            )
+
+        Console().print(table)
+
+        calls = sum(stats["calls"] for stats in summary.values())
+        if self.elapsed > 0:
+            print(f"[bold]{calls} requisições em {self.elapsed:.1f}s "
+                  f"({calls / self.elapsed:.1f} req/s)[/bold]")
+
+        return summary
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+Representação compacta de tasks do ClickUp.
+
+Uma task da API é um dict aninhado grande (descrição, checklists,
+custom_fields, assignees...). Em syncs de dezenas de milhares de tasks
+isso ocupa muita memória. O Task guarda em __slots__ apenas os campos
+"quentes" já decodificados (id, name, status, due_date, priority, tags),
+sem repeti-los no payload, e mantém o restante serializado em JSON
+compacto (bytes). Cada
+sub-estrutura pesada (custom_fields, description...) tem o próprio blob,
+então acessar uma delas decodifica só ela, nunca a task inteira.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Prefixo para projetar custom fields individuais: "custom_fields.<uuid>"
+CUSTOM_FIELD_PREFIX = "custom_fields."
+
+# Sub-estruturas pesadas, serializadas cada uma no seu blob
+HEAVY_KEYS = (
+    "description",
+    "text_content",
+    "custom_fields",
+    "checklists",
+    "assignees",
+    "watchers",
+    "attachments",
+)
+
+# Campos quentes guardados só nos slots (fora do payload serializado)
+HOT_KEYS = ("id", "name", "status", "due_date", "date_updated", "priority", "tags")
+_HOT_BITS = {key: 1 << index for index, key in enumerate(HOT_KEYS)}
+_ALL_HOT = (1 << len(HOT_KEYS)) - 1
+
+
+# Encoder único (json.dumps com opções cria um JSONEncoder por chamada)
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode(value: Any) -> bytes:
+    """Serializa em JSON compacto (UTF-8)."""
+    return _ENCODER.encode(value).encode("utf-8")
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """Converte timestamps/IDs em string da API para int (None se vazio)."""
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _same_timestamp(raw: Any, value: Optional[int]) -> bool:
+    """True se o timestamp bruto da API pode ser remontado a partir do int."""
+    if value is None:
+        return raw is None
+    return isinstance(raw, str) and raw == str(value)
+
+
+def make_projection(fields: Iterable[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Cria uma função que reduz cada task às chaves pedidas.
+
+    "id" é sempre mantido. Custom fields individuais são selecionados com
+    "custom_fields.<uuid>"; "custom_fields" sozinho mantém todos.
+
+    Args:
+        fields: Chaves de primeiro nível e/ou "custom_fields.<uuid>"
+
+    Returns:
+        Função task (dict) -> task projetada (dict)
+
+    Exemplos:
+        >>> project = make_projection(["name", "status", "custom_fields.abc"])
+        >>> project(task)
+        {"id": "86a1", "name": "...", "status": {...}, "custom_fields": [{"id": "abc", ...}]}
+    """
+    keys = {"id"}
+    field_ids = set()
+
+    for field in fields:
+        if field.startswith(CUSTOM_FIELD_PREFIX):
+            field_ids.add(field[len(CUSTOM_FIELD_PREFIX):])
+        else:
+            keys.add(field)
+
+    keep_all_custom_fields = "custom_fields" in keys
+
+    def project(task: Dict[str, Any]) -> Dict[str, Any]:
+        projected = {key: task[key] for key in keys if key in task}
+
+        if field_ids and not keep_all_custom_fields:
+            projected["custom_fields"] = [
+                field for field in task.get("custom_fields") or ()
+                if field.get("id") in field_ids
+            ]
+
+        return projected
+
+    return project
+
+
+class Task(Mapping):
+    """
+    Task compacta com campos quentes eager e payload pesado lazy.
+
+    Campos decodificados na criação:
+        id, name, status (str), status_type, due_date (ms, int),
+        date_updated (ms, int), priority (1-4, int), tag_names (tuple)
+
+    Sub-estruturas decodificadas sob demanda (a cada acesso, só o blob
+    da própria chave):
+        description, custom_fields, checklists, assignees, to_dict()
+
+    É um Mapping de leitura (task["id"], task.get("tags"), "name" in task,
+    dict(task)), então pode substituir os dicts nos scripts de automação.
+    As chaves quentes (HOT_KEYS) saem dos slots e não são repetidas no
+    payload serializado; status, priority e tags devolvem os objetos
+    originais da API (com color, orderindex, tag_fg/tag_bg...).
+
+    Exemplo de uso:
+        tasks = client.get_tasks("list_id", paginate=True, compact=True)
+
+        for task in tasks:
+            if "urgente" in task.tag_names and task.priority != 1:
+                ...
+            valor = task.get_custom_field_value("field-uuid")
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "status",
+        "status_type",
+        "due_date",
+        "date_updated",
+        "priority",
+        "tag_names",
+        "_status_raw",
+        "_priority_raw",
+        "_tags_raw",
+        "_present",
+        "_payload",
+        "_heavy",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        status_type: Optional[str] = None,
+        due_date: Optional[int] = None,
+        date_updated: Optional[int] = None,
+        priority: Optional[int] = None,
+        tag_names: Tuple[str, ...] = (),
+        status_raw: Any = None,
+        priority_raw: Any = None,
+        tags_raw: Any = None,
+        payload: bytes = b"{}",
+        heavy: Tuple[Optional[bytes], ...] = (),
+        present: int = 0
+    ):
+        self.id = id
+        self.name = name
+        self.status = status
+        self.status_type = status_type
+        self.due_date = due_date
+        self.date_updated = date_updated
+        self.priority = priority
+        self.tag_names = tag_names
+        self._status_raw = status_raw
+        self._priority_raw = priority_raw
+        self._tags_raw = tags_raw
+        self._present = present  # bits de HOT_KEYS servidos pelos slots (fora do payload)
+        self._payload = payload
+        self._heavy = heavy or (None,) * len(HEAVY_KEYS)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Task":
+        """
+        Cria um Task a partir do dict retornado pela API.
+
+        Args:
+            data: Task no formato da API
+
+        Returns:
+            Task compacto
+        """
+        status = data.get("status")
+        priority = data.get("priority")
+        due_date = _to_int(data.get("due_date"))
+        date_updated = _to_int(data.get("date_updated"))
+
+        present = 0
+        for key, bit in _HOT_BITS.items():
+            if key not in data:
+                continue
+            if key == "due_date" and not _same_timestamp(data[key], due_date):
+                continue  # formato inesperado: fica no payload, como veio
+            if key == "date_updated" and not _same_timestamp(data[key], date_updated):
+                continue
+            present |= bit
+
+        light = {
+            key: value for key, value in data.items()
+            if key not in HEAVY_KEYS and not present & _HOT_BITS.get(key, 0)
+        }
+        heavy = tuple(_encode(data[key]) if key in data else None for key in HEAVY_KEYS)
+
+        return cls(
+            id=data.get("id"),
+            name=data.get("name"),
+            status=status.get("status") if isinstance(status, dict) else status,
+            status_type=status.get("type") if isinstance(status, dict) else None,
+            due_date=due_date,
+            date_updated=date_updated,
+            priority=_to_int(priority.get("id") if isinstance(priority, dict) else priority),
+            tag_names=tuple(tag.get("name") for tag in data.get("tags") or ()),
+            status_raw=status,
+            priority_raw=priority,
+            tags_raw=data.get("tags"),
+            payload=_encode(light),
+            heavy=heavy,
+            present=present,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decodifica e retorna o dict completo da task (como veio da API)."""
+        data = {key: self._hot_value(key) for key in self._hot_keys()}
+        data.update(json.loads(self._payload))
+
+        for key, blob in zip(HEAVY_KEYS, self._heavy):
+            if blob is not None:
+                data[key] = json.loads(blob)
+
+        return data
+
+    def _hot_keys(self) -> List[str]:
+        """Chaves quentes servidas pelos slots."""
+        return [key for key, bit in _HOT_BITS.items() if self._present & bit]
+
+    def _heavy_value(self, key: str) -> Any:
+        """Decodifica só o blob de uma sub-estrutura pesada (KeyError se ausente)."""
+        blob = self._heavy[HEAVY_KEYS.index(key)]
+        if blob is None:
+            raise KeyError(key)
+        return json.loads(blob)
+
+    def _hot_value(self, key: str) -> Any:
+        """Valor de uma chave quente, no formato original da API."""
+        if key == "status":
+            return self._status_raw
+        if key == "priority":
+            return self._priority_raw
+        if key == "tags":
+            return self._tags_raw
+        value = getattr(self, key)
+        if key in ("due_date", "date_updated") and value is not None:
+            return str(value)  # ms em string, como na API
+        return value
+
+    # ================== CAMPOS LAZY ==================
+
+    @property
+    def description(self) -> Optional[str]:
+        return self.get("description")
+
+    @property
+    def custom_fields(self) -> List[Dict[str, Any]]:
+        return self.get("custom_fields") or []
+
+    @property
+    def checklists(self) -> List[Dict[str, Any]]:
+        return self.get("checklists") or []
+
+    @property
+    def assignees(self) -> List[Dict[str, Any]]:
+        return self.get("assignees") or []
+
+    def get_custom_field(self, field_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca um custom field da task pelo ID.
+
+        Args:
+            field_id: UUID do custom field
+
+        Returns:
+            dict do custom field ou None
+        """
+        for field in self.custom_fields:
+            if field.get("id") == field_id:
+                return field
+        return None
+
+    def get_custom_field_value(self, field_id: str, default: Any = None) -> Any:
+        """
+        Retorna o valor de um custom field (ou `default` se ausente/vazio).
+
+        Args:
+            field_id: UUID do custom field
+            default: Valor retornado se o campo não existir ou estiver vazio
+        """
+        field = self.get_custom_field(field_id)
+        if field is None or field.get("value") is None:
+            return default
+        return field["value"]
+
+    # ================== COMPATIBILIDADE COM DICT ==================
+
+    def __getitem__(self, key: str) -> Any:
+        bit = _HOT_BITS.get(key)
+        if bit is not None and self._present & bit:
+            return self._hot_value(key)
+        if key in HEAVY_KEYS:
+            return self._heavy_value(key)
+        return json.loads(self._payload)[key]
+
+    def __contains__(self, key: Any) -> bool:
+        bit = _HOT_BITS.get(key)
+        if bit is not None and self._present & bit:
+            return True
+        if key in HEAVY_KEYS:
+            return self._heavy[HEAVY_KEYS.index(key)] is not None
+        return key in json.loads(self._payload)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._hot_keys()
+        yield from json.loads(self._payload)
+        for key, blob in zip(HEAVY_KEYS, self._heavy):
+            if blob is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return (len(self._hot_keys()) + len(json.loads(self._payload))
+                + sum(blob is not None for blob in self._heavy))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Task):
+            return (self._present == other._present and self._payload == other._payload
+                    and self._heavy == other._heavy
+                    and all(self._hot_value(key) == other._hot_value(key)
+                            for key in self._hot_keys()))
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"Task(id={self.id!r}, name={self.name!r}, status={self.status!r})"
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Destinos de output (sinks) para as mensagens do KaloiClickUpClient.
+
+Os métodos do cliente emitem mensagens com markup do Rich
+("[green]✓ Task criada![/green]"). O sink decide o que fazer com elas:
+
+- RichOutput: imprime formatado no terminal (padrão, uso interativo)
+- LoggingOutput: envia ao `logging` padrão, sem markup, com nível inferido
+- NullOutput: descarta (loops em massa, CI)
+
+O sink padrão pode ser escolhido pela variável KALOI_OUTPUT
+(rich | logging | null).
+"""
+
+import logging
+import re
+from typing import Optional, Union
+
+
+# Tags de markup do Rich: [green], [/green], [bold red], [/]
+_MARKUP_RE = re.compile(r"\[/?[a-zA-Z0-9 #,_.=-]*\]")
+
+
+class RichOutput:
+    """Imprime as mensagens no terminal com formatação do Rich."""
+
+    def __init__(self):
+        self._print = None
+
+    def write(self, message: str):
+        if self._print is None:
+            from rich import print as rich_print
+            self._print = rich_print
+        self._print(message)
+
+
+class LoggingOutput:
+    """
+    Envia as mensagens ao módulo `logging`, sem markup.
+
+    O nível é inferido pela cor da mensagem: vermelho → ERROR,
+    amarelo → WARNING, demais → INFO.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            logger: Logger a usar (padrão: "kaloi.clickup")
+        """
+        self.logger = logger or logging.getLogger("kaloi.clickup")
+
+    def write(self, message: str):
+        if message.startswith("[red]"):
+            level = logging.ERROR
+        elif message.startswith("[yellow]"):
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, _MARKUP_RE.sub("", message))
+
+
+class NullOutput:
+    """Descarta todas as mensagens (sem custo de renderização)."""
+
+    def write(self, message: str):
+        pass
+
+
+OUTPUTS = {
+    "rich": RichOutput,
+    "logging": LoggingOutput,
+    "null": NullOutput,
+}
+
+
+def get_output(output: Union[str, object, None] = None):
+    """
+    Resolve o sink de output.
+
+    Args:
+        output: Nome ("rich", "logging", "null"), instância de sink
+            (qualquer objeto com write(message)) ou None para o padrão
+
+    Returns:
+        Instância do sink
+
+    Exemplos:
+        >>> get_output("null")
+        <NullOutput>
+
+        >>> get_output(LoggingOutput(logging.getLogger("automacao")))
+        <LoggingOutput>
+    """
+    if output is None:
+        output = "rich"
+
+    if isinstance(output, str):
+        try:
+            return OUTPUTS[output.lower()]()
+        except KeyError:
+            raise ValueError(
+                f"Output desconhecido: '{output}'. Opções: {', '.join(OUTPUTS)}"
+            )
+
+    return output
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Rate limiter client-side para a API do ClickUp.
+
+Token bucket thread-safe que se ajusta pelos headers que o ClickUp envia
+em toda resposta:
+
+- X-RateLimit-Limit: requisições permitidas por janela (ex: 100/min)
+- X-RateLimit-Remaining: requisições restantes na janela atual
+- X-RateLimit-Reset: Unix timestamp (segundos) do fim da janela
+
+Com isso o cliente desacelera ANTES de estourar o limite, mantendo vazão
+máxima estável em execuções grandes em vez de tempestades de 429.
+"""
+
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+
+# Limite padrão dos planos Free/Unlimited/Business do ClickUp
+DEFAULT_REQUESTS_PER_MINUTE = 100
+
+# Espera usada quando um 429 chega sem headers de reset (ou com reset já passado)
+DEFAULT_PENALTY_SECONDS = 60.0
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """Converte valor de header para float (None se ausente/inválido)."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _seconds_until_reset(reset: Optional[float]) -> Optional[float]:
+    """
+    Converte o header X-RateLimit-Reset em segundos a partir de agora.
+
+    Aceita epoch em segundos (formato do ClickUp), epoch em milissegundos
+    ou um delta relativo em segundos.
+    """
+    if reset is None:
+        return None
+
+    if reset > 1e12:  # Epoch em milissegundos
+        reset = reset / 1000
+
+    if reset > 1e9:  # Epoch em segundos
+        return max(reset - time.time(), 0.0)
+
+    return max(reset, 0.0)  # Delta relativo
+
+
+class RateLimiter:
+    """
+    Token bucket compartilhado entre todas as threads de um cliente.
+
+    - Refill contínuo de `requests_per_minute / 60` tokens por segundo
+    - Cada requisição consome 1 token (acquire bloqueia se vazio)
+    - Os headers X-RateLimit-* sincronizam o bucket com a visão do servidor
+    - Um 429 bloqueia novas requisições até o reset da janela
+
+    Exemplo de uso:
+        limiter = RateLimiter(requests_per_minute=100)
+        client = KaloiClickUpClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: Optional[int] = None
+    ):
+        """
+        Args:
+            requests_per_minute: Vazão sustentada permitida
+            burst: Tamanho máximo do bucket (padrão: requests_per_minute)
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute deve ser > 0")
+
+        self.capacity = float(burst or requests_per_minute)
+        self.rate = requests_per_minute / 60.0
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Visão do servidor sobre a janela atual
+        self._server_remaining: Optional[float] = None
+        self._window_reset: float = 0.0
+
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float):
+        """Repõe tokens proporcionalmente ao tempo decorrido."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+        # Janela do servidor expirou: volta a confiar só no bucket
+        if self._server_remaining is not None and now >= self._window_reset:
+            self._server_remaining = None
+
+    def acquire(self):
+        """
+        Reserva uma requisição, bloqueando até que seja permitida.
+
+        Thread-safe: pode ser chamado por várias threads ao mesmo tempo.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._server_remaining is not None and self._server_remaining < 1:
+                    wait = max(self._window_reset - now, 0.01)
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    if self._server_remaining is not None:
+                        self._server_remaining -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """
+        Sincroniza o bucket com os headers X-RateLimit-* da resposta.
+
+        Args:
+            headers: Headers da resposta HTTP (case-insensitive)
+        """
+        limit = _parse_number(headers.get("X-RateLimit-Limit"))
+        remaining = _parse_number(headers.get("X-RateLimit-Remaining"))
+        reset_in = _seconds_until_reset(_parse_number(headers.get("X-RateLimit-Reset")))
+
+        if limit is None and remaining is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if limit and limit != self.capacity:
+                self.capacity = limit
+                self.rate = limit / 60.0
+                self._tokens = min(self._tokens, self.capacity)
+
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+
+                if reset_in is not None:
+                    # Respostas fora de ordem (threads) nunca aumentam o saldo
+                    if self._server_remaining is None or now >= self._window_reset:
+                        self._server_remaining = remaining
+                    else:
+                        self._server_remaining = min(self._server_remaining, remaining)
+                    self._window_reset = now + reset_in
+
+    def penalize(self, headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        Registra um 429 e bloqueia novas requisições até o reset.
+
+        Args:
+            headers: Headers da resposta 429
+
+        Returns:
+            Segundos de espera até a próxima requisição ser liberada
+        """
+        headers = headers or {}
+        wait = _seconds_until_reset(_parse_number(headers.get("X-RateLimit-Reset")))
+
+        # Reset já passado (relógio dessincronizado, header antigo) não
+        # pode virar reenvio imediato: cai no Retry-After ou no padrão
+        if not wait or wait <= 0:
+            wait = _parse_number(headers.get("Retry-After"))
+
+        if not wait or wait <= 0:
+            wait = DEFAULT_PENALTY_SECONDS
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = 0.0
+            self._updated = now
+            self._blocked_until = max(self._blocked_until, now + wait)
+
+        return wait
+
+
+# Limiters compartilhados por token (todos os clientes do processo que usam
+# o mesmo token dividem a mesma cota do ClickUp)
+_shared_limiters: Dict[Optional[str], RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter(token: Optional[str]) -> RateLimiter:
+    """
+    Retorna o RateLimiter compartilhado do processo para um token.
+
+    Args:
+        token: Token da API do ClickUp
+
+    Returns:
+        RateLimiter único por token
+    """
+    with _shared_lock:
+        limiter = _shared_limiters.get(token)
+        if limiter is None:
+            limiter = _shared_limiters[token] = RateLimiter()
+        return limiter
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Circuit breaker e retry budget para o KaloiClickUpClient.
+
+Quando o ClickUp degrada, o retry com backoff exponencial faz cada chamada
+esperar dezenas de segundos antes de falhar, e uma automação com milhares
+de tasks leva horas para terminar. Duas proteções limitam esse tempo:
+
+- CircuitBreaker: acima de uma taxa de erro (5xx, timeouts, conexão) nas
+  últimas requisições, abre o circuito e falha na hora durante um
+  cool-down. Depois deixa passar uma requisição de teste (half-open): se
+  ela funcionar, o circuito fecha de novo.
+- RetryBudget: limita o total de retries a uma fração das requisições
+  feitas. Com o orçamento esgotado, erros retornam sem novas tentativas
+  (e sem o sleep de backoff). O BudgetedRetry aplica o orçamento ao Retry
+  do urllib3 usado pela session.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker por taxa de erro numa janela das últimas requisições.
+
+    Estados:
+        closed: requisições passam normalmente
+        open: requisições falham na hora até o fim do cool-down
+        half_open: uma requisição de teste por vez decide se fecha ou reabre
+
+    Exemplo de uso:
+        breaker = CircuitBreaker(failure_rate=0.5, window=20, cooldown=30)
+        client = KaloiClickUpClient(circuit_breaker=breaker)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        cooldown: float = 30.0
+    ):
+        """
+        Args:
+            failure_rate: Fração de falhas na janela que abre o circuito (0-1)
+            window: Quantas requisições recentes entram no cálculo
+            min_calls: Mínimo de requisições na janela antes de avaliar
+            cooldown: Segundos com o circuito aberto antes do teste
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate deve estar entre 0 e 1")
+
+        self.failure_rate = failure_rate
+        self.min_calls = min(min_calls, window)
+        self.cooldown = cooldown
+
+        self._outcomes = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._update_state(time.monotonic())
+            return self._state
+
+    def _update_state(self, now: float):
+        if self._state == self.OPEN and now - self._opened_at >= self.cooldown:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+    def _open(self, now: float):
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probe_in_flight = False
+        self.times_opened += 1
+
+    def allow(self) -> bool:
+        """
+        Indica se uma requisição pode ser enviada agora.
+
+        Em half-open, só a primeira chamada recebe True (requisição de teste).
+        """
+        with self._lock:
+            self._update_state(time.monotonic())
+
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def retry_in(self) -> float:
+        """Segundos até o circuito aceitar a próxima requisição de teste."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(self.cooldown - (time.monotonic() - self._opened_at), 0.0)
+
+    def record_success(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                self._probe_in_flight = False
+            self._outcomes.append(True)
+
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+
+            self._outcomes.append(False)
+
+            if self._state == self.CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.failure_rate:
+                    self._open(now)
+
+    def reset(self):
+        """Fecha o circuito e descarta o histórico."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._outcomes.clear()
+            self._probe_in_flight = False
+
+
+class RetryBudget:
+    """
+    Orçamento global de retries: no máximo `ratio` x requisições (+ min_retries).
+
+    Thread-safe; pode ser compartilhado entre clientes.
+
+    Exemplo de uso:
+        budget = RetryBudget(ratio=0.1)  # retries <= 10% das requisições
+        client = KaloiClickUpClient(retry_budget=budget)
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10):
+        """
+        Args:
+            ratio: Fração das requisições que pode virar retry
+            min_retries: Retries sempre permitidos (execuções curtas)
+        """
+        if ratio < 0:
+            raise ValueError("ratio deve ser >= 0")
+
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Conta uma requisição (deposita `ratio` no orçamento)."""
+        with self._lock:
+            self.requests += 1
+
+    def try_acquire(self) -> bool:
+        """Consome um retry do orçamento. False se esgotado."""
+        with self._lock:
+            if self.retries < self.min_retries + self.ratio * self.requests:
+                self.retries += 1
+                return True
+
+            self.denied += 1
+            return False
+
+
+class BudgetedRetry(Retry):
+    """
+    Retry do urllib3 que só tenta de novo se houver orçamento no RetryBudget.
+
+    Com o orçamento esgotado, levanta MaxRetryError na hora (sem o sleep
+    de backoff), como se as tentativas tivessem acabado.
+    """
+
+    def __init__(self, *args, budget: Optional[RetryBudget] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+
+    def new(self, **kw) -> "BudgetedRetry":
+        retry = super().new(**kw)
+        retry.budget = self.budget
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None) -> "BudgetedRetry":
+        # Levanta MaxRetryError se as tentativas configuradas acabaram
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+
+        if self.budget is not None and not self.budget.try_acquire():
+            status = response.status if response is not None else None
+            reason = error or ResponseError(f"retry budget esgotado (status {status})")
+            raise MaxRetryError(_pool, url, reason) from error
+
+        return retry
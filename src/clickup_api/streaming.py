@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Decodificação incremental (streaming) de páginas JSON grandes.
+
+Páginas de tasks com include_subtasks e descrições longas podem ter vários
+MB. Com response.json() os bytes brutos, o texto decodificado e a árvore de
+objetos ficam em memória ao mesmo tempo. Aqui o corpo é lido em chunks e
+os itens do array (ex: "tasks") são decodificados e entregues um a um;
+as demais chaves de primeiro nível (ex: "last_page") vão para `meta`.
+
+Backends:
+- ijson (parser C yajl2), se instalado: `pip install ijson`
+- json da stdlib (raw_decode incremental) como fallback
+
+O ijson só é importado na primeira decodificação em streaming.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+
+# ijson carregado por _load_ijson (False = não instalado)
+_ijson = None
+
+
+def _load_ijson():
+    """Importa o ijson no primeiro uso. Retorna None se não estiver instalado."""
+    global _ijson
+
+    if _ijson is None:
+        try:
+            import ijson
+            import ijson.common
+        except ImportError:  # pragma: no cover - dependência opcional
+            ijson = False
+        _ijson = ijson
+
+    return _ijson or None
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    data_key: str,
+    meta: Optional[Dict[str, Any]] = None,
+    backend: Optional[str] = None
+) -> Iterator[Any]:
+    """
+    Decodifica um objeto JSON em chunks, entregando os itens de `data_key`.
+
+    Args:
+        chunks: Iterável de bytes (ex: response.iter_content(64 * 1024))
+        data_key: Chave do array de itens (ex: "tasks")
+        meta: Dict preenchido com as demais chaves de primeiro nível
+        backend: "ijson", "json" ou None (ijson se instalado)
+
+    Yields:
+        Cada item do array, já decodificado
+
+    Raises:
+        ValueError: JSON inválido ou incompleto
+
+    Exemplos:
+        >>> meta = {}
+        >>> for task in iter_json_array(response.iter_content(65536), "tasks", meta):
+        ...     process(task)
+        >>> meta.get("last_page")
+        True
+    """
+    if meta is None:
+        meta = {}
+
+    if backend is None:
+        backend = "ijson" if _load_ijson() is not None else "json"
+
+    if backend == "ijson":
+        ijson = _load_ijson()
+        if ijson is None:
+            raise ValueError("Backend 'ijson' indisponível: pip install ijson")
+        return _iter_ijson(ijson, chunks, data_key, meta)
+
+    if backend == "json":
+        return _JsonStreamDecoder(chunks, data_key, meta).items()
+
+    raise ValueError(f"Backend desconhecido: '{backend}'. Opções: ijson, json")
+
+
+class _ChunkReader:
+    """Adapta um iterável de chunks para a interface read() de arquivo."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _iter_ijson(ijson, chunks: Iterable[bytes], data_key: str, meta: Dict[str, Any]) -> Iterator[Any]:
+    """Backend ijson: monta cada valor a partir dos eventos do parser."""
+    item_prefix = f"{data_key}.item"
+    events = ijson.parse(_ChunkReader(chunks), use_float=True)
+
+    builder = None
+    depth = 0
+    key = None
+
+    try:
+        for prefix, event, value in events:
+            if builder is None:
+                if event == "map_key" or event in _END_EVENTS:
+                    continue
+
+                if prefix == item_prefix:
+                    key = None
+                elif prefix == data_key and event == "start_array":
+                    continue
+                elif prefix and "." not in prefix:
+                    key = prefix
+                else:
+                    continue
+
+                builder = ijson.common.ObjectBuilder()
+                depth = 0
+
+            builder.event(event, value)
+
+            if event in _START_EVENTS:
+                depth += 1
+            elif event in _END_EVENTS:
+                depth -= 1
+
+            if depth:
+                continue
+
+            value, builder = builder.value, None
+            if key is None:
+                yield value
+            else:
+                meta[key] = value
+
+    except ijson.JSONError as e:
+        raise ValueError(f"JSON inválido: {e}") from e
+
+
+class _JsonStreamDecoder:
+    """
+    Backend stdlib: json.JSONDecoder.raw_decode sobre um buffer de texto.
+
+    O buffer só guarda o trecho ainda não consumido. Quando um valor não
+    cabe no buffer, lê pelo menos o mesmo tamanho de novo (crescimento
+    geométrico), então itens grandes não são re-decodificados muitas vezes.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], data_key: str, meta: Dict[str, Any]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self.data_key = data_key
+        self.meta = meta
+
+    def _fill(self, min_chars: int = 1) -> bool:
+        """Lê chunks até acrescentar pelo menos min_chars. False se acabou."""
+        if self._eof:
+            return False
+
+        parts = [self._buffer[self._pos:]]
+        added = 0
+
+        while added < min_chars:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._text.decode(b"", final=True))
+                self._eof = True
+                break
+            text = self._text.decode(chunk)
+            parts.append(text)
+            added += len(text)
+
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return added > 0 or len(parts[-1]) > 0
+
+    def _peek(self) -> str:
+        """Pula espaços e retorna o próximo caractere (sem consumir)."""
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("JSON incompleto")
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"JSON inválido: esperado {chars!r}, encontrado {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decodifica o próximo valor, lendo mais chunks se necessário."""
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._fill(max(len(self._buffer) - self._pos, 1)):
+                    raise ValueError(f"JSON inválido: {e}") from e
+                continue
+
+            # Número no fim do buffer pode estar cortado ("12" de "123")
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        self._expect("{")
+
+        if self._peek() == "}":
+            return
+
+        while True:
+            key = self._value()
+            self._expect(":")
+
+            if key == self.data_key and self._peek() == "[":
+                self._pos += 1
+
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self.meta[key] = self._value()
+
+            if self._expect(",}") == "}":
+                return
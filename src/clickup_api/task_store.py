@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Armazenamento local (SQLite) de tasks do ClickUp com sync incremental.
+
+O KaloiClickUpClient.sync_list() busca apenas as tasks alteradas desde o
+último sync (filtro `date_updated_gt` da API) e faz merge aqui. As
+automações leem do store local, então o tráfego na API passa a ser
+proporcional às mudanças e não ao total de tasks.
+
+Limitação: tasks DELETADAS (ou movidas de lista) no ClickUp não aparecem
+no filtro `date_updated_gt`. Por isso o sync_list refaz a lista inteira
+quando o último sync completo tem mais de FULL_SYNC_INTERVAL (24h); use
+sync_list(..., full=True) para forçar.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    list_id TEXT NOT NULL,
+    status_type TEXT,
+    archived INTEGER NOT NULL DEFAULT 0,
+    date_updated INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_list ON tasks (list_id);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    list_id TEXT PRIMARY KEY,
+    watermark INTEGER NOT NULL,
+    synced_at INTEGER NOT NULL,
+    full_synced_at INTEGER
+);
+"""
+
+
+class TaskStore:
+    """
+    Store SQLite thread-safe de tasks, indexado por lista.
+
+    Exemplo de uso:
+        store = TaskStore("tasks.db")
+        client = KaloiClickUpClient(task_store=store)
+
+        client.sync_list("list_id")          # só o que mudou desde o último sync
+        tasks = store.get_tasks("list_id")   # leitura local, sem API
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: Caminho do arquivo SQLite (":memory:" para store volátil)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+
+            # Stores criados antes do sync completo periódico
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sync_state)")}
+            if "full_synced_at" not in columns:
+                self._conn.execute("ALTER TABLE sync_state ADD COLUMN full_synced_at INTEGER")
+
+    @staticmethod
+    def _rows(list_id: str, tasks: Iterable[Dict]) -> List[tuple]:
+        """Converte tasks da API em linhas da tabela tasks."""
+        return [
+            (
+                task["id"],
+                list_id,
+                (task.get("status") or {}).get("type"),
+                int(bool(task.get("archived"))),
+                int(task.get("date_updated") or 0),
+                json.dumps(task, ensure_ascii=False),
+            )
+            for task in tasks
+        ]
+
+    def upsert_tasks(self, list_id: str, tasks: Iterable[Dict]) -> int:
+        """
+        Insere ou atualiza tasks de uma lista.
+
+        Args:
+            list_id: ID da lista
+            tasks: Tasks no formato da API
+
+        Returns:
+            Número de tasks gravadas
+        """
+        rows = self._rows(list_id, tasks)
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tasks "
+                "(id, list_id, status_type, archived, date_updated, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+        return len(rows)
+
+    def replace_tasks(self, list_id: str, tasks: Iterable[Dict]) -> int:
+        """
+        Substitui todas as tasks de uma lista numa única transação.
+
+        Usado pelo sync completo: tasks deletadas ou movidas somem do store,
+        e leitores nunca veem a lista vazia no meio da troca.
+
+        Args:
+            list_id: ID da lista
+            tasks: Tasks atuais da lista, no formato da API
+
+        Returns:
+            Número de tasks gravadas
+        """
+        rows = self._rows(list_id, tasks)
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE list_id = ?", (list_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tasks "
+                "(id, list_id, status_type, archived, date_updated, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+        return len(rows)
+
+    def get_tasks(
+        self,
+        list_id: str,
+        include_closed: bool = False,
+        archived: bool = False
+    ) -> List[Dict]:
+        """
+        Lê as tasks de uma lista do store local.
+
+        Os filtros seguem a semântica da API (include_closed/archived).
+
+        Args:
+            list_id: ID da lista
+            include_closed: Incluir tasks com status do tipo "closed"
+            archived: Retornar tasks arquivadas em vez das ativas
+
+        Returns:
+            Lista de tasks (dicts no formato da API)
+        """
+        query = "SELECT data FROM tasks WHERE list_id = ? AND archived = ?"
+        params = [list_id, int(archived)]
+
+        if not include_closed:
+            query += " AND (status_type IS NULL OR status_type != 'closed')"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [json.loads(data) for (data,) in rows]
+
+    def get_task(self, task_id: str) -> Optional[Dict]:
+        """
+        Lê uma task do store local.
+
+        Args:
+            task_id: ID da task
+
+        Returns:
+            dict da task ou None se não estiver no store
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def delete_task(self, task_id: str):
+        """Remove uma task do store local."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def get_watermark(self, list_id: str) -> Optional[int]:
+        """
+        Retorna o maior date_updated (ms) já sincronizado da lista.
+
+        Args:
+            list_id: ID da lista
+
+        Returns:
+            Timestamp em ms ou None se a lista nunca foi sincronizada
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM sync_state WHERE list_id = ?", (list_id,)
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def get_full_synced_at(self, list_id: str) -> Optional[int]:
+        """
+        Retorna quando a lista foi sincronizada por completo pela última vez.
+
+        Args:
+            list_id: ID da lista
+
+        Returns:
+            Timestamp em ms ou None se nunca houve sync completo
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT full_synced_at FROM sync_state WHERE list_id = ?", (list_id,)
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def set_watermark(self, list_id: str, watermark: int, full: bool = False):
+        """
+        Registra o watermark do último sync da lista.
+
+        Args:
+            list_id: ID da lista
+            watermark: Maior date_updated (ms) sincronizado
+            full: Se o sync foi completo (atualiza full_synced_at)
+        """
+        now = int(time.time() * 1000)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (list_id, watermark, synced_at, full_synced_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(list_id) DO UPDATE SET "
+                "watermark = excluded.watermark, synced_at = excluded.synced_at, "
+                "full_synced_at = COALESCE(excluded.full_synced_at, sync_state.full_synced_at)",
+                (list_id, int(watermark), now, now if full else None)
+            )
+
+    def clear(self, list_id: Optional[str] = None):
+        """
+        Remove tasks e estado de sync (de uma lista ou de todas).
+
+        Args:
+            list_id: ID da lista (None = tudo)
+        """
+        with self._lock, self._conn:
+            if list_id is None:
+                self._conn.execute("DELETE FROM tasks")
+                self._conn.execute("DELETE FROM sync_state")
+            else:
+                self._conn.execute("DELETE FROM tasks WHERE list_id = ?", (list_id,))
+                self._conn.execute("DELETE FROM sync_state WHERE list_id = ?", (list_id,))
+
+    def close(self):
+        """Fecha a conexão com o SQLite."""
+        with self._lock:
+            self._conn.close()
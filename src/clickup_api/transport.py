@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Camada de transporte do KaloiClickUpClient, com gravação e replay.
+
+O _send entrega cada requisição a um transport (send -> requests.Response):
+
+- RequestsTransport: envia pela session (pool de conexões, retry). Padrão.
+- RecordingTransport: envolve outro transport e grava cada par
+  requisição/resposta num cassette (JSONL comprimido com gzip).
+- ReplayTransport: responde a partir de um cassette, sem rede, com
+  latência simulada (a gravada ou uma fixa). Serve para perfilar e
+  comparar automações (ex: automation/daily_alerts.py) de forma repetível
+  numa máquina offline.
+
+O token (header Authorization) nunca é gravado.
+
+Configuração por variáveis de ambiente (lidas pelo cliente):
+    CLICKUP_CASSETTE=cassettes/daily_alerts.jsonl.gz
+    CLICKUP_CASSETTE_MODE=record   # ou replay (padrão: replay se o arquivo existir)
+    CLICKUP_REPLAY_LATENCY=recorded  # ou latência fixa em ms (ex: 0, 80)
+"""
+
+import atexit
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# Headers da response guardados no cassette (rate limiter e decodificação)
+RECORDED_HEADERS = ("content-type", "retry-after")
+RECORDED_HEADER_PREFIX = "x-ratelimit-"
+
+# Filtros de data (due_date_lt, date_updated_gt...) casados só pelo nome no replay
+VOLATILE_PARAM_SUFFIXES = ("_gt", "_lt")
+
+
+class CassetteMiss(LookupError):
+    """Requisição sem resposta correspondente no cassette."""
+
+
+def _request_url(method: str, url: str, params=None) -> str:
+    """URL final da requisição, com a query string de `params`."""
+    if not params:
+        return url
+    return requests.Request(method, url, params=params).prepare().url
+
+
+def request_keys(method: str, url: str) -> Tuple[Tuple, ...]:
+    """
+    Chaves de match de uma requisição: a exata e uma sem os valores dos
+    filtros de data (*_gt/*_lt), que mudam a cada execução quando são
+    relativos (ex: due_date_lt=<agora + 7 dias>).
+
+    O host é ignorado, então um cassette gravado em produção funciona com
+    qualquer CLICKUP_BASE_URL.
+    """
+    parts = urlsplit(url)
+    query = tuple(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    stable = tuple(
+        (name, "*" if name.endswith(VOLATILE_PARAM_SUFFIXES) else value)
+        for name, value in query
+    )
+    return (method, parts.path, query), (method, parts.path, stable)
+
+
+class RequestsTransport:
+    """Transport padrão: envia pela requests.Session do cliente."""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+             **kwargs) -> requests.Response:
+        return self.session.request(method, url, headers=headers, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+class RecordingTransport:
+    """
+    Grava as requisições enviadas por outro transport num cassette.
+
+    Cada linha do cassette é um JSON com método, URL, status, headers
+    relevantes, corpo e a duração da requisição. As linhas são acrescentadas
+    ao arquivo (abrir de novo em modo record continua a gravação).
+
+    Exemplo de uso:
+        transport = RecordingTransport(RequestsTransport(session), "daily.jsonl.gz")
+        client = KaloiClickUpClient(transport=transport)
+    """
+
+    def __init__(self, inner, path: str):
+        """
+        Args:
+            inner: Transport que realmente envia (ex: RequestsTransport)
+            path: Arquivo do cassette (.jsonl.gz)
+        """
+        self.inner = inner
+        self.path = path
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        atexit.register(self.close)
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+             **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        response = self.inner.send(method, url, headers=headers, **kwargs)
+        content = response.content  # lê o corpo (streams continuam funcionando)
+        elapsed = time.perf_counter() - started
+
+        record = {
+            "method": method,
+            "url": response.request.url if response.request else _request_url(
+                method, url, kwargs.get("params")),
+            "status": response.status_code,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() in RECORDED_HEADERS
+                or name.lower().startswith(RECORDED_HEADER_PREFIX)
+            },
+            "elapsed": round(elapsed, 4),
+        }
+        try:
+            record["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body_b64"] = base64.b64encode(content).decode("ascii")
+
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+                self._file.flush()
+                self.recorded += 1
+
+        return response
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.inner.close()
+
+
+class ReplayTransport:
+    """
+    Responde às requisições a partir de um cassette gravado.
+
+    Requisições com a mesma chave recebem as respostas na ordem em que
+    foram gravadas; esgotadas, a última se repete. Sem nenhuma resposta
+    correspondente, levanta CassetteMiss.
+
+    Exemplo de uso:
+        transport = ReplayTransport("daily.jsonl.gz", latency=0.05)
+        client = KaloiClickUpClient(transport=transport)
+    """
+
+    def __init__(self, path: str, latency: Optional[float] = None):
+        """
+        Args:
+            path: Arquivo do cassette (.jsonl.gz)
+            latency: Latência simulada por requisição, em segundos.
+                None = a duração gravada de cada requisição
+        """
+        self.path = path
+        self.latency = latency
+        self.served = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self._records: Dict[Tuple, List[Dict]] = defaultdict(list)
+        self._cursors: Dict[Tuple, int] = defaultdict(int)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                for key in request_keys(record["method"], record["url"]):
+                    self._records[key].append(record)
+
+    def _next_record(self, method: str, url: str) -> Optional[Dict]:
+        with self._lock:
+            for key in request_keys(method, url):
+                records = self._records.get(key)
+                if records:
+                    index = self._cursors[key]
+                    self._cursors[key] = index + 1
+                    self.served += 1
+                    return records[min(index, len(records) - 1)]
+
+            self.misses += 1
+            return None
+
+    def send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+             **kwargs) -> requests.Response:
+        full_url = _request_url(method, url, kwargs.get("params"))
+        record = self._next_record(method, full_url)
+
+        if record is None:
+            raise CassetteMiss(f"{method} {full_url} não está no cassette {self.path}")
+
+        delay = record.get("elapsed", 0.0) if self.latency is None else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+        if "body_b64" in record:
+            content = base64.b64decode(record["body_b64"])
+        else:
+            content = record.get("body", "").encode("utf-8")
+
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.headers = CaseInsensitiveDict(record.get("headers", {}))
+        response._content = content
+        response._content_consumed = True
+        response.url = full_url
+        response.encoding = "utf-8"
+        response.reason = "Replay"
+        response.request = requests.Request(method, full_url).prepare()
+        return response
+
+    def close(self):
+        pass
+
+
+def transport_from_env(session: requests.Session):
+    """
+    Monta o transport a partir de CLICKUP_CASSETTE / _MODE / CLICKUP_REPLAY_LATENCY.
+
+    Sem CLICKUP_CASSETTE, retorna o RequestsTransport da session.
+
+    Returns:
+        RequestsTransport, RecordingTransport ou ReplayTransport
+    """
+    live = RequestsTransport(session)
+    path = os.getenv("CLICKUP_CASSETTE")
+    if not path:
+        return live
+
+    mode = (os.getenv("CLICKUP_CASSETTE_MODE") or ("replay" if os.path.exists(path) else "record")).lower()
+
+    if mode == "record":
+        return RecordingTransport(live, path)
+
+    if mode == "replay":
+        latency = (os.getenv("CLICKUP_REPLAY_LATENCY") or "recorded").strip().lower()
+        return ReplayTransport(path, latency=None if latency == "recorded" else float(latency) / 1000)
+
+    raise ValueError(f"CLICKUP_CASSETTE_MODE inválido: {mode!r} (use record ou replay)")